@@ -0,0 +1,32 @@
+import argparse
+import json
+from benchmarks import bench_simulation  # noqa: F401 (registers the simulation benchmarks)
+from benchmarks.harness import BENCHMARKS, run_benchmarks, write_results, compare_results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the simulation hot path benchmarks.")
+    parser.add_argument('names', nargs='*', help="Benchmarks to run (default: all).")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON file receiving the results.")
+    parser.add_argument('--compare', default=None, help="JSON results of a previous run to compare against.")
+    parser.add_argument('--quick', action='store_true', help="Run fewer iterations, for smoke runs.")
+    parser.add_argument('--list', action='store_true', help="List the registered benchmarks and exit.")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+    else:
+        results = run_benchmarks(args.names or None, quick=args.quick)
+        write_results(results, args.output)
+        speedups = dict()
+        if args.compare:
+            with open(args.compare, 'r') as f:
+                speedups = compare_results(json.load(f), results)
+        for result in results['results']:
+            if 'bytes_per_instance' in result:
+                line = f"{result['name']:<62} {result['bytes_per_instance']:>14.1f} bytes/instance{'':>16}"
+            else:
+                line = (f"{result['name']:<62} {result['per_call_seconds']['median'] * 1e6:>14.2f} us/call "
+                        f"{result['steps_per_second']:>14.1f} steps/s")
+            if result['name'] in speedups:
+                line += f" {speedups[result['name']]:>6.2f}x"
+            print(line)
@@ -0,0 +1,301 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+from datetime import datetime, timedelta
+import numpy as np
+from benchmarks.harness import benchmark, memory_benchmark
+from src.simulation.common import RandomStreams
+from src.simulation.water.water import Water
+from src.simulation.water.physics_cache import PhysicsKernel, antoine_saturation_vapor_pressure
+from src.simulation.water.water_tank import WaterTank
+from src.simulation.water.water_batch import WaterBatch
+from src.simulation.water.water_balance import WaterBalance
+from src.simulation.water.water_property_range import WaterPropertyRange
+from src.simulation.water.water_quality_monitor import WaterQualityMonitor
+from src.simulation.water.water_dissolved_elements_monitor import WaterDissolvedElementsMonitor
+from src.simulation.water.reaction_network import ReactionNetwork
+
+CONFIGURATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   '..', 'src', 'simulation', 'configurations')
+SEED = 0
+
+DISSOLVED_ELEMENTS = {
+    'ammonia': {'min': 0.1, 'max': 1, 'initial': 0.2},
+    'nitrate': {'min': 0.1, 'max': 50, 'initial': 10},
+    'nitrite': {'min': 0.1, 'max': 0.5, 'initial': 0.2},
+    'phosphate': {'min': 0.1, 'max': 2, 'initial': 0.5},
+    'potassium': {'min': 1, 'max': 5, 'initial': 2},
+    'iron': {'min': 0.1, 'max': 0.5, 'initial': 0.2},
+    'magnesium': {'min': 2, 'max': 10, 'initial': 5},
+    'calcium': {'min': 20, 'max': 150, 'initial': 40},
+    'hydrogen_sulfide': {'min': 0.1, 'max': 0.5, 'initial': 0.2},
+    'organic_debris': {'min': 0.1, 'max': 100, 'initial': 5},
+    'oxygen': {'min': 0.1, 'max': 100, 'initial': 50},
+    'carbon_dioxide': {'min': 0.1, 'max': 100, 'initial': 10}
+}
+
+
+def _fish_tank(volume: float = 3000) -> WaterTank:
+    water_tank = WaterTank(tank_length=400, tank_width=150, tank_depth=100, tank_type='fish_tank')
+    water_tank.add_water(volume)
+    return water_tank
+
+
+@benchmark('water.evaporate', number=20000)
+def bench_water_evaporate():
+    water = Water(0, 6000)
+    water.add_water(3000)
+    return lambda: water.evaporate(22.5, 6, 0.6, 1)
+
+
+@benchmark('water.evaporate_trusted', number=20000)
+def bench_water_evaporate_trusted():
+    water = Water(0, 6000)
+    water.add_water(3000)
+    return lambda: water.evaporate(22.5, 6, 0.6, 1, trusted=True)
+
+
+@benchmark('water.evaporate_many', number=20, steps_per_call=8760)
+def bench_water_evaporate_many():
+    rng = RandomStreams(SEED).generator('water.evaporate_many')
+    air_temps = rng.uniform(0, 35, 8760)
+    rel_humidities = rng.uniform(0.3, 0.9, 8760)
+    water = Water(0, 6000)
+    water.add_water(5000)
+    return lambda: water.evaporate_many(air_temps, 6, rel_humidities, 1)
+
+
+@benchmark('water_batch.evaporate', number=200, steps_per_call=10000)
+def bench_water_batch_evaporate():
+    rng = RandomStreams(SEED).generator('water_batch.evaporate')
+    batch = WaterBatch(rng.uniform(5000, 10000, 10000), current_volumes=4000, temperatures=rng.uniform(5, 30, 10000))
+    air_temps = rng.uniform(0, 35, 10000)
+    rel_humidities = rng.uniform(0.3, 0.9, 10000)
+    return lambda: batch.evaporate(air_temps, 6, rel_humidities, 1)
+
+
+@benchmark('water_balance.integrate_dry_month', number=20, steps_per_call=30 * 24)
+def bench_water_balance_integrate_dry_month():
+    rng = RandomStreams(SEED).generator('water_balance.integrate_dry_month')
+    hours = np.arange(30 * 24)
+    air_temps = 20 + 8 * np.sin(hours * 2 * np.pi / 24) + rng.uniform(-1, 1, hours.size)
+    rel_humidities = np.full(hours.size, 0.6)
+    no_precipitation = np.zeros(hours.size)
+
+    def integrate():
+        water = Water(0, 6000)
+        water.add_water(3000)
+        WaterBalance(water, 6, 3600, no_precipitation, no_precipitation, air_temps, rel_humidities).integrate()
+    return integrate
+
+
+@benchmark('water.manage_precipitation', number=20000)
+def bench_water_manage_precipitation():
+    water = Water(0, 6000)
+    water.add_water(3000)
+    return lambda: water.manage_precipitation('snow', 0.001, 2, 'steady')
+
+
+@benchmark('water.melt_snow_thaw', number=2000, steps_per_call=3 * 24 * 3600)
+def bench_water_melt_snow_thaw():
+    water = Water(0, 6000)
+    water.add_water(1000)
+
+    def thaw():
+        # A three-day thaw sampled every second, melting a fresh snowpack in one call
+        water.snow_accumulation = 500
+        water.current_volume = 1000
+        water.melt_snow(2, 3 * 24 * 3600)
+    return thaw
+
+
+@benchmark('water.apply_flows', number=20, steps_per_call=8760)
+def bench_water_apply_flows():
+    rng = RandomStreams(SEED).generator('water.apply_flows')
+    # A year of hourly refills and withdrawals, some of them crossing the capacity or the underflow threshold
+    flows = rng.uniform(-60, 60, 8760)
+    water = Water(0, 6000)
+
+    def apply():
+        water.current_volume = 3000
+        water.apply_flows(flows)
+    return apply
+
+
+@benchmark('water_tank.evaporate_noisy', number=20, steps_per_call=8760)
+def bench_water_tank_evaporate_noisy():
+    rng = RandomStreams(SEED).generator('water_tank.evaporate_noisy')
+    # A year of hourly air temperatures with the uniform noise of the weather simulation
+    air_temps = (20 + rng.uniform(-1, 1, 8760)).tolist()
+
+    def evaporate_year():
+        # 'fish_tank' rather than the sealed 'fish tank' of `_fish_tank`, so that the water surface evaporates
+        water_tank = WaterTank(tank_length=400, tank_width=150, tank_depth=100, tank_type='fish_tank')
+        water_tank.add_water(3000)
+        for air_temp in air_temps:
+            water_tank.evaporate(air_temp, water_tank.water_surface_area, 0.6, 1, trusted=True)
+    return evaporate_year
+
+
+@benchmark('water_tank.status', number=20000)
+def bench_water_tank_status():
+    water_tank = _fish_tank()
+    return lambda: water_tank.status
+
+
+@benchmark('water_dissolved_elements_monitor.evaporate', number=5000)
+def bench_dissolved_elements_evaporate():
+    water_tank = _fish_tank()
+    WaterDissolvedElementsMonitor(water_tank, DISSOLVED_ELEMENTS)
+    return lambda: water_tank.evaporate(22.5, water_tank.water_surface_area, 0.6, 1)
+
+
+@benchmark('water_dissolved_elements_monitor.manage_precipitation', number=5000)
+def bench_dissolved_elements_manage_precipitation():
+    water_tank = _fish_tank()
+    WaterDissolvedElementsMonitor(water_tank, DISSOLVED_ELEMENTS)
+    # Volume-neutral precipitation keeps the concentrations within their ranges however many calls are timed
+    return lambda: water_tank.manage_precipitation('snow', 0, -1, 'steady')
+
+
+@benchmark('water_dissolved_elements_monitor.construct', number=5000)
+def bench_dissolved_elements_construct():
+    water_tank = _fish_tank()
+
+    def construct():
+        # Every monitor of the element set shares the schema compiled by the first one
+        monitor = WaterDissolvedElementsMonitor(water_tank, DISSOLVED_ELEMENTS)
+        water_tank.remove_observer('evaporate', monitor._on_evaporate)
+        water_tank.remove_observer('precipitation', monitor._on_dilution)
+        water_tank.remove_observer('add_water', monitor._on_dilution)
+    return construct
+
+
+@benchmark('reaction_network.advance_monitors', number=200, steps_per_call=1000)
+def bench_reaction_network_advance_monitors():
+    network = ReactionNetwork.nitrification()
+    water_tank = _fish_tank()
+    monitors = [WaterDissolvedElementsMonitor(water_tank, DISSOLVED_ELEMENTS) for _ in range(1000)]
+
+    def advance():
+        # Ten-minute steps of a thousand tanks, restarting from the initial concentrations to stay in range
+        for monitor in monitors:
+            monitor.ammonia, monitor.nitrite, monitor.nitrate = 0.2, 0.2, 10
+        network.advance_monitors(monitors, 600)
+    return advance
+
+
+@benchmark('water_quality_monitor.analyze_data', number=20000)
+def bench_water_quality_monitor_analyze_data():
+    monitor = WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5),
+                                  WaterPropertyRange("turbidity", 0, 10),
+                                  WaterPropertyRange("temperature", 10, 30),
+                                  WaterPropertyRange("tds", 50, 200))
+    water_data = {'ph': 7.5, 'turbidity': 12, 'temperature': 20, 'tds': 100}
+    return lambda: monitor.analyze_data(water_data)
+
+
+@benchmark('water_quality_monitor.analyze_series', number=200, steps_per_call=8760)
+def bench_water_quality_monitor_analyze_series():
+    rng = RandomStreams(SEED).generator('water_quality_monitor.analyze_series')
+    monitor = WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5),
+                                  WaterPropertyRange("turbidity", 0, 10),
+                                  WaterPropertyRange("temperature", 10, 30),
+                                  WaterPropertyRange("tds", 50, 200))
+    # A year of hourly readings, a few percent of them out of range
+    series = {'ph': rng.normal(7.5, 0.4, 8760), 'turbidity': rng.normal(5, 2, 8760),
+              'temperature': rng.normal(20, 4, 8760), 'tds': rng.normal(125, 30, 8760)}
+    return lambda: monitor.analyze_series(series)
+
+
+@benchmark('seasonal_weather_simulator.apply_seasonal_weather_data_to_sim', number=8640)
+def bench_apply_seasonal_weather_data_to_sim():
+    from src.simulation.seasonal_weather_simulation import SeasonalWeatherSimulator
+
+    with open(os.path.join(CONFIGURATIONS_PATH, 'austria_seasonal_weather_data.json'), 'r') as f:
+        simulator = SeasonalWeatherSimulator(**json.load(f))
+    simulator.roof_surface = 100
+    simulator.use_random_streams(RandomStreams(SEED))
+    # Replay one year of hourly steps, starting over with empty simulation data every year
+    start = datetime(1900, 1, 1)
+    date_times = [start + timedelta(hours=hour) for hour in range(8640)]
+    step = iter(())
+
+    def apply():
+        nonlocal step
+        date_time = next(step, None)
+        if date_time is None:
+            simulator.simulation_data = dict()
+            step = iter(date_times)
+            date_time = next(step)
+        simulator.apply_seasonal_weather_data_to_sim(date_time, 3600)
+    return apply
+
+
+@memory_benchmark('memory.water', count=20000)
+def bench_memory_water():
+    return lambda: Water(0, 6000)
+
+
+@memory_benchmark('memory.water_tank', count=20000)
+def bench_memory_water_tank():
+    return lambda: WaterTank(tank_length=400, tank_width=150, tank_depth=100, tank_type='fish_tank')
+
+
+@memory_benchmark('memory.water_property_range', count=20000)
+def bench_memory_water_property_range():
+    return lambda: WaterPropertyRange("ph", 6.5, 8.5)
+
+
+def _headless_run(duration: int, time_unit: str, weather_engine: str = 'stepwise'):
+    from src.simulation.simulation import ArtificialEcosystemSimulator
+
+    def run():
+        simulator = ArtificialEcosystemSimulator(configuration_files_path="configurations",
+                                                 country="Austria",
+                                                 seed=SEED)
+        simulator.simulation_config.update(duration=duration, time_unit=time_unit, weather_engine=weather_engine)
+        # A step failing is reported on stdout and skipped by the simulation, the benchmark fails instead of
+        # timing it unnoticed
+        reported = io.StringIO()
+        with contextlib.redirect_stdout(reported):
+            asyncio.run(simulator.simulate(headless=True))
+        if reported.getvalue():
+            raise RuntimeError(f"The headless simulation reported errors:\n{reported.getvalue()}")
+    return run
+
+
+@benchmark('ecosystem_simulation.headless_day', number=20, repeat=3, steps_per_call=24)
+def bench_headless_day():
+    return _headless_run(1, 'day')
+
+
+@benchmark('ecosystem_simulation.headless_month', number=3, repeat=3, steps_per_call=30 * 24)
+def bench_headless_month():
+    return _headless_run(1, 'month')
+
+
+@benchmark('ecosystem_simulation.headless_year', number=1, repeat=3, steps_per_call=365 * 24)
+def bench_headless_year():
+    return _headless_run(1, 'year')
+
+
+@benchmark('water.update_water_viscosity', number=20000)
+def bench_water_update_water_viscosity():
+    water = Water(0, 6000)
+    water.add_water(3000)
+    return water.update_water_viscosity
+
+
+@benchmark('physics_cache.saturation_vapor_pressure', number=20000)
+def bench_saturation_vapor_pressure():
+    kernel = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100)
+    return lambda: kernel(22.5)
+
+
+@benchmark('physics_cache.saturation_vapor_pressure_table', number=20000)
+def bench_saturation_vapor_pressure_table():
+    kernel = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100, tolerance=1e-6)
+    return lambda: kernel(22.5)
@@ -0,0 +1,212 @@
+import datetime
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Registered benchmarks keyed by name
+BENCHMARKS = dict()
+
+
+def benchmark(name: str, number: int = 1000, repeat: int = 5, steps_per_call: int = 1):
+    """
+    Registers a benchmark.
+
+    The decorated function is a setup factory: it builds the objects under test and returns the callable
+    to time, so that setup costs are not measured. The callable is invoked `number` times per repetition.
+
+    Args:
+        name (str): The unique name of the benchmark.
+        number (int, optional): The number of calls per repetition. Defaults to 1000.
+        repeat (int, optional): The number of timed repetitions. Defaults to 5.
+        steps_per_call (int, optional): The number of simulation steps performed by one call, used to report
+            steps per second. Defaults to 1.
+
+    Raises:
+        ValueError: If a benchmark with the same name is already registered.
+    """
+    def register(setup):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered.")
+        BENCHMARKS[name] = {'setup': setup, 'number': number, 'repeat': repeat, 'steps_per_call': steps_per_call}
+        return setup
+    return register
+
+
+def memory_benchmark(name: str, count: int = 10000):
+    """
+    Registers a memory benchmark.
+
+    The decorated function is a setup factory returning a callable that creates one instance of the objects
+    under test. The benchmark keeps `count` instances alive and reports the memory allocated per instance.
+
+    Args:
+        name (str): The unique name of the benchmark.
+        count (int, optional): The number of instances created. Defaults to 10000.
+
+    Raises:
+        ValueError: If a benchmark with the same name is already registered.
+    """
+    def register(setup):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered.")
+        BENCHMARKS[name] = {'setup': setup, 'count': count, 'memory': True}
+        return setup
+    return register
+
+
+def run_memory_benchmark(name: str, quick: bool = False) -> dict:
+    """
+    Runs one registered memory benchmark, tracing the allocations with `tracemalloc`.
+
+    Args:
+        name (str): The name of the benchmark.
+        quick (bool, optional): Creates a tenth of the instances, for smoke runs.
+
+    Returns:
+        dict: The number of instances and the bytes allocated per instance.
+    """
+    spec = BENCHMARKS[name]
+    count = max(spec['count'] // 10, 1) if quick else spec['count']
+    create = spec['setup']()
+    create()
+
+    gc.collect()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        instances = [None] * count
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            instances[index] = create()
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    del instances
+    return {'name': name, 'count': count, 'bytes_per_instance': allocated / count}
+
+
+def run_benchmark(name: str, quick: bool = False) -> dict:
+    """
+    Runs one registered benchmark.
+
+    One untimed warm-up call precedes the timed repetitions, and garbage collection is disabled while timing.
+
+    Args:
+        name (str): The name of the benchmark.
+        quick (bool, optional): Runs a tenth of the calls and at most 2 repetitions, for smoke runs.
+
+    Returns:
+        dict: The benchmark parameters, the per-call latency in seconds (min, median and mean over the
+            repetitions) and the steps per second derived from the median latency. Memory benchmarks report
+            the result of `run_memory_benchmark` instead.
+    """
+    spec = BENCHMARKS[name]
+    if spec.get('memory'):
+        return run_memory_benchmark(name, quick)
+    number = max(spec['number'] // 10, 1) if quick else spec['number']
+    repeat = min(spec['repeat'], 2) if quick else spec['repeat']
+    func = spec['setup']()
+    func()
+
+    per_call = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            per_call.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    median = statistics.median(per_call)
+    return {
+        'name': name,
+        'number': number,
+        'repeat': repeat,
+        'steps_per_call': spec['steps_per_call'],
+        'per_call_seconds': {'min': min(per_call), 'median': median, 'mean': statistics.fmean(per_call)},
+        'steps_per_second': spec['steps_per_call'] / median if median > 0 else float('inf'),
+    }
+
+
+def environment_info() -> dict:
+    """
+    Describes the environment of a benchmark run, including the git commit when available.
+
+    Returns:
+        dict: The commit, timestamp, Python version and platform of the run.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def run_benchmarks(names: list = None, quick: bool = False) -> dict:
+    """
+    Runs registered benchmarks.
+
+    Args:
+        names (list, optional): The benchmarks to run, in order. Defaults to all registered benchmarks.
+        quick (bool, optional): Runs every benchmark in quick mode (see `run_benchmark`).
+
+    Returns:
+        dict: The run environment under 'environment' and one result per benchmark under 'results'.
+
+    Raises:
+        KeyError: If a requested benchmark is not registered.
+    """
+    names = list(BENCHMARKS) if names is None else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise KeyError(f"Unknown benchmarks: {', '.join(unknown)}")
+    return {'environment': environment_info(), 'results': [run_benchmark(name, quick) for name in names]}
+
+
+def write_results(results: dict, path: str):
+    """
+    Writes benchmark results to a JSON file.
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def compare_results(baseline: dict, current: dict) -> dict:
+    """
+    Compares two benchmark runs.
+
+    Args:
+        baseline (dict): The results of the reference run.
+        current (dict): The results of the new run.
+
+    Returns:
+        dict: For every benchmark present in both runs, the speedup of the median per-call latency, or the
+            reduction of the memory per instance for memory benchmarks (greater than 1 when the current run
+            is faster or smaller).
+    """
+    def measure(result):
+        return result['bytes_per_instance'] if 'bytes_per_instance' in result else result['per_call_seconds']['median']
+
+    baseline_measures = {result['name']: measure(result) for result in baseline['results']}
+    return {result['name']: baseline_measures[result['name']] / measure(result)
+            for result in current['results']
+            if result['name'] in baseline_measures and measure(result) > 0}
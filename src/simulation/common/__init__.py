@@ -2,4 +2,10 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
 
-from .helpers import get_date_time_simulation_data
\ No newline at end of file
+from .helpers import get_date_time_simulation_data, EventLoopYielder, get_event_loop_yielder
+from .time_series import TimeSeries
+from .step_channel import StepChannel
+from .lockstep_scheduler import LockstepScheduler
+from .streaming_quantiles import StreamingQuantiles
+from .binned_statistics import BinnedStatistics
+from .random_streams import RandomStreams, BatchedRandom
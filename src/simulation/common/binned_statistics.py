@@ -0,0 +1,164 @@
+import numpy as np
+
+
+class BinnedStatistics:
+    """
+    Fixed-memory streaming statistics of values binned by a numeric key (e.g. a rate by air temperature).
+
+    Keys in `[lower, upper)` fall into bins of `bin_width`; keys outside the range are counted in the first or
+    last bin. Every bin keeps the count, the sum, the minimum and the maximum of its values in lists allocated
+    on the first value (faster to update one bin at a time than arrays), so memory is bounded by the number of
+    bins however many values are added and a query over all bins costs O(bins).
+
+    The mapping methods (`get`, `[]`, `in`, `keys`, `items`) look keys up by bin and return the mean of the
+    bin, so a bin behaves like a dictionary entry keyed by any key within it.
+
+    Attributes:
+        lower (float): The lower bound of the first bin.
+        upper (float): The upper bound of the last bin.
+        bin_width (float): The width of every bin.
+        bins (int): The number of bins.
+    """
+
+    __slots__ = ('lower', 'upper', 'bin_width', 'bins', '_inverse_width', '_count', '_total', '_minimum', '_maximum')
+
+    def __init__(self, lower: int | float, upper: int | float, bin_width: int | float):
+        if lower >= upper:
+            raise ValueError("Lower bound must be less than the upper bound.")
+        if bin_width <= 0:
+            raise ValueError("Bin width must be positive.")
+        self.lower = lower
+        self.upper = upper
+        self.bin_width = bin_width
+        self.bins = max(int(np.ceil((upper - lower) / bin_width)), 1)
+        self._inverse_width = 1 / bin_width
+        self._count = self._total = self._minimum = self._maximum = None
+
+    def _allocate(self):
+        self._count = [0] * self.bins
+        self._total = [0.0] * self.bins
+        self._minimum = [float('inf')] * self.bins
+        self._maximum = [float('-inf')] * self.bins
+
+    def bin_index(self, key: int | float) -> int:
+        """
+        Get the index of the bin holding `key`, clamped to the first and last bins.
+        """
+        index = int((key - self.lower) * self._inverse_width)
+        return 0 if index < 0 else self.bins - 1 if index >= self.bins else index
+
+    def bin_center(self, index: int) -> float:
+        """
+        Get the center of the bin at `index`.
+        """
+        return self.lower + (index + 0.5) * self.bin_width
+
+    def add(self, key: int | float, value: int | float):
+        """
+        Add a value to the bin of `key`.
+
+        Args:
+            key (int | float): The key binning the value.
+            value (int | float): The value.
+        """
+        if self._count is None:
+            self._allocate()
+        # Truncation rounds keys below the range towards the first bin, which they are clamped to anyway
+        index = int((key - self.lower) * self._inverse_width)
+        if index < 0:
+            index = 0
+        elif index >= self.bins:
+            index = self.bins - 1
+        self._count[index] += 1
+        self._total[index] += value
+        if value < self._minimum[index]:
+            self._minimum[index] = value
+        if value > self._maximum[index]:
+            self._maximum[index] = value
+
+    def add_many(self, keys, values):
+        """
+        Add many values at once, each to the bin of its key.
+
+        Args:
+            keys (array-like): The keys binning the values.
+            values (array-like): The values, one per key.
+
+        Raises:
+            ValueError: If the keys and values have different lengths.
+        """
+        keys = np.asarray(keys, dtype=float).ravel()
+        values = np.asarray(values, dtype=float).ravel()
+        if keys.shape != values.shape:
+            raise ValueError("Keys and values must have the same length.")
+        if not keys.size:
+            return
+        if self._count is None:
+            self._allocate()
+        indices = np.clip(np.floor((keys - self.lower) * self._inverse_width), 0, self.bins - 1).astype(np.intp)
+        self._count = (np.array(self._count) + np.bincount(indices, minlength=self.bins)).tolist()
+        self._total = (np.array(self._total) + np.bincount(indices, weights=values, minlength=self.bins)).tolist()
+        minimum, maximum = np.array(self._minimum), np.array(self._maximum)
+        np.minimum.at(minimum, indices, values)
+        np.maximum.at(maximum, indices, values)
+        self._minimum, self._maximum = minimum.tolist(), maximum.tolist()
+
+    @property
+    def count(self) -> int:
+        """
+        Get the number of values added so far.
+        """
+        return sum(self._count) if self._count is not None else 0
+
+    def statistics(self) -> dict:
+        """
+        Get the statistics of every non-empty bin, in increasing key order.
+
+        Returns:
+            dict: NumPy arrays with one entry per non-empty bin:
+                - 'center': The center of the bin.
+                - 'count': The number of values.
+                - 'mean', 'min', 'max': The mean, minimum and maximum of the values.
+        """
+        if self._count is None:
+            return {name: np.empty(0) for name in ('center', 'count', 'mean', 'min', 'max')}
+        count = np.array(self._count)
+        filled = np.flatnonzero(count)
+        return {
+            'center': self.lower + (filled + 0.5) * self.bin_width,
+            'count': count[filled],
+            'mean': np.array(self._total)[filled] / count[filled],
+            'min': np.array(self._minimum)[filled],
+            'max': np.array(self._maximum)[filled],
+        }
+
+    def __len__(self) -> int:
+        return 0 if self._count is None else self.bins - self._count.count(0)
+
+    def __contains__(self, key) -> bool:
+        return self._count is not None and self._count[self.bin_index(key)] > 0
+
+    def __getitem__(self, key: int | float) -> float:
+        if key not in self:
+            raise KeyError(key)
+        index = self.bin_index(key)
+        return self._total[index] / self._count[index]
+
+    def get(self, key: int | float, default=None):
+        """
+        Get the mean of the values in the bin of `key`, or `default` if the bin is empty.
+        """
+        return self[key] if key in self else default
+
+    def keys(self) -> list:
+        """
+        Get the centers of the non-empty bins.
+        """
+        return self.statistics()['center'].tolist()
+
+    def items(self) -> list:
+        """
+        Get the (center, mean) pairs of the non-empty bins.
+        """
+        statistics = self.statistics()
+        return list(zip(statistics['center'].tolist(), statistics['mean'].tolist()))
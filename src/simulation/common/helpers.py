@@ -1,3 +1,5 @@
+import asyncio
+import time
 from datetime import datetime
 
 
@@ -35,4 +37,56 @@ def get_date_time_simulation_data(simulation_config: dict) -> tuple[datetime, in
     sampling_rate = unit_to_seconds.get(sample_unit.lower(), 1)  # Default to 1 second if unit is unknown
 
     # Return the formatted start date/time, total simulation duration, and sampling rate.
-    return start_date_time, sim_duration, sampling_rate
\ No newline at end of file
+    return start_date_time, sim_duration, sampling_rate
+
+
+class EventLoopYielder:
+    """
+    Cooperatively hands control back to the asyncio event loop while a simulation runs headless.
+
+    Instead of sleeping on every simulation step, the yielder only awaits `asyncio.sleep(0)` once
+    `every_n_steps` steps have been taken or once `time_budget` seconds of wall-clock time have passed
+    since the last yield, whichever comes first. This keeps other coroutines responsive without
+    capping the simulation speed at the sleep resolution of the event loop.
+
+    Attributes:
+        every_n_steps (int): Maximum number of steps between two consecutive yields.
+        time_budget (float): Maximum wall-clock seconds between two consecutive yields.
+    """
+
+    def __init__(self, every_n_steps: int = 1000, time_budget: float = 0.05):
+        if not isinstance(every_n_steps, int) or every_n_steps < 1:
+            raise ValueError("every_n_steps must be a positive integer.")
+        if not isinstance(time_budget, (int, float)) or time_budget <= 0:
+            raise ValueError("time_budget must be a positive number of seconds.")
+        self.every_n_steps = every_n_steps
+        self.time_budget = time_budget
+        self._steps_since_yield = 0
+        self._last_yield_time = time.perf_counter()
+
+    async def tick(self):
+        """
+        Registers one simulation step and yields to the event loop when the step count or the
+        time budget is exhausted.
+        """
+        self._steps_since_yield += 1
+        if (self._steps_since_yield >= self.every_n_steps or
+                time.perf_counter() - self._last_yield_time >= self.time_budget):
+            await asyncio.sleep(0)
+            self._steps_since_yield = 0
+            self._last_yield_time = time.perf_counter()
+
+
+def get_event_loop_yielder(simulation_config: dict) -> EventLoopYielder:
+    """
+    Builds an `EventLoopYielder` from the optional `yield_every_n_steps` and `yield_time_budget`
+    keys of the simulation configuration.
+
+    Args:
+        simulation_config (dict): The simulation configuration.
+
+    Returns:
+        EventLoopYielder: A yielder configured for headless runs.
+    """
+    return EventLoopYielder(every_n_steps=simulation_config.get('yield_every_n_steps', 1000),
+                            time_budget=simulation_config.get('yield_time_budget', 0.05))
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from .helpers import get_date_time_simulation_data
+
+
+class LockstepScheduler:
+    """
+    A deterministic co-simulation scheduler that owns the simulated clock.
+
+    For every timestamp of the configured horizon the scheduler calls the `step(sim_date_time, sampling_rate)`
+    method of each component in the order they were given, so producers (e.g. the weather) always run before
+    their consumers (e.g. the fish tank) and the result of a run does not depend on event loop scheduling.
+    Components are prepared with their `prepare(simulation_config)` method before the first step.
+
+    Attributes:
+        simulation_config (dict): The simulation configuration (start date, duration, sampling).
+        components (tuple): The components stepped at every timestamp, in order.
+        sim_date_time (datetime): The simulated date and time of the next step.
+        simulated_seconds (int): Total simulated time in seconds.
+    """
+
+    def __init__(self, simulation_config: dict, components):
+        components = tuple(components)
+        if not components:
+            raise ValueError("At least one component is required.")
+        for component in components:
+            if not callable(getattr(component, 'step', None)):
+                raise ValueError(f"Component {component!r} has no step method.")
+        self.simulation_config = simulation_config
+        self.components = components
+        self.sim_date_time, self._sim_duration, self._sampling_rate = get_date_time_simulation_data(simulation_config)
+        self.simulated_seconds = 0
+
+    def prepare(self):
+        """
+        Prepares every component that defines a `prepare` method for the configured run.
+        """
+        for component in self.components:
+            prepare = getattr(component, 'prepare', None)
+            if prepare is not None:
+                prepare(self.simulation_config)
+
+    def done(self) -> bool:
+        """
+        Check whether the whole horizon has been simulated.
+        """
+        return self.simulated_seconds >= self._sim_duration
+
+    def advance(self):
+        """
+        Steps every component once for the current timestamp and advances the simulated clock.
+        """
+        for component in self.components:
+            component.step(self.sim_date_time, self._sampling_rate)
+        self.simulated_seconds += self._sampling_rate
+        self.sim_date_time += timedelta(seconds=self._sampling_rate)
+
+    def run(self):
+        """
+        Runs the whole horizon synchronously, as fast as possible.
+        """
+        self.prepare()
+        while not self.done():
+            self.advance()
+
+    async def run_async(self, yielder=None):
+        """
+        Runs the whole horizon inside an event loop.
+
+        Args:
+            yielder (EventLoopYielder, optional): Yields control to the event loop (e.g. to refresh plots) every
+                few steps. Without a yielder the run does not yield at all.
+        """
+        self.prepare()
+        while not self.done():
+            self.advance()
+            if yielder is not None:
+                await yielder.tick()
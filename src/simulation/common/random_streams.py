@@ -0,0 +1,136 @@
+import zlib
+import numpy as np
+
+
+class RandomStreams:
+    """
+    Independent, reproducible random streams derived from one master seed.
+
+    Every simulation component draws from its own stream, obtained by name from `generator` (a
+    `numpy.random.Generator`) or `batched` (a `BatchedRandom` with the `random.Random` drawing interface).
+    A stream is derived from the master `numpy.random.SeedSequence` and a stable hash of its name, so it does
+    not depend on the order in which components ask for their streams, and `spawn` splits the master seed
+    into independent child streams (e.g. one per ensemble replica).
+
+    Attributes:
+        seed_sequence (numpy.random.SeedSequence): The master seed sequence.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialize the streams.
+
+        Args:
+            seed (int | numpy.random.SeedSequence, optional): The master seed. Defaults to fresh entropy.
+        """
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._generators = dict()
+
+    @property
+    def entropy(self):
+        """
+        Get the entropy of the master seed, which reproduces every stream when passed back as `seed`.
+        """
+        return self.seed_sequence.entropy
+
+    def generator(self, name: str) -> np.random.Generator:
+        """
+        Get the generator of the stream named `name`, creating it on first use.
+
+        Args:
+            name (str): The name of the component owning the stream.
+
+        Returns:
+            numpy.random.Generator: The generator of the stream.
+        """
+        if name not in self._generators:
+            child = np.random.SeedSequence(self.seed_sequence.entropy,
+                                           spawn_key=self.seed_sequence.spawn_key + (zlib.crc32(name.encode()),))
+            self._generators[name] = np.random.default_rng(child)
+        return self._generators[name]
+
+    def batched(self, name: str, block_size: int = 4096) -> 'BatchedRandom':
+        """
+        Get a `BatchedRandom` drawing from the stream named `name`.
+
+        Args:
+            name (str): The name of the component owning the stream.
+            block_size (int, optional): The number of values drawn per block. Defaults to 4096.
+
+        Returns:
+            BatchedRandom: The batched drawer of the stream.
+        """
+        return BatchedRandom(self.generator(name), block_size)
+
+    def spawn(self, n: int) -> list:
+        """
+        Split the master seed into `n` independent child streams.
+
+        Args:
+            n (int): The number of children.
+
+        Returns:
+            list: `n` `RandomStreams`.
+        """
+        return [RandomStreams(child) for child in self.seed_sequence.spawn(n)]
+
+
+class BatchedRandom:
+    """
+    A `random.Random`-like drawer pulling uniform numbers from a NumPy generator in blocks.
+
+    Hot loops drawing one value per call pay the NumPy call overhead once per block of `block_size` values
+    instead of once per value. `uniform` and `randrange` follow the semantics of `random.Random`.
+
+    Attributes:
+        generator (numpy.random.Generator): The underlying generator.
+        block_size (int): The number of values drawn per block.
+    """
+
+    def __init__(self, generator: np.random.Generator = None, block_size: int = 4096):
+        if not isinstance(block_size, int) or block_size < 1:
+            raise ValueError("Block size must be a positive integer.")
+        self.generator = generator if generator is not None else np.random.default_rng()
+        self.block_size = block_size
+        self._block = []
+        self._index = 0
+
+    def random(self) -> float:
+        """
+        Draw a float uniformly from [0, 1).
+        """
+        if self._index == len(self._block):
+            self._block = self.generator.random(self.block_size).tolist()
+            self._index = 0
+        value = self._block[self._index]
+        self._index += 1
+        return value
+
+    def uniform(self, a: float, b: float) -> float:
+        """
+        Draw a float uniformly from [a, b).
+        """
+        return a + (b - a) * self.random()
+
+    def randrange(self, start: int, stop: int) -> int:
+        """
+        Draw an integer uniformly from range(start, stop).
+
+        Raises:
+            ValueError: If the range is empty.
+        """
+        if stop <= start:
+            raise ValueError(f"Empty range for randrange({start}, {stop}).")
+        return start + int(self.random() * (stop - start))
+
+    def draw(self, n: int) -> np.ndarray:
+        """
+        Draw a block of `n` floats uniformly from [0, 1) in one call.
+
+        Args:
+            n (int): The number of values.
+
+        Returns:
+            numpy.ndarray: The drawn values.
+        """
+        return self.generator.random(n)
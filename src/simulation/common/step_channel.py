@@ -0,0 +1,144 @@
+import asyncio
+from array import array
+
+
+class StepChannel:
+    """
+    A bounded producer/consumer ring buffer of simulation steps keyed by simulated timestamp.
+
+    The producer publishes one entry per simulation step and the consumer takes them in order,
+    so every step is consumed exactly once: the producer waits while the buffer is full and the
+    consumer waits while it is empty. Values are written into preallocated `array('d')` columns,
+    one per field, so publishing a step allocates no container.
+
+    The channel is meant to be shared by coroutines running on the same event loop and needs no lock.
+
+    Attributes:
+        fields (tuple): The names of the values carried by each step.
+        capacity (int): The maximum number of steps buffered at once.
+    """
+
+    def __init__(self, fields: tuple, capacity: int = 1024):
+        if not isinstance(fields, tuple) or not fields:
+            raise ValueError("Fields must be a non-empty tuple of names.")
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("Capacity must be a positive integer.")
+        self.fields = fields
+        self.capacity = capacity
+        self._timestamps = [None] * capacity
+        self._columns = tuple(array('d', bytes(8 * capacity)) for _ in fields)
+        self._read_index = 0  # Sequence number of the next step to consume
+        self._write_index = 0  # Sequence number of the next step to publish
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def __len__(self) -> int:
+        return self._write_index - self._read_index
+
+    def full(self) -> bool:
+        """
+        Check whether the channel holds `capacity` unconsumed steps.
+        """
+        return len(self) >= self.capacity
+
+    def empty(self) -> bool:
+        """
+        Check whether every published step has been consumed.
+        """
+        return self._write_index == self._read_index
+
+    def put_nowait(self, timestamp, *values):
+        """
+        Publish the values of one simulation step.
+
+        Args:
+            timestamp: The simulated timestamp of the step. Timestamps must be published in increasing order.
+            *values (float): One value per field, in the order of `fields`.
+
+        Raises:
+            ValueError: If the number of values does not match the fields or the timestamp is out of order.
+            asyncio.QueueFull: If the channel is full.
+        """
+        if len(values) != len(self.fields):
+            raise ValueError(f"Expected {len(self.fields)} values, got {len(values)}.")
+        if self.full():
+            raise asyncio.QueueFull
+        if not self.empty():
+            last_timestamp = self._timestamps[(self._write_index - 1) % self.capacity]
+            if timestamp <= last_timestamp:
+                raise ValueError(f"Step {timestamp} published after step {last_timestamp}.")
+        slot = self._write_index % self.capacity
+        self._timestamps[slot] = timestamp
+        for column, value in zip(self._columns, values):
+            column[slot] = value
+        self._write_index += 1
+        self._not_empty.set()
+        if self.full():
+            self._not_full.clear()
+
+    async def wait_not_full(self):
+        """
+        Wait until the consumer has freed at least one slot.
+        """
+        while self.full():
+            await self._not_full.wait()
+
+    async def wait_not_empty(self):
+        """
+        Wait until the producer has published at least one step.
+        """
+        while self.empty():
+            await self._not_empty.wait()
+
+    async def put(self, timestamp, *values):
+        """
+        Publish the values of one simulation step, waiting for the consumer while the channel is full.
+
+        Args:
+            timestamp: The simulated timestamp of the step.
+            *values (float): One value per field, in the order of `fields`.
+        """
+        await self.wait_not_full()
+        self.put_nowait(timestamp, *values)
+
+    def get_nowait(self, timestamp=None) -> tuple:
+        """
+        Consume the oldest published step.
+
+        Args:
+            timestamp (optional): The simulated timestamp the consumer expects. When given, the step is only
+                consumed if it carries this timestamp.
+
+        Returns:
+            tuple: The step timestamp followed by one value per field.
+
+        Raises:
+            asyncio.QueueEmpty: If no step is available.
+            ValueError: If the oldest step does not carry the expected timestamp.
+        """
+        if self.empty():
+            raise asyncio.QueueEmpty
+        slot = self._read_index % self.capacity
+        step_timestamp = self._timestamps[slot]
+        if timestamp is not None and step_timestamp != timestamp:
+            raise ValueError(f"Consumer expected step {timestamp} but the channel holds step {step_timestamp}.")
+        self._timestamps[slot] = None
+        self._read_index += 1
+        self._not_full.set()
+        if self.empty():
+            self._not_empty.clear()
+        return (step_timestamp, *(column[slot] for column in self._columns))
+
+    async def get(self, timestamp=None) -> tuple:
+        """
+        Consume the oldest published step, waiting for the producer while the channel is empty.
+
+        Args:
+            timestamp (optional): The simulated timestamp the consumer expects.
+
+        Returns:
+            tuple: The step timestamp followed by one value per field.
+        """
+        await self.wait_not_empty()
+        return self.get_nowait(timestamp)
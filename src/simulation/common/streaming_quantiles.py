@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class StreamingQuantiles:
+    """
+    Streaming estimates of several quantiles of many independent series, using the P² algorithm.
+
+    Every observation is a vector holding one value per series (e.g. one value per simulation step of an
+    ensemble replica). For each quantile and each series the P² algorithm (Jain & Chlamtac, 1985) keeps five
+    markers whose heights approximate the minimum, the quantile, the maximum and two intermediate quantiles,
+    adjusting them with a piecewise-parabolic interpolation as observations arrive. Memory is therefore
+    O(quantiles × series) whatever the number of observations.
+
+    Until five observations have been seen the estimates are exact quantiles of the observations.
+
+    Attributes:
+        quantiles (tuple): The estimated quantiles, each in [0, 1].
+        size (int): The number of series.
+        count (int): The number of observations added so far.
+    """
+
+    def __init__(self, quantiles: tuple, size: int):
+        if not quantiles or any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError("Quantiles must be a non-empty sequence of values in [0, 1].")
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("Size must be a positive integer.")
+        self.quantiles = tuple(quantiles)
+        self.size = size
+        self.count = 0
+        p = np.asarray(self.quantiles, dtype=float)[:, None]
+        # Desired marker positions and their increments per observation, shared by all series
+        self._desired = np.hstack((np.ones_like(p), 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, np.full_like(p, 5)))
+        self._increments = np.hstack((np.zeros_like(p), p / 2, p, (1 + p) / 2, np.ones_like(p)))
+        # Marker heights and actual positions, shaped (quantiles, series, markers)
+        self._heights = np.empty((len(self.quantiles), size, 5))
+        self._positions = np.tile(np.arange(1.0, 6.0), (len(self.quantiles), size, 1))
+
+    def add(self, values):
+        """
+        Add one observation to every series.
+
+        Args:
+            values (array-like): One value per series.
+
+        Raises:
+            ValueError: If the number of values does not match `size`.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape != (self.size,):
+            raise ValueError(f"Expected {self.size} values, got shape {values.shape}.")
+        if self.count < 5:
+            self._heights[:, :, self.count] = values
+            self.count += 1
+            if self.count == 5:
+                self._heights.sort(axis=2)
+            return
+        self.count += 1
+        heights, positions = self._heights, self._positions
+        values = np.broadcast_to(values, heights.shape[:2])
+
+        # Extend the extreme markers and find the cell k holding each value (heights[k] <= value < heights[k+1])
+        np.minimum(heights[:, :, 0], values, out=heights[:, :, 0])
+        np.maximum(heights[:, :, 4], values, out=heights[:, :, 4])
+        cell = np.clip((values[:, :, None] >= heights[:, :, 1:4]).sum(axis=2), 0, 3)
+        positions += np.arange(5) > cell[:, :, None]
+        self._desired += self._increments
+
+        # Move the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[:, None, i] - positions[:, :, i]
+            move_right = (offset >= 1) & (positions[:, :, i + 1] - positions[:, :, i] > 1)
+            move_left = (offset <= -1) & (positions[:, :, i - 1] - positions[:, :, i] < -1)
+            d = np.where(move_right, 1.0, 0.0) - np.where(move_left, 1.0, 0.0)
+            if not d.any():
+                continue
+            q_prev, q, q_next = heights[:, :, i - 1], heights[:, :, i], heights[:, :, i + 1]
+            n_prev, n, n_next = positions[:, :, i - 1], positions[:, :, i], positions[:, :, i + 1]
+            parabolic = q + d / (n_next - n_prev) * ((n - n_prev + d) * (q_next - q) / (n_next - n) +
+                                                     (n_next - n - d) * (q - q_prev) / (n - n_prev))
+            linear = np.where(d > 0, q + (q_next - q) / (n_next - n), q - (q_prev - q) / (n_prev - n))
+            adjusted = np.where((q_prev < parabolic) & (parabolic < q_next), parabolic, linear)
+            heights[:, :, i] = np.where(d != 0, adjusted, q)
+            positions[:, :, i] += d
+
+    def result(self) -> dict:
+        """
+        Get the current estimates.
+
+        Returns:
+            dict: One array of `size` estimates per quantile, keyed by quantile.
+
+        Raises:
+            ValueError: If no observation has been added.
+        """
+        if self.count == 0:
+            raise ValueError("No observation has been added.")
+        if self.count < 5:
+            observed = self._heights[0, :, :self.count]
+            return {q: np.quantile(observed, q, axis=1) for q in self.quantiles}
+        return {q: self._heights[index, :, 2].copy() for index, q in enumerate(self.quantiles)}
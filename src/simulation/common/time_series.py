@@ -0,0 +1,130 @@
+from array import array
+
+
+class TimeSeries:
+    """
+    A compact, append-only series of floats used to store simulation results.
+
+    Samples are stored in a preallocated `array('d')` (8 bytes per sample instead of the ~32 bytes of a
+    Python float referenced by a list) that doubles its capacity when full. The series keeps a running
+    total so that sums and means over the whole series cost O(1).
+
+    Attributes:
+        total (float): The running sum of all samples.
+    """
+
+    __slots__ = ('_data', '_length', '_total')
+
+    def __init__(self, values=(), capacity: int = 1024):
+        """
+        Initialize the series.
+
+        Args:
+            values (iterable, optional): Initial samples. Defaults to an empty series.
+            capacity (int, optional): Number of samples to preallocate. Defaults to 1024.
+
+        Raises:
+            ValueError: If the capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("Capacity must be non-negative.")
+        self._data = array('d', bytes(8 * max(capacity, 1)))
+        self._length = 0
+        self._total = 0.0
+        self.extend(values)
+
+    def append(self, value: int | float):
+        """
+        Append a sample to the series.
+
+        Args:
+            value (int | float): The sample to append.
+        """
+        if self._length == len(self._data):
+            self._data.frombytes(bytes(8 * len(self._data)))
+        self._data[self._length] = value
+        self._length += 1
+        self._total += value
+
+    def extend(self, values):
+        """
+        Append several samples to the series.
+
+        Args:
+            values (iterable): The samples to append.
+        """
+        for value in values:
+            self.append(value)
+
+    @property
+    def total(self) -> float:
+        """
+        Get the running sum of the samples.
+
+        Returns:
+            float: The sum of all samples appended so far.
+        """
+        return self._total
+
+    def mean(self) -> float:
+        """
+        Get the mean of the samples.
+
+        Returns:
+            float: The mean of the samples, 0 for an empty series.
+        """
+        return self._total / self._length if self._length else 0.0
+
+    def last(self, default=None):
+        """
+        Get the most recent sample.
+
+        Args:
+            default (optional): The value returned for an empty series. Defaults to None.
+
+        Returns:
+            float: The last sample appended, or `default` if the series is empty.
+        """
+        return self._data[self._length - 1] if self._length else default
+
+    def to_list(self) -> list:
+        """
+        Get the samples as a list of floats.
+
+        Returns:
+            list: A copy of the samples.
+        """
+        return self._data[:self._length].tolist()
+
+    def to_numpy(self):
+        """
+        Get the samples as a NumPy array.
+
+        Returns:
+            numpy.ndarray: A copy of the samples.
+        """
+        import numpy as np
+
+        return np.frombuffer(self._data, dtype=np.float64, count=self._length).copy()
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.to_numpy()
+        return values if dtype is None else values.astype(dtype)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._data[:self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("TimeSeries index out of range.")
+        return self._data[index]
+
+    def __iter__(self):
+        return iter(self._data[:self._length])
+
+    def __repr__(self):
+        return f"TimeSeries(length={self._length}, total={self._total})"
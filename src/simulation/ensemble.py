@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+from src.simulation.common.streaming_quantiles import StreamingQuantiles
+
+ENSEMBLE_METRICS = ('tank_water_volume', 'precipitation_volume')
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+
+def run_replica(seed_sequence: np.random.SeedSequence,
+                configuration_files_path: str = "configurations",
+                country: str = "Austria",
+                simulation_config: dict = None) -> dict:
+    """
+    Runs one seeded, headless replica of the artificial ecosystem simulation.
+
+    Args:
+        seed_sequence (numpy.random.SeedSequence): The seed of the replica.
+        configuration_files_path (str, optional): The configuration directory, relative to the simulation package.
+        country (str, optional): The country of the seasonal weather data. Defaults to "Austria".
+        simulation_config (dict, optional): Overrides applied to the loaded simulation configuration.
+
+    Returns:
+        dict: One NumPy array per metric of `ENSEMBLE_METRICS`, with one value per simulation step.
+    """
+    from src.simulation.simulation import ArtificialEcosystemSimulator
+
+    simulator = ArtificialEcosystemSimulator(configuration_files_path=configuration_files_path,
+                                             country=country,
+                                             seed=seed_sequence)
+    simulator.simulation_config.update(simulation_config or {})
+    asyncio.run(simulator.simulate(headless=True))
+    return {metric: simulator.simulation_data[metric].to_numpy() for metric in ENSEMBLE_METRICS}
+
+
+class EnsembleAggregator:
+    """
+    Streams ensemble replicas into per-timestep percentile bands.
+
+    Each replica is folded into `StreamingQuantiles` estimators as soon as it completes and is then discarded,
+    so memory scales with the duration of the simulation and not with the number of replicas.
+
+    Attributes:
+        quantiles (tuple): The estimated quantiles, each in [0, 1].
+        replicas (int): The number of replicas aggregated so far.
+    """
+
+    def __init__(self, metrics: tuple = ENSEMBLE_METRICS, quantiles: tuple = DEFAULT_QUANTILES):
+        self.metrics = metrics
+        self.quantiles = quantiles
+        self.replicas = 0
+        self._estimators = dict()
+
+    def add(self, replica: dict):
+        """
+        Fold one replica into the percentile bands.
+
+        Args:
+            replica (dict): One array per metric, with one value per simulation step.
+
+        Raises:
+            ValueError: If the replica lacks a metric or its length differs from the previous replicas.
+        """
+        for metric in self.metrics:
+            if metric not in replica:
+                raise ValueError(f"Replica is missing the '{metric}' series.")
+            values = np.asarray(replica[metric], dtype=float)
+            if metric not in self._estimators:
+                self._estimators[metric] = StreamingQuantiles(self.quantiles, values.shape[0])
+            self._estimators[metric].add(values)
+        self.replicas += 1
+
+    def result(self) -> dict:
+        """
+        Get the percentile bands.
+
+        Returns:
+            dict: For every metric, one array per quantile keyed by its percentile label (e.g. 'p5', 'p50', 'p95').
+        """
+        return {metric: {f"p{q * 100:g}": band for q, band in estimator.result().items()}
+                for metric, estimator in self._estimators.items()}
+
+
+def run_ensemble(replicas: int,
+                 seed: int = None,
+                 max_workers: int = None,
+                 configuration_files_path: str = "configurations",
+                 country: str = "Austria",
+                 simulation_config: dict = None,
+                 quantiles: tuple = DEFAULT_QUANTILES) -> dict:
+    """
+    Runs a Monte Carlo ensemble of seeded simulation replicas across a process pool.
+
+    Replica seeds are spawned from `seed` with `numpy.random.SeedSequence`, so an ensemble is reproducible
+    and its replicas are statistically independent. At most two replicas per worker are in flight at once,
+    and each completed replica is folded into an `EnsembleAggregator` and dropped.
+
+    Args:
+        replicas (int): The number of replicas to run.
+        seed (int, optional): The root seed of the ensemble. Defaults to fresh entropy.
+        max_workers (int, optional): The number of worker processes. Defaults to one per core.
+        configuration_files_path (str, optional): The configuration directory, relative to the simulation package.
+        country (str, optional): The country of the seasonal weather data. Defaults to "Austria".
+        simulation_config (dict, optional): Overrides applied to the loaded simulation configuration.
+        quantiles (tuple, optional): The quantiles of the bands. Defaults to p5, p50 and p95.
+
+    Returns:
+        dict: The percentile bands of `EnsembleAggregator.result`, plus the number of replicas under 'replicas'.
+
+    Raises:
+        ValueError: If the number of replicas is not a positive integer.
+    """
+    if not isinstance(replicas, int) or replicas < 1:
+        raise ValueError("Replicas must be a positive integer.")
+    max_workers = min(max_workers or os.cpu_count() or 1, replicas)
+    aggregator = EnsembleAggregator(quantiles=quantiles)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for seed_sequence in np.random.SeedSequence(seed).spawn(replicas):
+            pending.add(executor.submit(run_replica, seed_sequence, configuration_files_path, country,
+                                        simulation_config))
+            if len(pending) >= 2 * max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    aggregator.add(future.result())
+        for future in wait(pending).done:
+            aggregator.add(future.result())
+
+    result = aggregator.result()
+    result['replicas'] = aggregator.replicas
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run a Monte Carlo ensemble of the artificial ecosystem simulation.")
+    parser.add_argument('replicas', type=int, help="Number of seeded replicas to run.")
+    parser.add_argument('--seed', type=int, default=None, help="Root seed of the ensemble.")
+    parser.add_argument('--workers', type=int, default=None, help="Number of worker processes (default: one per core).")
+    parser.add_argument('--country', default="Austria", help="Country of the seasonal weather data.")
+    parser.add_argument('--output', default=None, help="Write the percentile bands to this JSON file.")
+    args = parser.parse_args()
+
+    bands = run_ensemble(args.replicas, seed=args.seed, max_workers=args.workers, country=args.country)
+    for metric in ENSEMBLE_METRICS:
+        summary = ", ".join(f"{label} final={band[-1]:.2f}" for label, band in bands[metric].items())
+        print(f"{metric}: {summary}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({key: value if key == 'replicas' else {label: band.tolist() for label, band in value.items()}
+                       for key, value in bands.items()}, f)
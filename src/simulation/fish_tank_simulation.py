@@ -1,20 +1,31 @@
-import tkinter
-import matplotlib.pyplot as plt
 import asyncio
 import json
-from src.simulation.water.water_tank import WaterTank
-import matplotlib
-import random
+import os
 import traceback
 from datetime import datetime, timedelta
-from src.simulation.common import get_date_time_simulation_data
+import numpy as np
+from src.simulation.water.water import Water
+from src.simulation.water.water_tank import WaterTank
+from src.simulation.common import get_date_time_simulation_data, get_event_loop_yielder, TimeSeries
+
+CONFIGURATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'configurations')
+
+
+def load_life_cycle_config(path: str = None) -> dict:
+    """
+    Loads the fish tank life cycle configuration.
 
-matplotlib.use('TkAgg')  # Explicitly use the Tkinter-based backend
-plt.style.use('dark_background')  # Use the dark background style
+    Args:
+        path (str, optional): The configuration file. Defaults to `fish_tank_life_cycle.json` in the
+            configurations directory of the simulation package.
 
-# Load config
-with open("./configurations/fish_tank_life_cycle.json", "r") as f:
-    config = json.load(f)
+    Returns:
+        dict: The life cycle configuration.
+    """
+    if path is None:
+        path = os.path.join(CONFIGURATIONS_PATH, 'fish_tank_life_cycle.json')
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 class SimulatorMeta(type):
@@ -46,7 +57,7 @@ class FishTankSimulator(metaclass=SimulatorMeta):
     of handling asynchronous tasks such as data visualization.
 
     Attributes:
-        simulation_data (dict): A storage dictionary for simulation results.
+        simulation_data (dict): A storage dictionary for simulation results, holding `TimeSeries`.
         fish_tank_volume_history (list): History of water volumes in the tank.
         simulated_seconds (int): Total simulated time in seconds.
         plot_tasks (dict): Tracks asynchronous plotting tasks.
@@ -67,6 +78,8 @@ class FishTankSimulator(metaclass=SimulatorMeta):
         self.fish_tank_volume_history = []
         self.simulated_seconds = 0
         self.plot_tasks = dict()
+        # Optional channel delivering every weather step published by the seasonal weather simulator
+        self.weather_channel = None
 
     def simulate_evaporation(self, air_temp, surface_area, rel_humidity, time_elapsed_sec):
         """
@@ -78,15 +91,24 @@ class FishTankSimulator(metaclass=SimulatorMeta):
             rel_humidity (float): The relative humidity (0–1) of the air.
             time_elapsed_sec (int): The elapsed simulation time in seconds.
         """
-        water_evaporated_amount = self.fish_tank.evaporate(air_temp, surface_area, rel_humidity, time_elapsed_sec)
+        # The per-call input validation is only skipped for the tank's own surface area and weather within the
+        # evaporation ranges, anything else (including NaN) goes through it. A tank evaporating more than it
+        # holds dries out, as in `integrate_water_balance`
+        air_temp_range = Water._evaporation_air_temp_range
+        rel_humidity_range = Water._evaporation_rel_humidity_range
+        trusted = (surface_area == self.fish_tank.water_surface_area
+                   and air_temp_range.lower_bound <= air_temp <= air_temp_range.upper_bound
+                   and rel_humidity_range.lower_bound <= rel_humidity <= rel_humidity_range.upper_bound)
+        water_evaporated_amount = self.fish_tank.evaporate(air_temp, surface_area, rel_humidity, time_elapsed_sec,
+                                                           trusted=trusted, dry_out=True)
         if self.simulation_data.get('water_evaporated') is None:
-            self.simulation_data['water_evaporated'] = []
+            self.simulation_data['water_evaporated'] = TimeSeries()
         self.simulation_data['water_evaporated'].append(water_evaporated_amount)
 
     async def plot_sim_data(self,
                             plot_name: str,
                             y_label: str,
-                            data_reference: list,
+                            data_reference: list | TimeSeries,
                             main_plot: bool = False,
                             monitor_width=3840,
                             monitor_height=1920):
@@ -101,7 +123,7 @@ class FishTankSimulator(metaclass=SimulatorMeta):
         Args:
             plot_name (str): The title of the plot.
             y_label (str): The label for the plot's vertical axis.
-            data_reference (list): A list that stores the data points to be plotted over time.
+            data_reference (list | TimeSeries): The series that stores the data points to be plotted over time.
             main_plot (bool, optional): Indicates whether this is the main plot. Defaults to False.
             monitor_width (int, optional): Width of the monitor in pixels. Defaults to 3840.
             monitor_height (int, optional): Height of the monitor in pixels. Defaults to 1920.
@@ -111,90 +133,49 @@ class FishTankSimulator(metaclass=SimulatorMeta):
             - Updates the plot in real time as data points are appended to `data_reference`.
             - Runs indefinitely until the simulation ends or the task is canceled.
         """
-        plt.ion()  # Enable interactive mode to allow non-blocking updates
-        dpi = 100  # Assuming 100 DPI (dots per inch)
-        width = monitor_width / 6
-        height = ((monitor_height / 3) * 2) / 4
-        if main_plot:
-            width = monitor_width
-            height = monitor_height / 3
-        # Create a new figure and axis for the plot with custom size
-        fig, ax = plt.subplots(figsize=(width / dpi, height / dpi))
-        ax.set_title(plot_name)  # Set the plot title
-        ax.set_xlabel("Time Steps")  # Label for the horizontal axis
-        ax.set_ylabel(f'{y_label} liters')  # Label for the vertical axis
-        fig.canvas.manager.set_window_title(plot_name)  # Set window title
-
-        plt.pause(1)
-        x, y = 0, 0
-        if not main_plot:
-            y = monitor_height / 3 + 35
-            if 'rain' in plot_name:
-                row_counter = 0
-                for row, columns_lst in self.plot_grid.get('rain_section').items():
-                    if len(columns_lst) < 3:
-                        y += row_counter * height + 30 * row_counter
-                        x = len(columns_lst) * width
-                        columns_lst.append((x, y))
-                        break
-                    else:
-                        row_counter += 1
-            elif 'snow' in plot_name:
-                row_counter = 0
-                for row, columns_lst in self.plot_grid.get('snow_section').items():
-                    if len(columns_lst) < 3:
-                        y += row_counter * height + 30 * row_counter
-                        x = len(columns_lst) * width + (monitor_width / 2)
-                        columns_lst.append((x, y))
-                        break
-                    else:
-                        row_counter += 1
-
-        def move_window(event):
-            manager = event.canvas.manager
-            if hasattr(manager, 'window') and isinstance(manager.window, tkinter.Tk):
-                manager.window.wm_geometry(f"+{int(x)}+{int(y)}")
-                # Remove plot elements (toolbar, axis, etc.)
-                manager.toolbar.pack_forget()  # Hides the toolbar
-
-        # Inside the `plot_sim_data` method, after creating `fig`:
-        fig.canvas.mpl_connect("draw_event", move_window)
-
-        plt.show(block=False)  # Show the plot window without blocking execution
-        prev_len = 0  # Track the length of data_reference to detect new data points
-
-        while True:
-            if len(data_reference) > prev_len:  # Check if new data has been added
-                ax.clear()  # Clear the previous plot
-                ax.plot(range(1, len(data_reference) + 1),
-                        data_reference,
-                        label=y_label)  # Plot new data
-                ax.legend()  # Add legend to the plot
-
-                plt.pause(0.001)  # Pause briefly to render the plot
-                fig.canvas.draw_idle()  # Mark the figure as needing a refresh
-                fig.canvas.flush_events()  # Flush GUI events to update the canvas
-
-                prev_len = len(data_reference)  # Update the tracked data length
-
-            await asyncio.sleep(1)  # Wait for 1 second before checking for new data again
+        from src.simulation.plotting import plot_series
+
+        await plot_series(plot_name, y_label, data_reference, None, main_plot, monitor_width, monitor_height)
 
     def apply_seasonal_weather_data_to_sim(self, sim_date_time, sampling_rate):
+        """
+        Applies the latest weather values found in the shared simulation data to the fish tank.
 
-        precipitation_volume = self.simulation_data.get('precipitation_volume')
-        if precipitation_volume:
-            precipitation_volume = precipitation_volume[-1]
-            if precipitation_volume > 0:
-                self.fish_tank.add_water(precipitation_volume)
+        Used when the simulator runs without a `weather_channel`; the values are read from the last
+        element of the `precipitation_volume`, `air_temperature` and `relative_humidity` series.
 
+        Args:
+            sim_date_time (datetime): The current simulated date and time.
+            sampling_rate (int): The time step in seconds.
+        """
+        precipitation_volume = self.simulation_data.get('precipitation_volume')
+        precipitation_volume = precipitation_volume[-1] if precipitation_volume else 0
         air_temp = self.simulation_data.get('air_temperature')
-        if air_temp:
-            air_temp = air_temp[-1]
-            if air_temp > 0:
-                rel_humidity = self.simulation_data.get('relative_humidity')
-                if rel_humidity:
-                    rel_humidity = rel_humidity[-1]
-                    self.simulate_evaporation(air_temp, self.fish_tank.water_surface_area, rel_humidity, sampling_rate)
+        air_temp = air_temp[-1] if air_temp else None
+        rel_humidity = self.simulation_data.get('relative_humidity')
+        rel_humidity = rel_humidity[-1] if rel_humidity else None
+        self.apply_weather_step(precipitation_volume, air_temp, rel_humidity, sampling_rate)
+
+    def apply_weather_step(self, precipitation_volume, air_temp, rel_humidity, sampling_rate):
+        """
+        Applies the weather of one simulation step to the fish tank.
+
+        Precipitation is added to the tank, the water that does not fit spilling into its
+        `overflow_volume`, and, above 0°C, water evaporates according to the air temperature and
+        relative humidity.
+
+        Args:
+            precipitation_volume (float): The precipitation of the step in liters.
+            air_temp (float | None): The air temperature of the step in degrees Celsius.
+            rel_humidity (float | None): The relative humidity (0–1) of the step.
+            sampling_rate (int): The time step in seconds.
+        """
+        if precipitation_volume > 0:
+            # Rain falling on a full tank spills over instead of being rejected
+            self.fish_tank.apply_flows((precipitation_volume,))
+
+        if air_temp is not None and air_temp > 0 and rel_humidity is not None:
+            self.simulate_evaporation(air_temp, self.fish_tank.water_surface_area, rel_humidity, sampling_rate)
 
     def detect_sim_data(self, sim_data, name: str = None):
         """
@@ -211,7 +192,7 @@ class FishTankSimulator(metaclass=SimulatorMeta):
         for key, sim_data in sim_data.items():
             if isinstance(sim_data, dict):
                 plot_tasks.update(self.detect_sim_data(sim_data, name=key))
-            elif isinstance(sim_data, list):
+            elif isinstance(sim_data, (list, TimeSeries)):
                 plot_name = f'Plot {name if name is not None else ""} {key}'
                 if plot_name not in self.plot_tasks:
                     # Start the plotting coroutine
@@ -223,7 +204,85 @@ class FishTankSimulator(metaclass=SimulatorMeta):
                     )
         return plot_tasks
 
-    async def simulate(self, simulation_config: dict, plot: bool = False):
+    def prepare(self, simulation_config: dict):
+        """
+        Prepares the simulator for a run of `simulation_config` by creating the `tank_water_volume` series.
+
+        Args:
+            simulation_config (dict): The simulation configuration (start date, duration, sampling).
+        """
+        _, sim_duration, sampling_rate = get_date_time_simulation_data(simulation_config)
+        if self.simulation_data.get('tank_water_volume') is None:
+            self.simulation_data['tank_water_volume'] = TimeSeries(capacity=sim_duration // sampling_rate)
+
+    def step(self, sim_date_time, sampling_rate: int):
+        """
+        Simulates one time step of the fish tank.
+
+        With a `weather_channel` attached, consumes the weather step published for `sim_date_time`;
+        otherwise applies the latest weather found in the shared simulation data. Errors raised by
+        the tank while applying the weather are reported and do not stop the simulation.
+
+        Args:
+            sim_date_time (datetime): The simulated date and time of the step.
+            sampling_rate (int): The time step in seconds.
+
+        Raises:
+            ValueError: If the weather channel does not hold the step of `sim_date_time`.
+        """
+        weather_step = None
+        if self.weather_channel is not None:
+            # Consume exactly the weather step of the current simulated date and time
+            weather_step = self.weather_channel.get_nowait(sim_date_time)
+        try:
+            if weather_step is not None:
+                _, precipitation_volume, air_temp, rel_humidity = weather_step
+                self.apply_weather_step(precipitation_volume, air_temp, rel_humidity, sampling_rate)
+            else:
+                self.apply_seasonal_weather_data_to_sim(sim_date_time, sampling_rate)
+        except Exception as e:
+            print(f'Error applying seasonal weather data: {e}')
+            traceback.print_exc()
+
+        # Update tank water volume data
+        self.simulation_data['tank_water_volume'].append(self.fish_tank.current_volume)
+        self.simulated_seconds += sampling_rate
+
+    def integrate_water_balance(self, weather: dict, simulation_config: dict, **kwargs) -> dict:
+        """
+        Simulates the fish tank over the whole horizon by integrating its water balance with adaptive steps.
+
+        Replaces the step-by-step loop when the weather of the whole horizon is known in advance (see
+        `SeasonalWeatherSimulator.precomputed_weather`): the precipitation flows into the tank and evaporates
+        above 0°C as in `apply_weather_step`, but quiet stretches are crossed in a few integration steps.
+        Precipitation beyond the tank capacity overflows instead of being rejected. The `tank_water_volume`
+        series still receives the volume at the end of every sample, interpolated from the integration steps.
+
+        Args:
+            weather (dict): The precipitation volume, air temperature and relative humidity of every sample
+                (see `SeasonalWeatherGenerator.generate`).
+            simulation_config (dict): The simulation configuration (start date, duration, sampling).
+            **kwargs: The tolerances and maximum step of the `WaterBalance` integration.
+
+        Returns:
+            dict: The integration result (see `WaterBalance.integrate`).
+        """
+        from src.simulation.water.water_balance import WaterBalance
+
+        _, _, sampling_rate = get_date_time_simulation_data(simulation_config)
+        self.prepare(simulation_config)
+        precipitation_volume = weather['precipitation_volume']
+        water_balance = WaterBalance(self.fish_tank, self.fish_tank.water_surface_area, sampling_rate,
+                                     precipitation_volume, np.zeros(len(precipitation_volume)),
+                                     weather['air_temperature'], weather['relative_humidity'], **kwargs)
+        result = water_balance.integrate()
+        sample_ends = np.arange(1, len(precipitation_volume) + 1) * sampling_rate
+        volumes = np.clip(WaterBalance.sample_volume(result, sample_ends), 0, self.fish_tank.tank_capacity)
+        self.simulation_data['tank_water_volume'].extend(volumes.tolist())
+        self.simulated_seconds += water_balance.duration
+        return result
+
+    async def simulate(self, simulation_config: dict, plot: bool = False, headless: bool = False):
         """
         Runs the fish tank simulation for the configured duration.
     
@@ -232,26 +291,31 @@ class FishTankSimulator(metaclass=SimulatorMeta):
         plotting tasks.
     
         Uses asynchronous operations to update plots during each simulation step.
+
+        Args:
+            simulation_config (dict): The simulation configuration (start date, duration, sampling).
+            plot (bool, optional): Enables real-time plotting of the simulation data. Defaults to False.
+            headless (bool, optional): Runs the simulation as fast as possible without plotting, yielding to the
+                event loop only every `yield_every_n_steps` steps or `yield_time_budget` seconds. Defaults to False.
         """
         start_date_time, sim_duration, sampling_rate = get_date_time_simulation_data(simulation_config)
         date_time = start_date_time
+        yielder = get_event_loop_yielder(simulation_config) if headless else None
+        plot = plot and not headless
+        self.prepare(simulation_config)
 
         while self.simulated_seconds < sim_duration:
             if plot:
                 self.plot_tasks.update(self.detect_sim_data(self.simulation_data))
-            try:
-                self.apply_seasonal_weather_data_to_sim(date_time, sampling_rate)
-            except Exception as e:
-                print(f'Error applying seasonal weather data: {e}')
-                traceback.print_exc()
-
-            # Update tank water volume data
-            if self.simulation_data.get('tank_water_volume') is None:
-                self.simulation_data['tank_water_volume'] = []
-            self.simulation_data['tank_water_volume'].append(self.fish_tank.current_volume)
+            if self.weather_channel is not None:
+                # Wait for the weather step of the current simulated date and time
+                await self.weather_channel.wait_not_empty()
+            self.step(date_time, sampling_rate)
 
             # Simulate async time progression
-            await asyncio.sleep(0.001)  # Speed up time.
+            if headless:
+                await yielder.tick()
+            else:
+                await asyncio.sleep(0.001)  # Speed up time.
 
-            self.simulated_seconds += sampling_rate
             date_time += timedelta(seconds=sampling_rate)
@@ -0,0 +1,116 @@
+import asyncio
+
+_pyplot = None
+
+
+def get_pyplot():
+    """
+    Imports and configures matplotlib on first use.
+
+    The Tkinter backend and the dark background style are only set up when a plot is actually requested,
+    so importing the simulators stays cheap and works without a display.
+
+    Returns:
+        module: The `matplotlib.pyplot` module.
+    """
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+
+        matplotlib.use('TkAgg')  # Explicitly use the Tkinter-based backend
+        import matplotlib.pyplot as plt
+
+        plt.style.use('dark_background')  # Use the dark background style
+        _pyplot = plt
+    return _pyplot
+
+
+async def plot_series(plot_name: str,
+                      y_label: str,
+                      data_reference,
+                      plot_grid: dict = None,
+                      main_plot: bool = False,
+                      monitor_width=3840,
+                      monitor_height=1920):
+    """
+    Asynchronously generates a real-time line plot for simulation data.
+
+    Args:
+        plot_name (str): The title of the plot.
+        y_label (str): The label for the plot's vertical axis.
+        data_reference (list | TimeSeries): The series that stores the data points to be plotted over time.
+        plot_grid (dict, optional): The window positions already taken by the 'rain_section' and 'snow_section'
+            plots, updated in place. Without a grid secondary plots are not positioned.
+        main_plot (bool, optional): Indicates whether this is the main plot. Defaults to False.
+        monitor_width (int, optional): Width of the monitor in pixels. Defaults to 3840.
+        monitor_height (int, optional): Height of the monitor in pixels. Defaults to 1920.
+    """
+    import tkinter
+
+    plt = get_pyplot()
+    plt.ion()  # Enable interactive mode to allow non-blocking updates
+    dpi = 100  # Assuming 100 DPI (dots per inch)
+    width = monitor_width / 6
+    height = ((monitor_height / 3) * 2) / 4
+    if main_plot:
+        width = monitor_width
+        height = monitor_height / 3
+    # Create a new figure and axis for the plot with custom size
+    fig, ax = plt.subplots(figsize=(width / dpi, height / dpi))
+    ax.set_title(plot_name)  # Set the plot title
+    ax.set_xlabel("Time Steps")  # Label for the horizontal axis
+    ax.set_ylabel(f'{y_label} liters')  # Label for the vertical axis
+    fig.canvas.manager.set_window_title(plot_name)  # Set window title
+
+    plt.pause(1)
+    x, y = 0, 0
+    if not main_plot and plot_grid is not None:
+        y = monitor_height / 3 + 35
+        if 'rain' in plot_name:
+            row_counter = 0
+            for row, columns_lst in plot_grid.get('rain_section').items():
+                if len(columns_lst) < 3:
+                    y += row_counter * height + 30 * row_counter
+                    x = len(columns_lst) * width
+                    columns_lst.append((x, y))
+                    break
+                else:
+                    row_counter += 1
+        elif 'snow' in plot_name:
+            row_counter = 0
+            for row, columns_lst in plot_grid.get('snow_section').items():
+                if len(columns_lst) < 3:
+                    y += row_counter * height + 30 * row_counter
+                    x = len(columns_lst) * width + (monitor_width / 2)
+                    columns_lst.append((x, y))
+                    break
+                else:
+                    row_counter += 1
+
+    def move_window(event):
+        manager = event.canvas.manager
+        if hasattr(manager, 'window') and isinstance(manager.window, tkinter.Tk):
+            manager.window.wm_geometry(f"+{int(x)}+{int(y)}")
+            # Remove plot elements (toolbar, axis, etc.)
+            manager.toolbar.pack_forget()  # Hides the toolbar
+
+    fig.canvas.mpl_connect("draw_event", move_window)
+
+    plt.show(block=False)  # Show the plot window without blocking execution
+    prev_len = 0  # Track the length of data_reference to detect new data points
+
+    while True:
+        if len(data_reference) > prev_len:  # Check if new data has been added
+            ax.clear()  # Clear the previous plot
+            ax.plot(range(1, len(data_reference) + 1),
+                    data_reference,
+                    label=y_label)  # Plot new data
+            ax.legend()  # Add legend to the plot
+
+            plt.pause(0.001)  # Pause briefly to render the plot
+            fig.canvas.draw_idle()  # Mark the figure as needing a refresh
+            fig.canvas.flush_events()  # Flush GUI events to update the canvas
+
+            prev_len = len(data_reference)  # Update the tracked data length
+
+        await asyncio.sleep(1)  # Wait for 1 second before checking for new data again
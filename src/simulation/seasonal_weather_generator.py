@@ -0,0 +1,170 @@
+import math
+import numpy as np
+from src.simulation.common import get_date_time_simulation_data
+
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December")
+
+
+class SeasonalWeatherGenerator:
+    """
+    A vectorized engine that generates the weather of a whole simulation horizon in one batched call.
+
+    The generator is driven by the same monthly `seasonal_weather_data` and `roof_surface` used by
+    `SeasonalWeatherSimulator` and reproduces its step-by-step model with NumPy arrays:
+
+    - Air temperature is the hourly monthly temperature plus a uniform noise in [-1, 1].
+    - Relative humidity is the hourly monthly relative humidity expressed as a fraction.
+    - Precipitation happens on 4 out of 10 steps; it is rain above 3°C and snow otherwise.
+    - Each precipitation sample takes a randomized share of the precipitation left for the month
+      over the precipitation seconds left for the month, modulated by a sinusoidal cycle.
+
+    The month's remaining precipitation shrinks geometrically with each sample, so it is computed
+    with a cumulative product instead of a running sum. For snow the remaining share of the month's
+    snow (in mm) is tracked and converted to liters with the snow density of the current step.
+
+    Attributes:
+        seasonal_weather_data (dict): Monthly weather data keyed by month name.
+        roof_surface (int | float): The roof surface collecting precipitation, in square meters.
+        rng (numpy.random.Generator): The random generator used for all draws.
+    """
+
+    def __init__(self, seasonal_weather_data: dict, roof_surface: int | float, rng: np.random.Generator = None):
+        if not isinstance(seasonal_weather_data, dict) or not seasonal_weather_data:
+            raise ValueError("Seasonal weather data must be a non-empty dictionary.")
+        if not isinstance(roof_surface, (int, float)) or roof_surface < 0:
+            raise ValueError("Roof surface must be a non-negative numeric value.")
+        self.seasonal_weather_data = seasonal_weather_data
+        self.roof_surface = roof_surface
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    @staticmethod
+    def calculate_snow_density(air_temp: np.ndarray) -> np.ndarray:
+        """
+        Vectorized counterpart of `SeasonalWeatherSimulator.calculate_snow_density`.
+
+        Args:
+            air_temp (numpy.ndarray): Air temperatures in degrees Celsius.
+
+        Returns:
+            numpy.ndarray: Snow densities (0.1 powder snow, 0.3 wet snow, 0.5 slush).
+        """
+        return np.where(air_temp < -5, 0.1, np.where(air_temp <= 0, 0.3, 0.5))
+
+    def _monthly_tables(self):
+        """
+        Builds (12, 24) hourly tables and (12,) precipitation tables indexed by month number - 1.
+        Months missing from the seasonal data are filled with NaN and rejected in `generate`.
+        """
+        temperature = np.full((12, 24), np.nan)
+        relative_humidity = np.full((12, 24), np.nan)
+        precipitation = {key: np.full((12, 2), np.nan) for key in ('rain', 'snow')}
+        for month_index, month in enumerate(MONTH_NAMES):
+            month_data = self.seasonal_weather_data.get(month)
+            if month_data is None:
+                continue
+            temperature[month_index] = month_data['temperature']
+            relative_humidity[month_index] = month_data['relative_humidity']
+            for key, table in precipitation.items():
+                table[month_index] = (month_data[key]['average_days'], month_data[key]['total_mm'])
+        return temperature, relative_humidity, precipitation
+
+    @staticmethod
+    def _distribute_precipitation(mask: np.ndarray,
+                                  month_index: np.ndarray,
+                                  budget_liters: np.ndarray,
+                                  average_days: np.ndarray,
+                                  random_weight: np.ndarray,
+                                  pattern_weight: np.ndarray,
+                                  sampling_rate: int) -> np.ndarray:
+        """
+        Distributes each month's precipitation budget over the steps selected by `mask`.
+
+        Args:
+            mask (numpy.ndarray): Boolean mask of the steps receiving this precipitation type.
+            month_index (numpy.ndarray): Month number - 1 of every step.
+            budget_liters (numpy.ndarray): The month's precipitation budget in liters, for every step.
+            average_days (numpy.ndarray): The month's average precipitation days, for every step.
+            random_weight (numpy.ndarray): Uniform [0.5, 1.5] weights for every step.
+            pattern_weight (numpy.ndarray): Uniform [0.7, 1.3] weights for every step.
+            sampling_rate (int): The time step in seconds.
+
+        Returns:
+            numpy.ndarray: The precipitation amount in liters of every step (0 outside `mask`).
+        """
+        amounts = np.zeros(mask.shape[0])
+        steps = np.flatnonzero(mask)
+        for month in np.unique(month_index[steps]):
+            month_steps = steps[month_index[steps] == month]
+            # Seconds of precipitation left for the month before each sample
+            seconds_remaining = np.maximum(
+                average_days[month_steps] * 24 * 60 * 60 - np.arange(month_steps.size) * sampling_rate, 0)
+            cyclic_variation = np.maximum(
+                0.5, np.sin(2 * math.pi * (1 - seconds_remaining / (30 * 24 * 60 * 60))) + 1)
+            share = np.divide(random_weight[month_steps] * sampling_rate * cyclic_variation * pattern_weight[month_steps],
+                              seconds_remaining,
+                              out=np.zeros(month_steps.size),
+                              where=seconds_remaining > 0)
+            # Fraction of the month's budget left before each sample (exclusive cumulative product)
+            remaining_fraction = np.ones(month_steps.size)
+            np.cumprod(np.maximum(1 - share[:-1], 0), out=remaining_fraction[1:])
+            remaining_liters = budget_liters[month_steps] * remaining_fraction
+            active = (np.round(remaining_liters) > 0) & (np.round(seconds_remaining) > 0)
+            amounts[month_steps] = np.where(active, remaining_liters * share, 0)
+        return amounts
+
+    def generate(self, simulation_config: dict) -> dict:
+        """
+        Generates the weather of the whole configured simulation horizon.
+
+        Args:
+            simulation_config (dict): The simulation configuration (start date, duration and sampling).
+
+        Returns:
+            dict: A dictionary of NumPy arrays with one entry per simulation step:
+                - 'air_temperature': Air temperature in degrees Celsius.
+                - 'relative_humidity': Relative humidity as a fraction (0-1).
+                - 'precipitation_event': True where the step draws precipitation (rain or snow).
+                - 'rain': Rain amount in liters.
+                - 'snow': Snow amount in liters of water equivalent.
+                - 'precipitation_volume': Rain plus snow in liters.
+                - 'month': Month number (1-12).
+
+        Raises:
+            ValueError: If the horizon covers a month missing from the seasonal weather data.
+        """
+        start_date_time, sim_duration, sampling_rate = get_date_time_simulation_data(simulation_config)
+        steps = -(-sim_duration // sampling_rate)
+        date_times = np.datetime64(start_date_time, 's') + np.arange(steps) * np.timedelta64(sampling_rate, 's')
+        month_index = date_times.astype('datetime64[M]').astype(np.int64) % 12
+        hour = (date_times - date_times.astype('datetime64[D]')).astype('timedelta64[h]').astype(np.int64)
+
+        temperature, relative_humidity, precipitation = self._monthly_tables()
+        missing_months = [MONTH_NAMES[month] for month in np.unique(month_index) if np.isnan(temperature[month, 0])]
+        if missing_months:
+            raise ValueError(f"Missing seasonal weather data for {', '.join(missing_months)}")
+
+        air_temperature = temperature[month_index, hour] + self.rng.uniform(-1, 1, steps)
+        precipitation_event = self.rng.integers(0, 10, steps) <= 3
+        random_weight = self.rng.uniform(0.5, 1.5, steps)
+        pattern_weight = self.rng.uniform(0.7, 1.3, steps)
+
+        rain_mask = precipitation_event & (air_temperature > 3)
+        snow_mask = precipitation_event & ~(air_temperature > 3)
+        rain_days, rain_mm = precipitation['rain'][month_index].T
+        snow_days, snow_mm = precipitation['snow'][month_index].T
+        rain = self._distribute_precipitation(rain_mask, month_index, rain_mm * self.roof_surface, rain_days,
+                                              random_weight, pattern_weight, sampling_rate)
+        snow = self._distribute_precipitation(snow_mask, month_index,
+                                              snow_mm * self.roof_surface * self.calculate_snow_density(
+                                                  air_temperature),
+                                              snow_days, random_weight, pattern_weight, sampling_rate)
+        return {
+            'air_temperature': air_temperature,
+            'relative_humidity': relative_humidity[month_index, hour] / 100,
+            'precipitation_event': precipitation_event,
+            'rain': rain,
+            'snow': snow,
+            'precipitation_volume': rain + snow,
+            'month': month_index + 1,
+        }
@@ -1,14 +1,22 @@
 import math
-import tkinter
-import matplotlib.pyplot as plt
 import asyncio
-import matplotlib
-import random
 from datetime import datetime, timedelta
-from src.simulation.common import get_date_time_simulation_data
-
-matplotlib.use('TkAgg')  # Explicitly use the Tkinter-based backend
-plt.style.use('dark_background')  # Use the dark background style
+from src.simulation.common import get_date_time_simulation_data, get_event_loop_yielder, TimeSeries, BatchedRandom
+
+MONTH_MAPPING = {
+    1: "January",
+    2: "February",
+    3: "March",
+    4: "April",
+    5: "May",
+    6: "June",
+    7: "July",
+    8: "August",
+    9: "September",
+    10: "October",
+    11: "November",
+    12: "December"
+}
 
 
 class SeasonalWeatherSimulatorMeta(type):
@@ -42,6 +50,16 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
         super().__init__()
         self.simulation_data = dict()
         self.simulated_seconds = 0
+        # Weather conditions of the current simulation step
+        self.air_temperature = None
+        self.relative_humidity = None
+        # Optional channel publishing every simulation step to consumers (e.g. the fish tank simulator)
+        self.weather_channel = None
+        # Random streams of the simulator: `rng` drives the vectorized engine, `random` the stepwise one
+        self.rng = None
+        self.random = BatchedRandom()
+        self._precomputed_weather = None
+        self._step_index = 0
         self.plot_tasks = dict()
         self.roof_surface = 0
         self.plot_grid = {
@@ -57,6 +75,17 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
                 "row_4": []}
             }
 
+    @property
+    def precomputed_weather(self) -> dict | None:
+        """
+        Get the weather of the whole horizon precomputed by `prepare` with the vectorized engine.
+
+        Returns:
+            dict | None: The weather series as lists (see `SeasonalWeatherGenerator.generate`), or None when the
+                weather is simulated step by step.
+        """
+        return self._precomputed_weather
+
     @staticmethod
     def calculate_snow_density(temp: float) -> float:
         """
@@ -101,11 +130,13 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
             float: The amount of precipitation added to the water tank.
         """
         precipitation_season_data = month_season_data.get(precipitation_type)
+        # The month's series keeps a running total, so the totals below cost O(1)
+        precipitation_series = self.simulation_data.get(precipitation_type).get(month)
+        precipitation_total, precipitation_count = precipitation_series.total, len(precipitation_series)
         # Calculate the total remaining precipitation seconds based on average days
         total_precipitation_days = precipitation_season_data.get('average_days')
         total_precipitation_seconds_remaining = max(
-            ((total_precipitation_days * 24 * 60 * 60) - len(
-                self.simulation_data.get(precipitation_type).get(month) * sampling_rate), 0))
+            ((total_precipitation_days * 24 * 60 * 60) - precipitation_count * sampling_rate, 0))
 
         # Calculate the total precipitation amount in liters
         total_precipitation_amount_mm = precipitation_season_data.get('total_mm')
@@ -120,26 +151,26 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
 
         # Calculate remaining precipitation amount
         remaining_precipitation_amount_liters = max(
-            (total_precipitation_amount_liters - sum(self.simulation_data.get(precipitation_type).get(month)), 0))
+            (total_precipitation_amount_liters - precipitation_total, 0))
 
         # If there is remaining precipitation, simulate distribution over seconds
         if round(remaining_precipitation_amount_liters) > 0 and round(total_precipitation_seconds_remaining) > 0:
             # Use randomized weighting to simulate varying precipitation over the remaining time
-            random_weight = random.uniform(0.5, 1.5)  # Random weight introduces variability
+            random_weight = self.random.uniform(0.5, 1.5)  # Random weight introduces variability
             remaining_precipitation_amount_liters_second = (
                     (remaining_precipitation_amount_liters / total_precipitation_seconds_remaining) *
                     random_weight * sampling_rate
             )
 
             # Further randomize precipitation patterns (steady or intermittent)
-            precipitation_patterns = ['steady', 'intermittent'][random.randrange(0, 2)]
+            precipitation_patterns = ['steady', 'intermittent'][self.random.randrange(0, 2)]
 
             # Optionally, add phasic or cyclic variation (simulate peaks and troughs like real weather events)
             cyclic_variation = max(0.5, math.sin(
                 2 * math.pi * (1 - total_precipitation_seconds_remaining / (
                             30 * 24 * 60 * 60))) + 1)  # Sinusoidal variation
             precipitation_amount = (
-                    random.uniform(0.7, 1.3) *
+                    self.random.uniform(0.7, 1.3) *
                     remaining_precipitation_amount_liters_second *
                     cyclic_variation
             )
@@ -147,87 +178,42 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
             return precipitation_amount
         return 0
 
+    def record_precipitation(self, precipitation_type: str, month: str, amount: float):
+        """
+        Appends a precipitation sample to the simulation data.
+
+        The samples are stored in the `TimeSeries` of `simulation_data[precipitation_type][month]`, which
+        keeps the raw values for plotting and export together with a running total and count, so that
+        `simulate_precipitation` runs in constant time.
+
+        Args:
+            precipitation_type (str): The type of precipitation ('rain' or 'snow').
+            month (str): The month the sample belongs to.
+            amount (float): The precipitation amount in liters.
+        """
+        self.simulation_data[precipitation_type][month].append(amount)
+
     async def plot_sim_data(self,
                             plot_name: str,
                             y_label: str,
-                            data_reference: list,
+                            data_reference: list | TimeSeries,
                             main_plot: bool = False,
                             monitor_width=3840,
                             monitor_height=1920):
-        plt.ion()  # Enable interactive mode to allow non-blocking updates
-        dpi = 100  # Assuming 100 DPI (dots per inch)
-        width = monitor_width / 6
-        height = ((monitor_height / 3) * 2) / 4
-        if main_plot:
-            width = monitor_width
-            height = monitor_height / 3
-        # Create a new figure and axis for the plot with custom size
-        fig, ax = plt.subplots(figsize=(width / dpi, height / dpi))
-        ax.set_title(plot_name)  # Set the plot title
-        ax.set_xlabel("Time Steps")  # Label for the horizontal axis
-        ax.set_ylabel(f'{y_label} liters')  # Label for the vertical axis
-        fig.canvas.manager.set_window_title(plot_name)  # Set window title
-
-        plt.pause(1)
-        x, y = 0, 0
-        if not main_plot:
-            y = monitor_height / 3 + 35
-            if 'rain' in plot_name:
-                row_counter = 0
-                for row, columns_lst in self.plot_grid.get('rain_section').items():
-                    if len(columns_lst) < 3:
-                        y += row_counter * height + 30 * row_counter
-                        x = len(columns_lst) * width
-                        columns_lst.append((x, y))
-                        break
-                    else:
-                        row_counter += 1
-            elif 'snow' in plot_name:
-                row_counter = 0
-                for row, columns_lst in self.plot_grid.get('snow_section').items():
-                    if len(columns_lst) < 3:
-                        y += row_counter * height + 30 * row_counter
-                        x = len(columns_lst) * width + (monitor_width / 2)
-                        columns_lst.append((x, y))
-                        break
-                    else:
-                        row_counter += 1
-
-        def move_window(event):
-            manager = event.canvas.manager
-            if hasattr(manager, 'window') and isinstance(manager.window, tkinter.Tk):
-                manager.window.wm_geometry(f"+{int(x)}+{int(y)}")
-                # Remove plot elements (toolbar, axis, etc.)
-                manager.toolbar.pack_forget()  # Hides the toolbar
-
-        # Inside the `plot_sim_data` method, after creating `fig`:
-        fig.canvas.mpl_connect("draw_event", move_window)
-
-        plt.show(block=False)  # Show the plot window without blocking execution
-        prev_len = 0  # Track the length of data_reference to detect new data points
-
-        while True:
-            if len(data_reference) > prev_len:  # Check if new data has been added
-                ax.clear()  # Clear the previous plot
-                ax.plot(range(1, len(data_reference) + 1),
-                        data_reference,
-                        label=y_label)  # Plot new data
-                ax.legend()  # Add legend to the plot
-
-                plt.pause(0.001)  # Pause briefly to render the plot
-                fig.canvas.draw_idle()  # Mark the figure as needing a refresh
-                fig.canvas.flush_events()  # Flush GUI events to update the canvas
-
-                prev_len = len(data_reference)  # Update the tracked data length
-
-            await asyncio.sleep(1)  # Wait for 1 second before checking for new data again
+        """
+        Asynchronously generates a real-time line plot for simulation data, placing secondary plots on the
+        rain and snow sections of `plot_grid`. Matplotlib is only imported when the first plot is created.
+        """
+        from src.simulation.plotting import plot_series
+
+        await plot_series(plot_name, y_label, data_reference, self.plot_grid, main_plot, monitor_width, monitor_height)
 
     def detect_sim_data(self, sim_data, name: str = None):
         plot_tasks = dict()
         for key, sim_data in sim_data.items():
             if isinstance(sim_data, dict):
                 plot_tasks.update(self.detect_sim_data(sim_data, name=key))
-            elif isinstance(sim_data, list):
+            elif isinstance(sim_data, (list, TimeSeries)):
                 plot_name = f'Plot {name if name is not None else ""} {key}'
                 if plot_name not in self.plot_tasks:
                     # Start the plotting coroutine
@@ -250,35 +236,24 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
             sim_date_time (datetime): The current simulated date and time.
             sampling_rate (int): The time step in seconds for data sampling.
         """
-        month_mapping = {
-            1: "January",
-            2: "February",
-            3: "March",
-            4: "April",
-            5: "May",
-            6: "June",
-            7: "July",
-            8: "August",
-            9: "September",
-            10: "October",
-            11: "November",
-            12: "December"
-        }
-        month = month_mapping[sim_date_time.month]
+        month = MONTH_MAPPING[sim_date_time.month]
         hour = sim_date_time.hour
         month_season_data = self.seasonal_weather_data.get(month)
-        air_temp = month_season_data.get('temperature')[hour] + random.uniform(-1, 1)
+        air_temp = month_season_data.get('temperature')[hour] + self.random.uniform(-1, 1)
+        rel_humidity = month_season_data.get('relative_humidity')[hour] / 100
+        self.air_temperature = air_temp
+        self.relative_humidity = rel_humidity
 
         if self.simulation_data.get('rain') is None:
             self.simulation_data['rain'] = {}
         if self.simulation_data.get('rain').get(month) is None:
-            self.simulation_data['rain'][month] = []
+            self.simulation_data['rain'][month] = TimeSeries()
         if self.simulation_data.get('snow') is None:
             self.simulation_data['snow'] = {}
         if self.simulation_data.get('snow').get(month) is None:
-            self.simulation_data['snow'][month] = []
+            self.simulation_data['snow'][month] = TimeSeries()
 
-        randomize_precipitation = random.randrange(0, 10)
+        randomize_precipitation = self.random.randrange(0, 10)
         rain_amount = 0
         snow_amount = 0
         if 0 <= randomize_precipitation <= 3:
@@ -288,46 +263,184 @@ class SeasonalWeatherSimulator(metaclass=SeasonalWeatherSimulatorMeta):
                                                           month_season_data,
                                                           air_temp,
                                                           sampling_rate)
-                self.simulation_data['rain'][month].append(rain_amount)
+                self.record_precipitation('rain', month, rain_amount)
             else:
                 snow_amount = self.simulate_precipitation('snow',
                                                           month,
                                                           month_season_data,
                                                           air_temp,
                                                           sampling_rate)
-                self.simulation_data['snow'][month].append(snow_amount)
+                self.record_precipitation('snow', month, snow_amount)
 
-            if not self.simulation_data.get('air_temperature'):
-                self.simulation_data['air_temperature'] = []
+            if self.simulation_data.get('air_temperature') is None:
+                self.simulation_data['air_temperature'] = TimeSeries()
             self.simulation_data['air_temperature'].append(air_temp)
 
-            if not self.simulation_data.get('relative_humidity'):
-                self.simulation_data['relative_humidity'] = []
-            self.simulation_data['relative_humidity'].append(month_season_data.get('relative_humidity')[hour] / 100)
+            if self.simulation_data.get('relative_humidity') is None:
+                self.simulation_data['relative_humidity'] = TimeSeries()
+            self.simulation_data['relative_humidity'].append(rel_humidity)
+
+        return rain_amount + snow_amount
+
+    def precompute_weather(self, simulation_config: dict, rng=None) -> dict:
+        """
+        Generates the weather of the whole simulation horizon in one batched call.
+
+        Uses the vectorized `SeasonalWeatherGenerator`, driven by the same `seasonal_weather_data` and
+        `roof_surface`, so that the simulation loop only has to replay the precomputed samples.
+
+        Args:
+            simulation_config (dict): The simulation configuration.
+            rng (numpy.random.Generator, optional): The random generator to draw from.
+
+        Returns:
+            dict: The generated weather arrays (see `SeasonalWeatherGenerator.generate`).
+        """
+        from src.simulation.seasonal_weather_generator import SeasonalWeatherGenerator
+
+        generator = SeasonalWeatherGenerator(self.seasonal_weather_data, simulation_config.get('roof_surface'), rng)
+        return generator.generate(simulation_config)
+
+    def apply_precomputed_weather_to_sim(self, weather: dict, step: int, sim_date_time) -> float:
+        """
+        Applies one step of precomputed weather to the simulation data.
+
+        Records the same series as `apply_seasonal_weather_data_to_sim`: rain or snow, air temperature and
+        relative humidity are only recorded on the steps drawing precipitation.
+
+        Args:
+            weather (dict): Precomputed weather series, as lists, indexed by simulation step.
+            step (int): The index of the simulation step.
+            sim_date_time (datetime): The current simulated date and time.
+
+        Returns:
+            float: The precipitation amount of the step in liters.
+        """
+        self.air_temperature = weather['air_temperature'][step]
+        self.relative_humidity = weather['relative_humidity'][step]
+        if not weather['precipitation_event'][step]:
+            return 0
+
+        month = MONTH_MAPPING[sim_date_time.month]
+        for precipitation_type in ('rain', 'snow'):
+            if month not in self.simulation_data.setdefault(precipitation_type, {}):
+                self.simulation_data[precipitation_type][month] = TimeSeries()
+        rain_amount = weather['rain'][step]
+        snow_amount = weather['snow'][step]
+        if weather['air_temperature'][step] > 3:
+            self.record_precipitation('rain', month, rain_amount)
+        else:
+            self.record_precipitation('snow', month, snow_amount)
 
+        if self.simulation_data.get('air_temperature') is None:
+            self.simulation_data['air_temperature'] = TimeSeries()
+            self.simulation_data['relative_humidity'] = TimeSeries()
+        self.simulation_data['air_temperature'].append(weather['air_temperature'][step])
+        self.simulation_data['relative_humidity'].append(weather['relative_humidity'][step])
         return rain_amount + snow_amount
 
-    async def simulate(self, simulation_config: dict, plot: bool = False):
+    def use_random_streams(self, random_streams):
+        """
+        Draws the weather from the 'seasonal_weather' stream of `random_streams`.
+
+        Args:
+            random_streams (RandomStreams): The random streams of the simulation.
+        """
+        self.rng = random_streams.generator('seasonal_weather')
+        self.random = BatchedRandom(self.rng)
+
+    def prepare(self, simulation_config: dict):
+        """
+        Prepares the simulator for a run of `simulation_config`.
+
+        Sets the roof surface, creates the `precipitation_volume` series and, when the configuration sets
+        `"weather_engine": "vectorized"`, precomputes the weather of the whole horizon with
+        `precompute_weather` so that `step` only replays it.
+
+        Args:
+            simulation_config (dict): The simulation configuration (start date, duration, sampling, roof surface).
+        """
+        _, sim_duration, sampling_rate = get_date_time_simulation_data(simulation_config)
+        self.roof_surface = simulation_config.get('roof_surface')
+        self._precomputed_weather = None
+        if simulation_config.get('weather_engine', 'stepwise') == 'vectorized':
+            self._precomputed_weather = {key: series.tolist()
+                                         for key, series in self.precompute_weather(simulation_config, self.rng).items()}
+        self._step_index = 0
+        if self.simulation_data.get('precipitation_volume') is None:
+            self.simulation_data['precipitation_volume'] = TimeSeries(capacity=sim_duration // sampling_rate)
+
+    def step(self, sim_date_time, sampling_rate: int) -> float:
+        """
+        Simulates the weather of one time step.
+
+        Records the precipitation of the step and, when a `weather_channel` is attached, publishes the
+        precipitation, air temperature and relative humidity of the step keyed by `sim_date_time`.
 
+        Args:
+            sim_date_time (datetime): The simulated date and time of the step.
+            sampling_rate (int): The time step in seconds.
+
+        Returns:
+            float: The precipitation amount of the step in liters.
+        """
+        if self._precomputed_weather is not None:
+            precipitation_amount = self.apply_precomputed_weather_to_sim(self._precomputed_weather,
+                                                                         self._step_index,
+                                                                         sim_date_time)
+        else:
+            precipitation_amount = self.apply_seasonal_weather_data_to_sim(sim_date_time, sampling_rate)
+        self.simulation_data['precipitation_volume'].append(precipitation_amount)
+        if self.weather_channel is not None:
+            self.weather_channel.put_nowait(sim_date_time,
+                                            precipitation_amount,
+                                            self.air_temperature,
+                                            self.relative_humidity)
+        self._step_index += 1
+        self.simulated_seconds += sampling_rate
+        return precipitation_amount
+
+    async def simulate(self, simulation_config: dict, plot: bool = False, headless: bool = False):
+        """
+        Runs the seasonal weather simulation for the configured duration.
+
+        Args:
+            simulation_config (dict): The simulation configuration (start date, duration, sampling, roof surface).
+            plot (bool, optional): Enables real-time plotting of the simulation data. Defaults to False.
+            headless (bool, optional): Runs the simulation as fast as possible, without plotting and without
+                waiting for user input at the end. The event loop is only yielded to every
+                `yield_every_n_steps` steps or `yield_time_budget` seconds (see `EventLoopYielder`).
+                Defaults to False.
+
+        Setting `"weather_engine": "vectorized"` in the simulation configuration precomputes the weather of
+        the whole horizon with `precompute_weather` instead of drawing it step by step.
+
+        When a `weather_channel` is attached, the precipitation, air temperature and relative humidity of every
+        step are published to it, keyed by the simulated date and time.
+        """
         start_date_time, sim_duration, sampling_rate = get_date_time_simulation_data(simulation_config)
         date_time = start_date_time
-        self.roof_surface = simulation_config.get('roof_surface')
+        yielder = get_event_loop_yielder(simulation_config) if headless else None
+        plot = plot and not headless
+        self.prepare(simulation_config)
 
         while self.simulated_seconds < sim_duration:
             if plot:
                 self.plot_tasks.update(self.detect_sim_data(self.simulation_data))
 
-            # Update precipitation_volume data
-            if self.simulation_data.get('precipitation_volume') is None:
-                self.simulation_data['precipitation_volume'] = []
-            precipitation_amount = self.apply_seasonal_weather_data_to_sim(date_time, sampling_rate)
-            self.simulation_data['precipitation_volume'].append(precipitation_amount)
+            if self.weather_channel is not None:
+                # Wait for the consumers to catch up before publishing the next step
+                await self.weather_channel.wait_not_full()
+            self.step(date_time, sampling_rate)
 
             # Simulate async time progression
-            await asyncio.sleep(0.001)  # Speed up time.
+            if headless:
+                await yielder.tick()
+            else:
+                await asyncio.sleep(0.001)  # Speed up time.
 
-            self.simulated_seconds += sampling_rate
             date_time += timedelta(seconds=sampling_rate)
 
-        # Prevent process termination
-        input("Simulation completed. Press Enter to exit and close windows.")
+        if not headless:
+            # Prevent process termination
+            input("Simulation completed. Press Enter to exit and close windows.")
@@ -1,4 +1,5 @@
 # sensors.py
+import random
 
 class Sensor:
     """
@@ -44,24 +45,26 @@ class Sensor:
 
 
 class TemperatureSensor(Sensor):
-    def __init__(self, sensor_id, location, precision):
+    def __init__(self, sensor_id, location, precision, rng=None):
         """
         Initialize a TemperatureSensor with specific attributes.
 
         :param sensor_id: Unique identifier for the sensor
         :param location: The location where the sensor is installed
         :param precision: The metrological precision of the sensor
+        :param rng: The random stream of the simulated readings (a `random.Random` or `BatchedRandom`).
+            Defaults to a private, unseeded `random.Random`.
         """
         super().__init__(sensor_id, location)
         self.sensor_id = sensor_id
         self.location = location
         self.precision = precision
         self.temperature = 0.0  # Default temperature value
+        self.rng = rng if rng is not None else random.Random()
 
     def read_temperature(self):
         """
         Simulate reading a temperature. In a real scenario, this would interface with hardware.
         """
         # This is a placeholder for actual temperature reading logic
-        import random
-        self.temperature = random.uniform(20.0, 30.0)
+        self.temperature = self.rng.uniform(20.0, 30.0)
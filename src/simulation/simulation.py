@@ -1,16 +1,17 @@
+import argparse
 import asyncio
 import json
 import os
-from threading import Lock
 from src.simulation.fish_tank_simulation import FishTankSimulator
 from src.simulation.seasonal_weather_simulation import SeasonalWeatherSimulator
+from src.simulation.common import StepChannel, LockstepScheduler, RandomStreams, get_event_loop_yielder
 
 class ArtificialEcosystemSimulator:
-    def __init__(self, configuration_files_path: str, country: str):
+    def __init__(self, configuration_files_path: str, country: str, seed=None):
         self.configuration_files_path = None
         self.simulation_config = None
-        self._simulation_data = dict()
-        self._data_lock = Lock()
+        # Shared by the weather and fish tank simulators, which the lockstep scheduler steps on a single thread
+        self.simulation_data = dict()
         self.configuration_files_lst = self._get_configuration_files(configuration_files_path)
         self._get_simulation_data()
         self.country = country
@@ -18,19 +19,16 @@ class ArtificialEcosystemSimulator:
         self.seasonal_weather_simulator.simulation_data = self.simulation_data
         self.fish_tank_simulator = self._init_fish_tank()
         self.fish_tank_simulator.simulation_data = self.simulation_data
+        # Every component draws from its own stream of the master seed, so runs are reproducible
+        self.random_streams = RandomStreams(seed)
+        self.seasonal_weather_simulator.use_random_streams(self.random_streams)
+        # Step-synchronized weather feed: the fish tank consumes every weather step exactly once
+        self.weather_channel = StepChannel(('precipitation_volume', 'air_temperature', 'relative_humidity'),
+                                           capacity=self.simulation_config.get('weather_channel_capacity', 1024))
+        self.seasonal_weather_simulator.weather_channel = self.weather_channel
+        self.fish_tank_simulator.weather_channel = self.weather_channel
         self.sim_tasks = dict()
 
-    @property
-    def simulation_data(self):
-        with self._data_lock:
-            return self._simulation_data
-
-    @simulation_data.setter
-    def simulation_data(self, new_data: dict):
-        with self._data_lock:
-            self._simulation_data = new_data
-
-    
     def _get_configuration_files(self, path: str):
         base_dir = os.path.dirname(os.path.abspath(__file__))
         config_path = os.path.join(base_dir, path)
@@ -79,28 +77,76 @@ class ArtificialEcosystemSimulator:
                     fish_tank_config = json.load(f)
                 return FishTankSimulator(**fish_tank_config)
 
-    async def simulate(self):
-        seasonal_weather_task = asyncio.create_task(self.seasonal_weather_simulator.simulate(self.simulation_config, True))
-        self.sim_tasks['seasonal_weather'] = seasonal_weather_task
-        fish_tank_task = asyncio.create_task(self.fish_tank_simulator.simulate(self.simulation_config))
-        self.sim_tasks['fish_tank'] = fish_tank_task
+    def _get_scheduler(self) -> LockstepScheduler:
+        # The weather is stepped first so that the fish tank consumes the weather of the same timestamp
+        return LockstepScheduler(self.simulation_config,
+                                 (self.seasonal_weather_simulator, self.fish_tank_simulator))
+
+    def _integrate_water_balance(self):
+        """
+        Runs the weather alone and then integrates the fish tank water balance over the whole horizon.
+        """
+        if self.simulation_config.get('weather_engine', 'stepwise') != 'vectorized':
+            raise ValueError("The adaptive water balance requires the vectorized weather engine.")
+        # The fish tank does not consume the weather step by step, do not publish it
+        self.seasonal_weather_simulator.weather_channel = None
+        try:
+            LockstepScheduler(self.simulation_config, (self.seasonal_weather_simulator,)).run()
+        finally:
+            self.seasonal_weather_simulator.weather_channel = self.weather_channel
+        self.fish_tank_simulator.integrate_water_balance(self.seasonal_weather_simulator.precomputed_weather,
+                                                         self.simulation_config)
 
+    async def _refresh_plots(self):
         while True:
-            try:
-                await asyncio.sleep(1)
-                if seasonal_weather_task.done():
-                    break
-            except asyncio.CancelledError:
-                # Perform cleanup (if necessary)
-                break
+            self.seasonal_weather_simulator.plot_tasks.update(
+                self.seasonal_weather_simulator.detect_sim_data(self.simulation_data))
+            await asyncio.sleep(1)
+
+    async def simulate(self, headless: bool = False):
+        """
+        Runs the seasonal weather and fish tank simulations in lockstep.
+
+        A `LockstepScheduler` owns the simulated clock and steps the weather and then the fish tank for every
+        timestamp, so the run is deterministic and finishes as soon as the work is done.
+
+        Args:
+            headless (bool, optional): Runs both simulations as fast as possible, without plotting and
+                without blocking on standard input. Defaults to False.
+
+        Setting `"water_balance": "adaptive"` (with `"weather_engine": "vectorized"`) in the simulation
+        configuration simulates the weather first and then integrates the fish tank water balance over the
+        whole horizon with adaptive steps (see `FishTankSimulator.integrate_water_balance`), without plotting.
+
+        Raises:
+            ValueError: If the adaptive water balance is configured without the vectorized weather engine.
+        """
+        if self.simulation_config.get('water_balance', 'stepwise') == 'adaptive':
+            self._integrate_water_balance()
+            return
+
+        scheduler = self._get_scheduler()
+        if headless:
+            scheduler.run()
+            return
 
+        self.sim_tasks['plots'] = asyncio.create_task(self._refresh_plots())
+        await scheduler.run_async(get_event_loop_yielder(self.simulation_config))
+        # Prevent process termination
+        input("Simulation completed. Press Enter to exit and close windows.")
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the artificial ecosystem simulation.")
+    parser.add_argument('--headless', action='store_true',
+                        help="Run as fast as possible without plots and without waiting for user input.")
+    parser.add_argument('--seed', type=int, default=None, help="Master seed making the run reproducible.")
+    args = parser.parse_args()
     simulator = ArtificialEcosystemSimulator(configuration_files_path="configurations",
-                                             country="Austria")
+                                             country="Austria",
+                                             seed=args.seed)
     try:
-        asyncio.run(simulator.simulate())
+        asyncio.run(simulator.simulate(headless=args.headless))
     finally:
         for task in simulator.sim_tasks.values():
-            task.cancel()
\ No newline at end of file
+            task.cancel()
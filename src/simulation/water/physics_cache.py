@@ -0,0 +1,156 @@
+# src/simulation/water/physics_cache.py
+import math
+from functools import lru_cache
+import numpy as np
+
+# Constants of the Antoine equation for water (vapor pressure in mmHg, temperature in degrees Celsius)
+ANTOINE_A = 8.07131
+ANTOINE_B = 1730.63
+ANTOINE_C = 233.426
+
+# Fitted constants of the Andrade equation for the viscosity of pure water (see utils/fix_andrade_equation_constants.py)
+ANDRADE_A = 8.569944981455998e+155
+ANDRADE_B = 8101783.244249629
+ANDRADE_C = 22428.609592644887
+
+# Upper bound on the number of intervals of a lookup table (a relative tolerance around 1e-10 at most)
+MAX_TABLE_INTERVALS = 2 ** 18
+
+
+def antoine_saturation_vapor_pressure(temperature: float) -> float:
+    """
+    Saturation vapor pressure of water at `temperature` degrees Celsius, from the Antoine equation.
+    """
+    return 10 ** (ANTOINE_A - (ANTOINE_B / (ANTOINE_C + temperature)))
+
+
+def andrade_viscosity(temperature: float) -> float:
+    """
+    Viscosity of pure water in Pa·s at `temperature` degrees Celsius, from the fitted Andrade equation.
+    """
+    return ANDRADE_A * math.exp(ANDRADE_B / (temperature + 273.15 - ANDRADE_C))
+
+
+class PhysicsKernel:
+    """
+    A memoized pure function of temperature.
+
+    Exact values are served from a bounded LRU cache, so a kernel evaluated over and over at the few
+    temperatures a simulation actually visits computes each value once. Setting a `tolerance` additionally
+    builds a lookup table over `[lower, upper]`, refined until linear interpolation between its points stays
+    within the relative tolerance, and serves in-range temperatures from the table; temperatures outside
+    the range always fall back to the exact values.
+
+    Attributes:
+        func (callable): The pure function of temperature.
+        lower (float): The lower bound of the table range.
+        upper (float): The upper bound of the table range.
+        tolerance (float | None): The relative accuracy of the table, or None to only serve exact values.
+    """
+
+    def __init__(self, func, lower: float, upper: float, tolerance: float = None, maxsize: int = 4096):
+        if lower >= upper:
+            raise ValueError("Lower bound must be less than the upper bound.")
+        self.func = func
+        self.lower = lower
+        self.upper = upper
+        self.tolerance = None
+        self._table = None
+        self._inverse_step = None
+        self.configure(tolerance, maxsize)
+
+    def configure(self, tolerance: float = None, maxsize: int = 4096):
+        """
+        Sets the accuracy tolerance of the lookup table and the size of the exact-value LRU cache.
+
+        Args:
+            tolerance (float, optional): The maximum relative error of the interpolated values, or None to
+                disable the table and serve exact values only. Defaults to None.
+            maxsize (int, optional): The number of exact values kept in the LRU cache. Defaults to 4096.
+
+        Raises:
+            ValueError: If the tolerance is not positive or the table would need more than `MAX_TABLE_INTERVALS`
+                intervals.
+        """
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("Tolerance must be a positive number.")
+        self._exact = lru_cache(maxsize=maxsize)(self.func)
+        self.tolerance = tolerance
+        self._table = self._build_table(tolerance) if tolerance is not None else None
+
+    def _build_table(self, tolerance: float):
+        """
+        Builds the (points, values, intercepts, slopes) table, doubling the number of intervals until the
+        interpolation error at every interval midpoint is within `tolerance`.
+        """
+        intervals = 64
+        while intervals <= MAX_TABLE_INTERVALS:
+            xs = np.linspace(self.lower, self.upper, intervals + 1)
+            ys = np.array([self.func(x) for x in xs.tolist()])
+            midpoints = (xs[:-1] + xs[1:]) / 2
+            exact = np.array([self.func(x) for x in midpoints.tolist()])
+            interpolated = (ys[:-1] + ys[1:]) / 2
+            if np.all(np.abs(interpolated - exact) <= tolerance * np.abs(exact)):
+                slopes = np.diff(ys) / np.diff(xs)
+                intercepts = ys[:-1] - slopes * xs[:-1]
+                # The upper bound maps to one past the last interval, repeat it to avoid clamping on lookups
+                self._inverse_step = intervals / (self.upper - self.lower)
+                return xs, ys, np.append(intercepts, intercepts[-1]).tolist(), np.append(slopes, slopes[-1]).tolist()
+            intervals *= 2
+        raise ValueError(f"Tolerance {tolerance} needs a table of more than {MAX_TABLE_INTERVALS} intervals.")
+
+    def __call__(self, temperature: float) -> float:
+        if self._table is not None and self.lower <= temperature <= self.upper:
+            index = int((temperature - self.lower) * self._inverse_step)
+            return self._table[2][index] + temperature * self._table[3][index]
+        return self._exact(temperature)
+
+    def many(self, temperatures) -> np.ndarray:
+        """
+        Evaluates the kernel over an array of temperatures.
+
+        Args:
+            temperatures (array-like): The temperatures in degrees Celsius.
+
+        Returns:
+            numpy.ndarray: The kernel values.
+        """
+        temperatures = np.asarray(temperatures, dtype=float)
+        values = np.empty(temperatures.shape)
+        if self._table is None:
+            exact = np.ones(temperatures.shape, dtype=bool)
+        else:
+            # Only the temperatures outside the table range are evaluated exactly
+            xs, ys = self._table[:2]
+            exact = ~((temperatures >= self.lower) & (temperatures <= self.upper))
+            values[~exact] = np.interp(temperatures[~exact], xs, ys)
+        if exact.any():
+            values[exact] = np.vectorize(self._exact, otypes=[float])(temperatures[exact])
+        return values
+
+    def cache_info(self):
+        """
+        Get the statistics of the exact-value LRU cache (see `functools.lru_cache`).
+        """
+        return self._exact.cache_info()
+
+
+# Kernels over the valid range of the water temperature (0 to 100 degrees Celsius)
+SATURATION_VAPOR_PRESSURE = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100)
+WATER_VISCOSITY = PhysicsKernel(andrade_viscosity, 0, 100)
+
+
+def configure_physics_cache(tolerance: float = None, maxsize: int = 4096):
+    """
+    Configures every physics kernel used by `Water`.
+
+    Args:
+        tolerance (float, optional): The maximum relative error of the interpolated lookup tables, or None
+            (the default) to only serve exact, memoized values.
+        maxsize (int, optional): The number of exact values kept in each LRU cache. Defaults to 4096.
+
+    Water refreshes its cached saturation vapor pressure and viscosity whenever its temperature is set, so
+    configure the kernels before creating the water of a simulation.
+    """
+    for kernel in (SATURATION_VAPOR_PRESSURE, WATER_VISCOSITY):
+        kernel.configure(tolerance, maxsize)
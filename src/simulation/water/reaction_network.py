@@ -0,0 +1,204 @@
+import numpy as np
+from types import MappingProxyType
+
+
+class ReactionNetwork:
+    """
+    A network of first-order reactions between dissolved elements, such as the bacterial conversion of ammonia
+    into nitrite and of nitrite into nitrate.
+
+    Every reaction converts its reactant at `rate * concentration` (mg/L per second) and produces `yield` mg of
+    its product per mg of reactant, or removes the reactant from the water when it has no product. The network
+    is the linear system dc/dt = A c, advanced with the backward Euler method: a step solves
+    (I - dt A) c(t + dt) = c(t), which is unconditionally stable however fast the conversions are compared to
+    the simulation step, and never turns a concentration negative. The step matrices are cached by step, so
+    advancing any number of tanks costs one matrix product.
+
+    Attributes:
+        elements (tuple): The elements of the network, in the order of its concentration vectors.
+        index (MappingProxyType): The index of every element in the concentration vectors.
+        rate_matrix (numpy.ndarray): The read-only rate matrix A of the network.
+    """
+
+    __slots__ = ('elements', 'index', 'rate_matrix', '_step_matrices', '_monitor_indices')
+
+    # Molar masses in g/mol of the nitrogen cycle ions, converting the nitrogen of a mg of one into the other
+    MOLAR_MASSES = MappingProxyType({'ammonia': 17.031, 'nitrite': 46.005, 'nitrate': 62.004})
+
+    # The number of step matrices kept in cache, one per distinct time step
+    STEP_CACHE_SIZE = 16
+
+    def __init__(self, reactions: list):
+        """
+        Args:
+            reactions (list): The reactions of the network, as dictionaries with the following keys:
+                              - 'reactant' (str): The converted element.
+                              - 'product' (str, optional): The produced element, None to remove the reactant.
+                              - 'rate' (float): The first-order rate constant in 1/s.
+                              - 'yield' (float, optional): The mg of product per mg of reactant. Defaults to 1.
+
+        Raises:
+            TypeError: If reactions is not a list of dictionaries or a rate or yield is not numeric.
+            ValueError: If reactions is empty, an element name is invalid, or a rate or yield is negative.
+        """
+        if not isinstance(reactions, (list, tuple)) or not all(isinstance(reaction, dict) for reaction in reactions):
+            raise TypeError("Reactions must be a list of dictionaries.")
+        if not reactions:
+            raise ValueError("Reactions cannot be empty.")
+
+        elements = []
+        for reaction in reactions:
+            for key in ('reactant', 'product'):
+                element = reaction.get(key)
+                if element is None and key == 'product':
+                    continue
+                if not isinstance(element, str) or not element:
+                    raise ValueError(f"Reaction {key} must be a non-empty element name.")
+                if element not in elements:
+                    elements.append(element)
+            for key in ('rate', 'yield'):
+                value = reaction.get(key, None if key == 'rate' else 1)
+                if not isinstance(value, (int, float)):
+                    raise TypeError(f"Reaction {key} must be a numeric value.")
+                elif value < 0:
+                    raise ValueError(f"Reaction {key} must be non-negative.")
+
+        index = {element: position for position, element in enumerate(elements)}
+        rate_matrix = np.zeros((len(elements), len(elements)))
+        for reaction in reactions:
+            reactant, product = index[reaction['reactant']], reaction.get('product')
+            rate = reaction['rate']
+            rate_matrix[reactant, reactant] -= rate
+            if product is not None:
+                rate_matrix[index[product], reactant] += reaction.get('yield', 1) * rate
+        rate_matrix.flags.writeable = False
+
+        self.elements = tuple(elements)
+        self.index = MappingProxyType(index)
+        self.rate_matrix = rate_matrix
+        self._step_matrices = {}
+        self._monitor_indices = {}
+
+    @classmethod
+    def nitrification(cls, ammonia_rate: float = 1e-5, nitrite_rate: float = 2e-5) -> 'ReactionNetwork':
+        """
+        Builds the nitrification network ammonia -> nitrite -> nitrate, with yields converting the nitrogen of
+        every ion into the next one.
+
+        Args:
+            ammonia_rate (float): The rate constant of the ammonia oxidation in 1/s. Defaults to 1e-5 (a
+                                  half-life of about 19 hours).
+            nitrite_rate (float): The rate constant of the nitrite oxidation in 1/s. Defaults to 2e-5.
+
+        Returns:
+            ReactionNetwork: The nitrification network.
+        """
+        molar_masses = cls.MOLAR_MASSES
+        return cls([
+            {'reactant': 'ammonia', 'product': 'nitrite', 'rate': ammonia_rate,
+             'yield': molar_masses['nitrite'] / molar_masses['ammonia']},
+            {'reactant': 'nitrite', 'product': 'nitrate', 'rate': nitrite_rate,
+             'yield': molar_masses['nitrate'] / molar_masses['nitrite']},
+        ])
+
+    def step_matrix(self, time_elapsed_sec: int | float) -> np.ndarray:
+        """
+        Get the matrix (I - dt A)^-1 advancing a concentration vector by one backward Euler step.
+
+        Args:
+            time_elapsed_sec (int | float): The step dt in seconds.
+
+        Returns:
+            numpy.ndarray: The read-only step matrix.
+
+        Raises:
+            TypeError: If the step is not numeric.
+            ValueError: If the step is negative.
+        """
+        step_matrix = self._step_matrices.get(time_elapsed_sec)
+        if step_matrix is None:
+            if not isinstance(time_elapsed_sec, (int, float)):
+                raise TypeError("Time elapsed must be a numeric value.")
+            elif not time_elapsed_sec >= 0:
+                raise ValueError("Time elapsed must be non-negative.")
+            step_matrix = np.linalg.inv(np.eye(len(self.elements)) - time_elapsed_sec * self.rate_matrix)
+            step_matrix.flags.writeable = False
+            if len(self._step_matrices) >= self.STEP_CACHE_SIZE:
+                del self._step_matrices[next(iter(self._step_matrices))]
+            self._step_matrices[time_elapsed_sec] = step_matrix
+        return step_matrix
+
+    def advance(self, concentrations, time_elapsed_sec: int | float, substeps: int = 1) -> np.ndarray:
+        """
+        Advance concentrations through the network.
+
+        Args:
+            concentrations (array-like): The concentrations in mg/L, with the elements of the network on the last
+                                         axis, e.g. one row per tank.
+            time_elapsed_sec (int | float): The time elapsed in seconds.
+            substeps (int): The number of backward Euler steps splitting the time elapsed, trading speed for
+                            accuracy on fast conversions. Defaults to 1.
+
+        Returns:
+            numpy.ndarray: The advanced concentrations, with the shape of `concentrations`.
+
+        Raises:
+            TypeError: If the time elapsed is not numeric.
+            ValueError: If the concentrations do not match the network, or the time elapsed or substeps are
+                        invalid.
+        """
+        concentrations = np.asarray(concentrations, dtype=float)
+        if concentrations.ndim == 0 or concentrations.shape[-1] != len(self.elements):
+            raise ValueError(f"Concentrations must have {len(self.elements)} elements on their last axis.")
+        if not isinstance(substeps, int) or substeps < 1:
+            raise ValueError("Substeps must be a positive integer.")
+        step_matrix = self.step_matrix(time_elapsed_sec / substeps)
+        if substeps > 1:
+            step_matrix = np.linalg.matrix_power(step_matrix, substeps)
+        return concentrations @ step_matrix.T
+
+    def _monitor_index(self, schema) -> np.ndarray:
+        """
+        Get the positions of the network elements in the concentration vectors of the monitors of `schema`.
+        """
+        monitor_index = self._monitor_indices.get(schema)
+        if monitor_index is None:
+            missing = [element for element in self.elements if element not in schema.index]
+            if missing:
+                raise ValueError(f"The monitor does not track the elements {', '.join(missing)}.")
+            monitor_index = self._monitor_indices[schema] = np.array([schema.index[element]
+                                                                      for element in self.elements])
+        return monitor_index
+
+    def advance_monitors(self, monitors, time_elapsed_sec: int | float, substeps: int = 1):
+        """
+        Advance the dissolved elements of many monitors at once, one matrix product per element schema.
+
+        The concentrations of a group of monitors are only updated when all of them stay within their ranges,
+        see `WaterDissolvedElementsMonitor.react`.
+
+        Args:
+            monitors (iterable): The `WaterDissolvedElementsMonitor` instances.
+            time_elapsed_sec (int | float): The time elapsed in seconds.
+            substeps (int): The number of backward Euler steps splitting the time elapsed. Defaults to 1.
+
+        Raises:
+            ValueError: If a monitor does not track every element of the network, or if a concentration leaves
+                        its range.
+        """
+        groups = {}
+        for monitor in monitors:
+            groups.setdefault(monitor.schema, []).append(monitor)
+        for schema, group in groups.items():
+            monitor_index = self._monitor_index(schema)
+            concentrations = np.stack([monitor._concentrations for monitor in group])
+            concentrations[:, monitor_index] = self.advance(concentrations[:, monitor_index], time_elapsed_sec,
+                                                            substeps)
+            # One bounds comparison for the whole group, the first monitor out of range reports the error
+            out_of_range = (concentrations < np.stack([monitor._lower_bounds for monitor in group])) | \
+                           (concentrations > np.stack([monitor._upper_bounds for monitor in group]))
+            if out_of_range.any():
+                row = int(np.argmax(out_of_range.any(axis=1)))
+                group[row]._check_concentrations(concentrations[row])
+            for monitor, monitor_concentrations in zip(group, concentrations):
+                monitor._concentrations = monitor_concentrations
@@ -1,8 +1,26 @@
 # src/simulation/water/water.py
 import math
+import numpy as np
+from types import MappingProxyType
 from src.simulation.water.water_property_range import WaterPropertyRange
+from src.simulation.water.physics_cache import SATURATION_VAPOR_PRESSURE, WATER_VISCOSITY
 
 class Water:
+    # Slots instead of a per-instance `__dict__`, which dominates the memory of many small instances. Monitors
+    # observe the water through `add_observer` instead of wrapping its methods, so no `__dict__` is needed.
+    __slots__ = ('nutrients', '_tank_capacity', 'current_nutrients', '_current_volume', '_overflow_volume',
+                 '_underflow_capacity_threshold', '_overflow_capacity_threshold', 'snow_accumulation',
+                 '_temperature', '_saturation_vapor_pressure', '_ph', '_turbidity', '_viscosity', '_tds',
+                 '_is_empty', '_is_full', '_water_status', '_observers', '__weakref__')
+
+    # Events notified to the observers, after the operation of the same name completed
+    OBSERVER_EVENTS = ('evaporate', 'add_water', 'extract_water', 'precipitation')
+
+    # Validation ranges of the evaporation inputs, built once instead of on every `evaporate` call
+    _evaporation_air_temp_range = WaterPropertyRange("temperature", -10, 50)
+    _evaporation_surface_area_range = WaterPropertyRange("surface_area", 0, 100)
+    _evaporation_rel_humidity_range = WaterPropertyRange("relative_humidity", 0, 100)
+
     def __init__(self, initial_nutrients, tank_capacity):
         self.nutrients = initial_nutrients
         self.tank_capacity = tank_capacity
@@ -13,13 +31,77 @@ class Water:
         self._overflow_capacity_threshold = 0.1
         self.snow_accumulation = 0  # Initialize snow accumulation
         self._temperature = 25  # Default temperature in Celsius
+        self._saturation_vapor_pressure = SATURATION_VAPOR_PRESSURE(self._temperature)
         self._ph = 7.0  # Neutral pH
         self._turbidity = 0  # Clear water
         self._viscosity = 0.00089  # Default viscosity of pure water at 25 degrees C
         self._tds = 0  # Default TDS value
         self.is_empty = True
         self.is_full = False
-        self._water_status = {}
+        self._water_status = None  # Status snapshot, cleared by the setters whenever the state changes
+        self._observers = None  # Observer callbacks by event, None while no observer is attached
+
+    def __getstate__(self):
+        """
+        Drops the cached status snapshot, a read-only mapping that can be neither pickled nor copied.
+        """
+        instance_state, slots_state = super().__getstate__()
+        slots_state['_water_status'] = None
+        return instance_state, slots_state
+
+    def add_observer(self, event: str, callback):
+        """
+        Attach an observer called after every `event` operation.
+
+        The callback receives the water and the result of the operation: the evaporated liters for 'evaporate'
+        (an array for `evaporate_many`), the added or extracted liters for 'add_water' and 'extract_water', and
+        the melted snow for 'precipitation' (`manage_precipitation` and `melt_snow`). Operations that raise do
+        not notify. Use picklable callbacks (functions or bound methods, not closures) to keep the water
+        picklable.
+
+        Parameters:
+            event (str): One of `OBSERVER_EVENTS`.
+            callback (callable): The observer, called as `callback(water, result)`.
+
+        Raises:
+            ValueError: If the event is unknown.
+            TypeError: If the callback is not callable.
+        """
+        if event not in self.OBSERVER_EVENTS:
+            raise ValueError(f"Invalid event '{event}'. Must be one of {', '.join(self.OBSERVER_EVENTS)}.")
+        elif not callable(callback):
+            raise TypeError("Observer must be callable.")
+        observers = dict(self._observers or {})
+        observers[event] = observers.get(event, ()) + (callback,)
+        self._observers = observers
+
+    def remove_observer(self, event: str, callback):
+        """
+        Detach an observer attached with `add_observer`.
+
+        Parameters:
+            event (str): The event the observer was attached to.
+            callback (callable): The observer.
+
+        Raises:
+            ValueError: If the observer is not attached to the event.
+        """
+        callbacks = (self._observers or {}).get(event, ())
+        if callback not in callbacks:
+            raise ValueError(f"Observer is not attached to the '{event}' event.")
+        index = callbacks.index(callback)
+        observers = dict(self._observers)
+        observers[event] = callbacks[:index] + callbacks[index + 1:]
+        if not observers[event]:
+            del observers[event]
+        self._observers = observers or None
+
+    def _notify(self, event: str, result):
+        """
+        Calls the observers of `event` with the result of the operation.
+        """
+        for callback in self._observers.get(event, ()):
+            callback(self, result)
 
     @property
     def temperature(self):
@@ -45,7 +127,8 @@ class Water:
         Validates that the provided temperature is within an acceptable range (0 to 100 degrees Celsius).
         If the value falls outside this range, it raises a `ValueError`.
         
-        Updates the `viscosity` attribute based on the new temperature value.
+        Updates the `viscosity` attribute and the saturation vapor pressure used by `evaporate` based on the new
+        temperature value.
 
         Parameters:
             value (int | float): The temperature value to set (must be between 0 and 100).
@@ -59,6 +142,8 @@ class Water:
         elif not isinstance(value, (int, float)):
             raise TypeError("Temperature must be a numeric value.")
         self._temperature = value
+        self._water_status = None
+        self._saturation_vapor_pressure = SATURATION_VAPOR_PRESSURE(value)
         self.update_water_viscosity()
 
     @property
@@ -96,6 +181,7 @@ class Water:
         if not isinstance(value, (int, float)):
             raise TypeError("pH must be a numeric value.")
         self._ph = value
+        self._water_status = None
 
     @property
     def turbidity(self):
@@ -133,6 +219,7 @@ class Water:
         elif not isinstance(value, (int, float)):
             raise TypeError("Turbidity must be a numeric value.")
         self._turbidity = value
+        self._water_status = None
 
     @property
     def viscosity(self):
@@ -175,6 +262,7 @@ class Water:
         elif not isinstance(value, (int, float)):
             raise TypeError("Viscosity must be a numeric value.")
         self._viscosity = value
+        self._water_status = None
 
     @property
     def tds(self):
@@ -213,6 +301,7 @@ class Water:
         elif not isinstance(value, (int, float)):
             raise TypeError("TDS must be a numeric value.")
         self._tds = value
+        self._water_status = None
         self.update_water_viscosity()
     
     @property
@@ -245,7 +334,7 @@ class Water:
             ValueError: If the value is negative or exceeds the tank's total capacity.
     
         Notes:
-            - The overflow amount is calculated and assigned to `overflow_volume` when the input value
+            - The overflow amount is calculated and added to `overflow_volume` when the input value
               exceeds the tank's capacity.
             - In case of overflow, the water volume is limited to the tank's capacity.
         """
@@ -257,10 +346,12 @@ class Water:
         if value < 0:
             raise ValueError("Current volume must be non-negative.")
     
+        self._water_status = None
+
         # If the volume exceeds the tank capacity, calculate overflow
-        if value > self.tank_capacity:
-            self.overflow_volume = value - self.tank_capacity  # Calculate overflow
-            self._current_volume = self.tank_capacity  # Cap the volume at tank capacity
+        if value > self._tank_capacity:
+            self._overflow_volume += value - self._tank_capacity  # Accumulate the overflow
+            self._current_volume = self._tank_capacity  # Cap the volume at tank capacity
             raise ValueError("Current volume cannot exceed the tank's capacity.")
 
         # Otherwise, update the current volume directly
@@ -268,14 +359,14 @@ class Water:
             self._current_volume = value  # Assign the validated volume
 
         if self.current_volume <= self.underflow_capacity_threshold:
-            self.is_empty = True
+            self._is_empty = True
         else:
-            self.is_empty = False
+            self._is_empty = False
 
-        if self.current_volume >= self.tank_capacity - self.overflow_capacity_threshold:
-            self.is_full = True
+        if self.current_volume >= self._tank_capacity - self.overflow_capacity_threshold:
+            self._is_full = True
         else:
-            self.is_full = False
+            self._is_full = False
     
     @property
     def underflow_capacity_threshold(self) -> int | float:
@@ -323,9 +414,11 @@ class Water:
             if value >= self.tank_capacity - self.overflow_capacity_threshold:
                 raise ValueError("Underflow threshold must be less than or equal to the tank capacity.")
             self._underflow_capacity_threshold = value / self.tank_capacity
+            self._water_status = None
         # If value is a fraction, assign it as is
         elif value >= 0:
             self._underflow_capacity_threshold = value
+            self._water_status = None
 
     @property
     def overflow_capacity_threshold(self) -> int | float:
@@ -374,36 +467,105 @@ class Water:
             if value >= self.tank_capacity:
                 raise ValueError("Overflow threshold must be less than the tank capacity.")
             self._overflow_capacity_threshold = value / self.tank_capacity
+            self._water_status = None
         # If value is a fraction, directly assign it
         elif value >= 0:
             self._overflow_capacity_threshold = value
+            self._water_status = None
 
     @property
-    def status(self) -> dict:
+    def tank_capacity(self) -> int | float:
+        """
+        Get the capacity of the tank in liters.
+        """
+        return self._tank_capacity
+
+    @tank_capacity.setter
+    def tank_capacity(self, value: int | float):
+        """
+        Set the capacity of the tank in liters.
+        """
+        self._tank_capacity = value
+        self._water_status = None
+
+    @property
+    def overflow_volume(self) -> int | float:
+        """
+        Get the total water spilled over the tank capacity, in liters.
+
+        Every overflow adds to it, whether it comes from the `current_volume` setter (e.g. a rejected
+        `add_water`), `apply_flows` or a `WaterBalance` integration, until it is reset by assignment.
+        """
+        return self._overflow_volume
+
+    @overflow_volume.setter
+    def overflow_volume(self, value: int | float):
+        """
+        Set the total water spilled over the tank capacity, in liters, e.g. 0 to reset it.
+        """
+        self._overflow_volume = value
+        self._water_status = None
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Get whether the volume is at or below the underflow capacity threshold.
+        """
+        return self._is_empty
+
+    @is_empty.setter
+    def is_empty(self, value: bool):
+        """
+        Set whether the tank is considered empty.
+        """
+        self._is_empty = value
+        self._water_status = None
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Get whether the volume is at or above the overflow capacity threshold.
+        """
+        return self._is_full
+
+    @is_full.setter
+    def is_full(self, value: bool):
+        """
+        Set whether the tank is considered full.
+        """
+        self._is_full = value
+        self._water_status = None
+
+    @property
+    def status(self) -> MappingProxyType:
         """
         Retrieve the current status of the water system.
     
-        This property compiles a dictionary containing various attributes and metrics associated with the current state of the water system.
-        The dictionary includes physical properties (e.g., temperature, pH, turbidity, viscosity, and TDS), capacity states (e.g., current volume,
+        This property exposes a read-only mapping containing various attributes and metrics associated with the current state of the water system.
+        The mapping includes physical properties (e.g., temperature, pH, turbidity, viscosity, and TDS), capacity states (e.g., current volume,
         underflow and overflow thresholds, and whether the system is empty or full), and tank-related metrics (e.g., capacity and overflow volume).
+
+        The snapshot is cached and only rebuilt after a setter changed the state, so polling the status is cheap.
+        It is immutable: use `dict(water.status)` for a mutable copy.
     
         Returns:
-            dict: A dictionary summarizing the current status of the water system.
-        """
-        self._water_status = {
-            "temperature": self.temperature,
-            "ph": self.ph,
-            "turbidity": self.turbidity,
-            "viscosity": self.viscosity,
-            "tds": self.tds,
-            "current_volume": self.current_volume,
-            "underflow_capacity_threshold": self.underflow_capacity_threshold,
-            "overflow_capacity_threshold": self.overflow_capacity_threshold,
-            "is_empty": self.is_empty,
-            "is_full": self.is_full,
-            "tank_capacity": self.tank_capacity,
-            "overflow_volume": self.overflow_volume
-        }
+            MappingProxyType: A read-only mapping summarizing the current status of the water system.
+        """
+        if self._water_status is None:
+            self._water_status = MappingProxyType({
+                "temperature": self.temperature,
+                "ph": self.ph,
+                "turbidity": self.turbidity,
+                "viscosity": self.viscosity,
+                "tds": self.tds,
+                "current_volume": self.current_volume,
+                "underflow_capacity_threshold": self.underflow_capacity_threshold,
+                "overflow_capacity_threshold": self.overflow_capacity_threshold,
+                "is_empty": self.is_empty,
+                "is_full": self.is_full,
+                "tank_capacity": self.tank_capacity,
+                "overflow_volume": self.overflow_volume
+            })
         return self._water_status
 
     def update_water_viscosity(self):
@@ -439,20 +601,13 @@ class Water:
         Returns:
             None
         """
-        # Constants for temperature-based viscosity (empirically determined for water)
-        A = 8.569944981455998e+155  # Empirical scaling for water viscosity (Pa·s)
-        B = 8101783.244249629  # Temperature sensitivity constant
-        C = 22428.609592644887  # Offset constant for water temperature behavior
-
         # Constants for TDS impact
         k_tds = 0.001  # Coefficient for TDS contribution to viscosity
         n = 0.5  # Exponent for TDS effect (adjust to make nonlinear)
 
-        # Convert temperature to Kelvin
-        temperature_kelvin = self.temperature + 273.15
-
-        # Calculate base viscosity using empirical temperature formula
-        base_viscosity = A * math.exp(B / (temperature_kelvin - C))
+        # Base viscosity from the empirical temperature formula (A, B and C are defined in physics_cache),
+        # memoized because it only depends on the temperature
+        base_viscosity = WATER_VISCOSITY(self.temperature)
 
         # Adjust viscosity based on TDS
         viscosity_with_tds = base_viscosity * (1 + k_tds * math.pow(self.tds, n))
@@ -521,23 +676,69 @@ class Water:
             self.snow_accumulation += amount
 
         # Simulate snow melting if temperature is above 0°C
-        if air_temperature > 0:  # Snow melts at temperatures greater than 0°C
-            # Determine the amount of snow that melts
-            melting_rate = 0.01 * self.snow_accumulation * (air_temperature / (air_temperature + 5))
-            melted_snow = min((self.snow_accumulation, melting_rate))
-        
-            # Add the melted snow to the current water volume
-            if melted_snow > 0:
-                self.current_volume += melted_snow
-        
-            # Subtract the melted snow from the remaining snow accumulation
-            self.snow_accumulation -= melted_snow
+        melted_snow = self._melt_snow(air_temperature, 1)
+        if self._observers is not None:
+            self._notify('precipitation', melted_snow)
+
+    def melt_snow(self, air_temperature: int | float, steps: int = 1) -> float:
+        """
+        Melts the accumulated snow as `steps` consecutive calls of `manage_precipitation` without precipitation
+        would, at a constant air temperature.
+
+        Every call melts the fraction `0.01 * T / (T + 5)` of the remaining snow above 0°C, so the snow decays
+        geometrically and the melt of `steps` calls is `snow * (1 - (1 - fraction) ** steps)`: a multi-day thaw
+        costs one call instead of one per sample.
+
+        Parameters:
+            air_temperature (int | float): The air temperature in degrees Celsius.
+            steps (int, optional): The number of melting steps. Defaults to 1.
+
+        Returns:
+            float: The melted snow added to the current water volume, in liters.
+
+        Raises:
+            TypeError: If the air temperature is not numeric or the number of steps is not an integer.
+            ValueError: If the number of steps is negative, or the melted snow exceeds the tank capacity (the
+                volume is capped, the overflow recorded and the snow left unchanged, as in `manage_precipitation`).
+        """
+        if not isinstance(air_temperature, (int, float)):
+            raise TypeError("Air temperature must be a numeric value.")
+        if not isinstance(steps, int):
+            raise TypeError("Steps must be an integer.")
+        elif steps < 0:
+            raise ValueError("Steps must be non-negative.")
+        melted_snow = self._melt_snow(air_temperature, steps)
+        if self._observers is not None:
+            self._notify('precipitation', melted_snow)
+        return melted_snow
+
+    def _melt_snow(self, air_temperature: int | float, steps: int) -> float:
+        """
+        Melts the snow of `steps` steps at `air_temperature`, without validating the arguments.
+        """
+        # Snow melts at temperatures greater than 0°C
+        if air_temperature <= 0 or steps == 0 or self.snow_accumulation <= 0:
+            return 0.0
+        melt_fraction = 0.01 * (air_temperature / (air_temperature + 5))
+        if steps == 1:
+            melted_snow = self.snow_accumulation * melt_fraction
+        else:
+            # 1 - (1 - fraction) ** steps, without the cancellation of small fractions
+            melted_snow = self.snow_accumulation * -math.expm1(steps * math.log1p(-melt_fraction))
+
+        # Add the melted snow to the current water volume, then subtract it from the snow accumulation
+        self.current_volume += melted_snow
+        self.snow_accumulation -= melted_snow
+        return melted_snow
 
     def evaporate(self,
                   air_temp: int | float,
                   surface_area: int | float,
                   rel_humidity: int | float,
-                  time_elapsed_sec: int) -> int | float:
+                  time_elapsed_sec: int,
+                  *,
+                  trusted: bool = False,
+                  dry_out: bool = False) -> int | float:
         """
         Calculate the amount of water evaporated over a given time period.
 
@@ -555,6 +756,10 @@ class Water:
             rel_humidity (int | float): The relative humidity of the surrounding air, as a percentage.
                                         Must be between 0 and 100.
             time_elapsed_sec (int): The total time elapsed for evaporation, in seconds.
+            trusted (bool): Skips the input validation, for callers that already validated the inputs
+                            (e.g. the simulation loop). Defaults to False.
+            dry_out (bool): Evaporates at most the current volume, leaving the tank empty instead of raising
+                            when the evaporation exceeds it. Defaults to False.
 
         Returns:
             int | float: The total amount of water evaporated, in liters.
@@ -563,30 +768,108 @@ class Water:
             TypeError: If any input parameter is not numeric.
             ValueError: If any input parameter is outside the acceptable range.
         """
+        if not trusted:
+            self._validate_evaporation_inputs(air_temp, surface_area, rel_humidity, time_elapsed_sec)
+        # When there is no water surface exposed to ambient air there is no evaporation
+        if surface_area == 0:
+            total_evaporation_liters = 0
+        else:
+            total_evaporation_liters = self._evaporation_liters(air_temp, surface_area, rel_humidity,
+                                                                time_elapsed_sec)
+            if dry_out and total_evaporation_liters > self._current_volume:
+                total_evaporation_liters = self._current_volume
+            # Update current_volume property by removing the evaporated water volume
+            self.current_volume -= total_evaporation_liters
+
+        if self._observers is not None:
+            self._notify('evaporate', total_evaporation_liters)
+        # Return the total evaporation in liters
+        return total_evaporation_liters
+
+    def evaporate_many(self,
+                       air_temps,
+                       surface_area: int | float,
+                       rel_humidities,
+                       times_elapsed_sec) -> np.ndarray:
+        """
+        Calculate the water evaporated over consecutive time steps in a single pass.
+
+        Batch counterpart of `evaporate`: the inputs are validated once for the whole batch, the evaporation
+        of every step is computed with NumPy and `current_volume` is updated once with the total.
+
+        Parameters:
+            air_temps (array-like): The air temperature of every step, in degrees Celsius (-10 to 50).
+            surface_area (int | float): The surface area of the water exposed to air, in square meters.
+            rel_humidities (array-like): The relative humidity of every step (0 to 100).
+            times_elapsed_sec (array-like | int): The elapsed time of every step, or of all steps, in seconds.
+
+        Returns:
+            numpy.ndarray: The water evaporated at every step, in liters.
+
+        Raises:
+            TypeError: If any input is not numeric.
+            ValueError: If any input is outside the acceptable range, the inputs have different lengths
+                        or the batch evaporates more water than the current volume.
+        """
+        try:
+            air_temps, rel_humidities, times_elapsed_sec = np.broadcast_arrays(
+                *(np.asarray(values, dtype=float) for values in (air_temps, rel_humidities, times_elapsed_sec)))
+        except (TypeError, ValueError) as e:
+            if isinstance(e, ValueError) and 'broadcast' in str(e):
+                raise ValueError("Evaporation inputs must have the same length.") from e
+            raise TypeError("Evaporation inputs must be numeric values.") from e
+        self._validate_evaporation_inputs(air_temps, surface_area, rel_humidities, 0)
+        if surface_area == 0:
+            evaporated_liters = np.zeros(air_temps.shape)
+        else:
+            evaporated_liters = self._evaporation_liters(air_temps, surface_area, rel_humidities, times_elapsed_sec)
+            self.current_volume -= float(evaporated_liters.sum())
+
+        if self._observers is not None:
+            self._notify('evaporate', evaporated_liters)
+        return evaporated_liters
+
+    def _validate_evaporation_inputs(self, air_temp, surface_area, rel_humidity, time_elapsed_sec):
+        """
+        Validates the inputs of `evaporate`, or of `evaporate_many` (NumPy arrays of temperatures and
+        humidities, checked through their extreme values), against the precomputed evaporation ranges.
+
+        Raises:
+            TypeError: If any input parameter is not numeric.
+            ValueError: If any input parameter is outside the acceptable range.
+        """
+        air_temp_min = air_temp_max = air_temp
+        rel_humidity_min = rel_humidity_max = rel_humidity
+        if isinstance(air_temp, np.ndarray):
+            if air_temp.size == 0:
+                return
+            air_temp_min, air_temp_max = air_temp.min(), air_temp.max()
+            rel_humidity_min, rel_humidity_max = rel_humidity.min(), rel_humidity.max()
         # Validate that air_temp is a numeric value and within the acceptable range (-10 to 50 degrees Celsius)
-        if not isinstance(air_temp, (int, float)):
+        elif not isinstance(air_temp, (int, float)):
             raise TypeError("Air temperature must be a numeric value.")
-        air_temp_range = WaterPropertyRange("temperature", -10, 50)
-        if air_temp_range.lower_bound > air_temp or air_temp_range.upper_bound < air_temp:
+        # The bounds are checked with negated comparisons so that NaN, which min and max propagate, is rejected
+        air_temp_range = self._evaporation_air_temp_range
+        if not air_temp_range.lower_bound <= air_temp_min <= air_temp_max <= air_temp_range.upper_bound:
             raise ValueError(f"Air temperature must be between {air_temp_range.lower_bound} "
                              f"and {air_temp_range.upper_bound} degrees Celsius.")
 
         # Validate that surface_area is numeric and within the acceptable range (1 to 100 square meters)
         if not isinstance(surface_area, (int, float)):
             raise TypeError("Surface area must be a numeric value.")
-        surface_are_range = WaterPropertyRange("surface_area", 0, 100)
-        if surface_are_range.lower_bound > surface_area or surface_are_range.upper_bound < surface_area:
+        surface_are_range = self._evaporation_surface_area_range
+        if not surface_are_range.lower_bound <= surface_area <= surface_are_range.upper_bound:
             raise ValueError(f"Surface area must be between {surface_are_range.lower_bound} "
                              f"and {surface_are_range.upper_bound} square meters.")
-        # When there is no water surface exposed to ambient air there is no evaporation
+        # When there is no water surface exposed to ambient air the remaining inputs are irrelevant
         if surface_area == 0:
-            return 0
+            return
 
         # Validate that rel_humidity is numeric and within the range (0 to 100 percent)
-        if not isinstance(rel_humidity, (int, float)):
+        if not isinstance(rel_humidity_min, (int, float, np.floating)):
             raise TypeError("Relative humidity must be a numeric value.")
-        rel_humidity_range = WaterPropertyRange("relative_humidity", 0, 100)
-        if rel_humidity_range.lower_bound > rel_humidity or rel_humidity_range.upper_bound < rel_humidity:
+        rel_humidity_range = self._evaporation_rel_humidity_range
+        if not rel_humidity_range.lower_bound <= rel_humidity_min <= rel_humidity_max <= rel_humidity_range.upper_bound:
             raise ValueError(f"Relative humidity must be between {rel_humidity_range.lower_bound} "
                              f"and {rel_humidity_range.upper_bound} percent.")
 
@@ -594,14 +877,13 @@ class Water:
         if not isinstance(time_elapsed_sec, (int, float)):
             raise TypeError("Time must be a numeric value.")
 
-        # Constants for the Antoine equation for water (used for calculating vapor pressure)
-        a_const = 8.07131
-        b_const = 1730.63
-        c_const = 233.426
-
-        # Calculate the saturation vapor pressure (SVP) of water using the Antoine equation
+    def _evaporation_liters(self, air_temp, surface_area, rel_humidity, time_elapsed_sec):
+        """
+        Computes the evaporated liters for scalar or NumPy array inputs, without validation.
+        """
+        # Saturation vapor pressure (SVP) of water from the Antoine equation, refreshed by the temperature setter
         # SVP is the maximum pressure exerted by water vapor at the current water temperature
-        saturation_vapor_pressure = 10 ** (a_const - (b_const / (c_const + self.temperature)))
+        saturation_vapor_pressure = self._saturation_vapor_pressure
 
         # Calculate the actual vapor pressure (AVP) of air using relative humidity
         # AVP accounts for the water vapor already present in the air
@@ -621,13 +903,7 @@ class Water:
         total_evaporation_grams = evaporation_rate * time_elapsed_hours
 
         # Convert the total evaporation from grams to liters (1 liter = 1000 grams)
-        total_evaporation_liters = total_evaporation_grams / 1000
-
-        # Update current_volume property by removing the evaporated water volume
-        self.current_volume -= total_evaporation_liters
-
-        # Return the total evaporation in liters
-        return total_evaporation_liters
+        return total_evaporation_grams / 1000
 
     def add_water(self, amount: int | float) -> int | float:
         """
@@ -667,6 +943,8 @@ class Water:
         # If all checks pass, add the specified amount to the current water volume
         else:
             self.current_volume += amount
+            if self._observers is not None:
+                self._notify('add_water', amount)
             return amount
 
     def extract_water(self, amount: int | float, force_underflow_capacity_threshold: bool = False) -> int | float:
@@ -710,4 +988,94 @@ class Water:
         # Proceed with extraction if all checks pass
         else:
             self.current_volume -= amount  # Reduce the current volume
+            if self._observers is not None:
+                self._notify('extract_water', amount)
             return amount  # Return the amount of water extracted
+
+    # Policies of `apply_flows` for the flows crossing the capacity or the underflow threshold
+    FLOW_POLICIES = ('clamp', 'reject', 'strict')
+
+    def apply_flows(self,
+                    flows,
+                    policy: str = 'clamp',
+                    force_underflow_capacity_threshold: bool = False) -> tuple[np.ndarray, float]:
+        """
+        Apply a sequence of signed flows to the tank in one call, as a ledger of `add_water` (positive flows) and
+        `extract_water` (negative flows) calls.
+
+        The flows are applied in order against a running volume bounded by the tank capacity above and by the
+        underflow threshold below (0 when `force_underflow_capacity_threshold` is set). A flow crossing a bound
+        is handled according to `policy`:
+
+            - 'clamp': The flow is accepted up to the bound. The excess inflow overflows and is added to
+              `overflow_volume`, the excess outflow is not extracted.
+            - 'reject': The whole flow is rejected (accepted amount 0), like a failed `add_water` or
+              `extract_water` call, and the next flows go on.
+            - 'strict': Any crossing raises ValueError and no flow is applied.
+
+        The volume is only updated once all flows are accounted for, so the ledger applies atomically. Observers
+        are notified once per direction, with the total added and the total extracted water.
+
+        Parameters:
+            flows (array-like): The signed flows in liters, positive to add water and negative to extract it.
+            policy (str): One of `FLOW_POLICIES`. Defaults to 'clamp'.
+            force_underflow_capacity_threshold (bool): If True, allows extraction below the underflow
+                                                       threshold, down to an empty tank. Defaults to False.
+
+        Returns:
+            tuple: The accepted amount of every flow (a signed numpy.ndarray) and the overflowed water in liters.
+
+        Raises:
+            TypeError: If the flows are not numeric.
+            ValueError: If the policy is invalid, or with the 'strict' policy if a flow crosses a bound.
+        """
+        if policy not in self.FLOW_POLICIES:
+            raise ValueError(f"Invalid policy '{policy}'. Must be one of {', '.join(self.FLOW_POLICIES)}.")
+        try:
+            flows = np.asarray(flows, dtype=float).ravel()
+        except (TypeError, ValueError) as e:
+            raise TypeError("Flows must be numeric values.") from e
+        if not np.all(np.isfinite(flows)):
+            raise ValueError("Flows must be finite.")
+
+        capacity = self.tank_capacity
+        lower_bound = 0 if force_underflow_capacity_threshold else self.underflow_capacity_threshold
+        volume = self.current_volume
+        accepted = flows.tolist()
+        overflow = added = extracted = 0.0
+        for index, flow in enumerate(accepted):
+            if flow >= 0:
+                room = capacity - volume
+                if flow > room:
+                    if policy == 'strict':
+                        raise ValueError(f"Flow {index} exceeds the tank capacity when added to the volume.")
+                    elif policy == 'clamp':
+                        overflow += flow - room
+                        flow = room
+                    else:
+                        flow = 0.0
+                added += flow
+            else:
+                # An extraction never goes below the lower bound, nor raises the volume when already below it
+                available = max(volume - lower_bound, 0.0)
+                if -flow > available:
+                    if policy == 'strict':
+                        raise ValueError(f"Flow {index} extracts water below the underflow threshold.")
+                    elif policy == 'clamp':
+                        flow = -available
+                    else:
+                        flow = 0.0
+                extracted -= flow
+            accepted[index] = flow
+            volume += flow
+
+        if added or extracted:
+            self.current_volume = min(max(volume, 0.0), capacity)
+        if overflow:
+            self.overflow_volume += overflow
+        if self._observers is not None:
+            if added:
+                self._notify('add_water', added)
+            if extracted:
+                self._notify('extract_water', extracted)
+        return np.array(accepted), overflow
@@ -0,0 +1,378 @@
+# src/simulation/water/water_batch.py
+import numpy as np
+from src.simulation.water.water import Water
+from src.simulation.water.physics_cache import SATURATION_VAPOR_PRESSURE
+
+
+class WaterBatch:
+    """
+    The water of many tanks, stored as one NumPy array per property (struct of arrays).
+
+    `WaterBatch` applies the `evaporate`, `manage_precipitation`, `add_water` and `extract_water` semantics of
+    `Water` to every tank at once with vectorized operations, instead of one Python call per tank. Inputs are
+    either a scalar applied to every tank or an array with one value per tank.
+
+    Every operation is validated for the whole batch before any state changes: if one tank rejects the
+    operation, a `ValueError` is raised and no tank is updated. A volume above the tank capacity is capped
+    and the excess added to `overflow_volume`, which is the state `Water` is left in when its
+    `current_volume` setter rejects an overflow; the batch caps without raising so that one overflowing tank
+    does not interrupt the others.
+
+    Attributes:
+        tank_capacity (numpy.ndarray): The capacity of every tank, in liters.
+        current_volume (numpy.ndarray): The water volume of every tank, in liters.
+        overflow_volume (numpy.ndarray): The total water spilled over the capacity of every tank, in liters.
+        snow_accumulation (numpy.ndarray): The snow accumulated on every tank.
+        ph (numpy.ndarray): The pH of the water of every tank.
+    """
+
+    def __init__(self,
+                 tank_capacities,
+                 current_volumes=0,
+                 temperatures=25,
+                 ph=7.0,
+                 tds=0,
+                 snow_accumulations=0,
+                 underflow_capacity_thresholds=0.2,
+                 overflow_capacity_thresholds=0.1):
+        """
+        Initialize the batch with the capacity of every tank and, optionally, their initial state.
+
+        Args:
+            tank_capacities (array-like): The capacity of every tank, in liters. Defines the number of tanks.
+            current_volumes (array-like | int | float, optional): The initial water volumes. Defaults to 0.
+            temperatures (array-like | int | float, optional): The water temperatures. Defaults to 25.
+            ph (array-like | int | float, optional): The pH of the water. Defaults to 7.0.
+            tds (array-like | int | float, optional): The total dissolved solids in ppm. Defaults to 0.
+            snow_accumulations (array-like | int | float, optional): The accumulated snow. Defaults to 0.
+            underflow_capacity_thresholds (array-like | int | float, optional): The underflow thresholds as a
+                fraction of the tank capacities. Defaults to 0.2.
+            overflow_capacity_thresholds (array-like | int | float, optional): The overflow thresholds as a
+                fraction of the tank capacities. Defaults to 0.1.
+
+        Raises:
+            TypeError: If any input is not numeric.
+            ValueError: If an input does not have one value per tank or a volume is outside the tank capacity.
+        """
+        self.tank_capacity = self._per_tank(tank_capacities, np.size(tank_capacities))
+        size = len(self.tank_capacity)
+        current_volume = self._per_tank(current_volumes, size)
+        if np.any(current_volume < 0) or np.any(current_volume > self.tank_capacity):
+            raise ValueError("Current volumes must be between 0 and the tank capacities.")
+        self.current_volume = current_volume
+        self.overflow_volume = np.zeros(size)
+        self.snow_accumulation = self._per_tank(snow_accumulations, size)
+        self.ph = self._per_tank(ph, size)
+        self._underflow_capacity_threshold = self._per_tank(underflow_capacity_thresholds, size)
+        self._overflow_capacity_threshold = self._per_tank(overflow_capacity_thresholds, size)
+        self.temperature = temperatures
+        self.tds = tds
+
+    @classmethod
+    def from_waters(cls, waters) -> 'WaterBatch':
+        """
+        Create a batch holding the current state of existing `Water` (or `WaterTank`) objects, in order.
+
+        Args:
+            waters (list): The `Water` objects.
+
+        Returns:
+            WaterBatch: The batch.
+        """
+        return cls(tank_capacities=[water.tank_capacity for water in waters],
+                   current_volumes=[water.current_volume for water in waters],
+                   temperatures=[water.temperature for water in waters],
+                   ph=[water.ph for water in waters],
+                   tds=[water.tds for water in waters],
+                   snow_accumulations=[water.snow_accumulation for water in waters],
+                   underflow_capacity_thresholds=[water._underflow_capacity_threshold for water in waters],
+                   overflow_capacity_thresholds=[water._overflow_capacity_threshold for water in waters])
+
+    def __len__(self):
+        return len(self.tank_capacity)
+
+    def _per_tank(self, values, size: int) -> np.ndarray:
+        """
+        Broadcasts a scalar or an array of one value per tank to a float array of `size` values.
+
+        Raises:
+            TypeError: If the values are not numeric.
+            ValueError: If the values are not a scalar or an array of `size` values.
+        """
+        try:
+            values = np.asarray(values, dtype=float)
+        except (TypeError, ValueError) as e:
+            raise TypeError("Batch inputs must be numeric values.") from e
+        if values.ndim > 1 or (values.ndim == 1 and len(values) != size):
+            raise ValueError(f"Batch inputs must be a scalar or have one value per tank ({size}).")
+        return np.array(np.broadcast_to(values, (size,)))
+
+    @property
+    def temperature(self) -> np.ndarray:
+        """
+        Get the water temperature of every tank, in degrees Celsius.
+        """
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, values):
+        """
+        Set the water temperatures and refresh the saturation vapor pressures used by `evaporate`.
+
+        Raises:
+            TypeError: If the temperatures are not numeric.
+            ValueError: If any temperature is not between 0 and 100 degrees Celsius.
+        """
+        temperature = self._per_tank(values, len(self))
+        if np.any(temperature < 0) or np.any(temperature > 100):
+            raise ValueError("Temperature must be between 0 and 100 degrees Celsius.")
+        self._temperature = temperature
+        self._saturation_vapor_pressure = SATURATION_VAPOR_PRESSURE.many(temperature)
+
+    @property
+    def tds(self) -> np.ndarray:
+        """
+        Get the total dissolved solids of the water of every tank, in ppm.
+        """
+        return self._tds
+
+    @tds.setter
+    def tds(self, values):
+        """
+        Set the total dissolved solids of the water of every tank.
+
+        Raises:
+            TypeError: If the values are not numeric.
+            ValueError: If any value is negative.
+        """
+        tds = self._per_tank(values, len(self))
+        if np.any(tds < 0):
+            raise ValueError("TDS cannot be negative.")
+        self._tds = tds
+
+    @property
+    def underflow_capacity_threshold(self) -> np.ndarray:
+        """
+        Get the underflow threshold of every tank, in liters.
+        """
+        return self.tank_capacity * self._underflow_capacity_threshold
+
+    @property
+    def overflow_capacity_threshold(self) -> np.ndarray:
+        """
+        Get the overflow threshold of every tank, in liters.
+        """
+        return self.tank_capacity * self._overflow_capacity_threshold
+
+    @property
+    def is_empty(self) -> np.ndarray:
+        """
+        Get whether the volume of every tank is at or below its underflow threshold.
+        """
+        return self.current_volume <= self.underflow_capacity_threshold
+
+    @property
+    def is_full(self) -> np.ndarray:
+        """
+        Get whether the volume of every tank is at or above its overflow threshold.
+        """
+        return self.current_volume >= self.tank_capacity - self.overflow_capacity_threshold
+
+    def _set_volume(self, volume: np.ndarray, tanks=None) -> np.ndarray:
+        """
+        Assigns new volumes (to every tank, or to the `tanks` mask), capping them at the tank capacities.
+
+        Returns:
+            numpy.ndarray: The mask of the tanks that overflowed.
+
+        Raises:
+            ValueError: If any new volume is negative, in which case no volume changes.
+        """
+        if np.any(volume < 0):
+            negative = np.flatnonzero(volume < 0) if tanks is None else np.flatnonzero(tanks)[volume < 0]
+            raise ValueError(f"Current volume must be non-negative (tanks {negative.tolist()}).")
+        capacity = self.tank_capacity if tanks is None else self.tank_capacity[tanks]
+        overflowed = volume > capacity
+        if np.any(overflowed):
+            overflow_volume = self.overflow_volume if tanks is None else self.overflow_volume[tanks]
+            overflow_volume[overflowed] += volume[overflowed] - capacity[overflowed]
+            volume = np.minimum(volume, capacity)
+            if tanks is not None:
+                self.overflow_volume[tanks] = overflow_volume
+        if tanks is None:
+            self.current_volume = volume
+        else:
+            self.current_volume[tanks] = volume
+        return overflowed
+
+    def evaporate(self, air_temps, surface_areas, rel_humidities, time_elapsed_sec) -> np.ndarray:
+        """
+        Evaporates the water of every tank over a time period (see `Water.evaporate`).
+
+        Parameters:
+            air_temps (array-like | int | float): The air temperatures in degrees Celsius (-10 to 50).
+            surface_areas (array-like | int | float): The surface areas of the water exposed to air, in
+                square meters (0 to 100). Tanks without surface do not evaporate.
+            rel_humidities (array-like | int | float): The relative humidities of the surrounding air (0 to 100).
+            time_elapsed_sec (array-like | int | float): The elapsed times, in seconds.
+
+        Returns:
+            numpy.ndarray: The water evaporated from every tank, in liters.
+
+        Raises:
+            TypeError: If any input is not numeric.
+            ValueError: If any input is outside the acceptable range or a tank evaporates more water than
+                        its current volume.
+        """
+        size = len(self)
+        air_temps = self._per_tank(air_temps, size)
+        surface_areas = self._per_tank(surface_areas, size)
+        rel_humidities = self._per_tank(rel_humidities, size)
+        time_elapsed_sec = self._per_tank(time_elapsed_sec, size)
+        for name, values, valid_range, unit in (
+                ("Air temperature", air_temps, Water._evaporation_air_temp_range, "degrees Celsius"),
+                ("Surface area", surface_areas, Water._evaporation_surface_area_range, "square meters"),
+                ("Relative humidity", rel_humidities, Water._evaporation_rel_humidity_range, "percent")):
+            # Negated comparisons, so that NaN (propagated by min and max) is out of range too
+            if size and not valid_range.lower_bound <= values.min() <= values.max() <= valid_range.upper_bound:
+                raise ValueError(f"{name} must be between {valid_range.lower_bound} "
+                                 f"and {valid_range.upper_bound} {unit}.")
+
+        # Same computation as `Water._evaporation_liters`, with one water temperature per tank
+        saturation_vapor_pressure = self._saturation_vapor_pressure
+        k = 0.1 + 0.01 * np.abs(air_temps - self._temperature)
+        evaporation_rate = k * surface_areas * (saturation_vapor_pressure - rel_humidities * saturation_vapor_pressure)
+        evaporated_liters = evaporation_rate * (time_elapsed_sec / 3600) / 1000
+
+        self._set_volume(self.current_volume - evaporated_liters)
+        return evaporated_liters
+
+    def manage_precipitation(self, precipitation_type: str, amounts, air_temperatures, pattern: str = 'steady'):
+        """
+        Applies rain or snow, and the melting of the accumulated snow, to every tank
+        (see `Water.manage_precipitation`).
+
+        Parameters:
+            precipitation_type (str): The type of precipitation ('rain' or 'snow').
+            amounts (array-like | int | float): The amounts of precipitation received.
+            air_temperatures (array-like | int | float): The air temperatures in degrees Celsius.
+            pattern (str): The pattern of precipitation ('steady' or 'intermittent').
+
+        Raises:
+            TypeError: If the amounts or air temperatures are not numeric.
+            ValueError: If the precipitation type or pattern is invalid or any amount is negative.
+        """
+        if precipitation_type not in ['rain', 'snow']:
+            raise ValueError("Invalid precipitation type. Must be 'rain' or 'snow'.")
+        if pattern not in ['steady', 'intermittent']:
+            raise ValueError("Invalid pattern. Must be 'steady' or 'intermittent'.")
+        size = len(self)
+        amounts = self._per_tank(amounts, size)
+        air_temperatures = self._per_tank(air_temperatures, size)
+        if np.any(amounts < 0):
+            raise ValueError("Amount must be non-negative.")
+
+        # `Water` stops before melting the snow of a tank whose rain overflowed it, and so does the batch
+        overflowed = np.zeros(size, dtype=bool)
+        if precipitation_type == 'rain':
+            overflowed = self._set_volume(self.current_volume + (amounts if pattern == 'steady' else amounts * 0.5))
+        else:
+            self.snow_accumulation = self.snow_accumulation + amounts
+
+        self._melt_snow(air_temperatures, 1, ~overflowed)
+
+    def melt_snow(self, air_temperatures, steps: int = 1) -> np.ndarray:
+        """
+        Melts the accumulated snow of every tank over `steps` steps at constant air temperatures, in closed form
+        (see `Water.melt_snow`). The volume of a tank that overflows is capped and its snow left unchanged.
+
+        Parameters:
+            air_temperatures (array-like | int | float): The air temperatures in degrees Celsius.
+            steps (int, optional): The number of melting steps. Defaults to 1.
+
+        Returns:
+            numpy.ndarray: The melted snow of every tank, in liters.
+
+        Raises:
+            TypeError: If the air temperatures are not numeric or the number of steps is not an integer.
+            ValueError: If the number of steps is negative.
+        """
+        if not isinstance(steps, int):
+            raise TypeError("Steps must be an integer.")
+        elif steps < 0:
+            raise ValueError("Steps must be non-negative.")
+        return self._melt_snow(self._per_tank(air_temperatures, len(self)), steps, np.ones(len(self), dtype=bool))
+
+    def _melt_snow(self, air_temperatures: np.ndarray, steps: int, tanks: np.ndarray) -> np.ndarray:
+        """
+        Melts the snow of `steps` steps in the `tanks` mask, returning the melted snow of every tank.
+        """
+        melted = np.zeros(len(self))
+        melting = tanks & (air_temperatures > 0) & (self.snow_accumulation > 0)
+        if steps and np.any(melting):
+            snow_accumulation = self.snow_accumulation[melting]
+            air_temperature = air_temperatures[melting]
+            melt_fraction = 0.01 * (air_temperature / (air_temperature + 5))
+            if steps > 1:
+                melt_fraction = -np.expm1(steps * np.log1p(-melt_fraction))
+            melted_snow = snow_accumulation * melt_fraction
+            overflowed = self._set_volume(self.current_volume[melting] + melted_snow, melting)
+            melted_snow[overflowed] = 0
+            self.snow_accumulation[melting] = snow_accumulation - melted_snow
+            melted[melting] = melted_snow
+        return melted
+
+    def add_water(self, amounts) -> np.ndarray:
+        """
+        Adds water to every tank (see `Water.add_water`). An amount of 0 leaves its tank unchanged.
+
+        Parameters:
+            amounts (array-like | int | float): The amounts of water to add, in liters.
+
+        Returns:
+            numpy.ndarray: The amounts of water added to every tank.
+
+        Raises:
+            TypeError: If the amounts are not numeric.
+            ValueError: If any amount is negative or exceeds the remaining capacity of its tank.
+        """
+        amounts = self._per_tank(amounts, len(self))
+        if np.any(amounts < 0):
+            raise ValueError("Amount must be non-negative.")
+        exceeding = amounts > self.tank_capacity - self.current_volume
+        if np.any(exceeding):
+            raise ValueError(f"Amount exceed the tank capacity when added to current volume "
+                             f"(tanks {np.flatnonzero(exceeding).tolist()}).")
+        self.current_volume = self.current_volume + amounts
+        return amounts
+
+    def extract_water(self, amounts, force_underflow_capacity_threshold: bool = False) -> np.ndarray:
+        """
+        Extracts water from every tank (see `Water.extract_water`).
+
+        Parameters:
+            amounts (array-like | int | float): The amounts of water to extract, in liters.
+            force_underflow_capacity_threshold (bool): If True, allows extraction below the underflow
+                                                       thresholds. Defaults to False.
+
+        Returns:
+            numpy.ndarray: The amounts of water extracted from every tank.
+
+        Raises:
+            TypeError: If the amounts are not numeric.
+            ValueError: If any amount is negative, exceeds the current volume of its tank or, unless forced,
+                        breaches its underflow threshold.
+        """
+        amounts = self._per_tank(amounts, len(self))
+        if np.any(amounts < 0):
+            raise ValueError("Amount must be non-negative.")
+        available = self.current_volume
+        if not force_underflow_capacity_threshold:
+            available = available - self.underflow_capacity_threshold
+        exceeding = amounts > available
+        if np.any(exceeding):
+            raise ValueError(f"Amount must be less than or equal to the current volume"
+                             f"{'' if force_underflow_capacity_threshold else ' minus the underflow threshold'} "
+                             f"(tanks {np.flatnonzero(exceeding).tolist()}).")
+        self.current_volume = self.current_volume - amounts
+        return amounts
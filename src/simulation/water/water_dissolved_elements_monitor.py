@@ -1,9 +1,173 @@
+import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
 from src.simulation.water.water_property_range import WaterPropertyRange
 from src.simulation.water.water_tank import WaterTank
-from functools import wraps
+
+
+class DissolvedElementsSchema:
+    """
+    The compiled schema of a set of dissolved elements, shared by every monitor tracking the same elements with
+    the same ranges.
+
+    A schema owns a `WaterDissolvedElementsMonitor` subclass carrying the concentration and range properties of
+    its elements, and a `WaterPropertyRange` subclass knowing their registered ranges, so monitors never define
+    properties on `WaterDissolvedElementsMonitor` nor register their elements in the global
+    `WaterPropertyRange.properties_ranges`. Schemas are immutable and cached by element-set signature, so only
+    the first monitor of an element set compiles it.
+
+    Attributes:
+        signature (tuple): The (element, min, max) triple of every element, in concentration vector order.
+        elements (tuple): The names of the elements.
+        index (MappingProxyType): The index of every element in the concentration vector.
+        lower_bounds (numpy.ndarray): The read-only minimum concentrations of the elements.
+        upper_bounds (numpy.ndarray): The read-only maximum concentrations of the elements.
+        range_class (type): The `WaterPropertyRange` subclass accepting the elements as property names.
+        monitor_class (type): The `WaterDissolvedElementsMonitor` subclass with the element properties.
+    """
+
+    __slots__ = ('signature', 'elements', 'index', 'lower_bounds', 'upper_bounds', 'range_class', 'monitor_class')
+
+    def __init__(self, signature: tuple):
+        elements = tuple(element for element, _, _ in signature)
+        for element in elements:
+            if not isinstance(element, str) or not element.isidentifier():
+                raise ValueError(f"Element name {element!r} must be a valid identifier.")
+
+            if element.startswith('_') or element == 'water_tank' or \
+                    hasattr(WaterDissolvedElementsMonitor, element) or \
+                    hasattr(WaterDissolvedElementsMonitor, f"{element}_range"):
+                raise ValueError(f"Element name '{element}' clashes with a monitor attribute.")
+
+        lower_bounds = np.array([min_value for _, min_value, _ in signature], dtype=float)
+        upper_bounds = np.array([max_value for _, _, max_value in signature], dtype=float)
+        lower_bounds.flags.writeable = upper_bounds.flags.writeable = False
+        properties_ranges = dict(WaterPropertyRange.properties_ranges)
+        properties_ranges.update({element: {"lower_bound": min_value, "upper_bound": max_value}
+                                  for element, min_value, max_value in signature})
+        range_class = type('DissolvedElementRange', (WaterPropertyRange,), {
+            '__slots__': (), '__module__': __name__, '__reduce__': _reduce_element_range,
+            '_signature': signature, 'properties_ranges': properties_ranges})
+        namespace = {'__module__': __name__, '_schema': self}
+        for index, (element, min_value, max_value) in enumerate(signature):
+            namespace[element], namespace[f"{element}_range"] = _element_properties(
+                element, index, lambda element=element, min_value=min_value, max_value=max_value:
+                range_class(element, min_value, max_value))
+        monitor_class = type(WaterDissolvedElementsMonitor.__name__, (WaterDissolvedElementsMonitor,), namespace)
+
+        for name, value in (('signature', signature), ('elements', elements),
+                            ('index', MappingProxyType({element: index for index, element in enumerate(elements)})),
+                            ('lower_bounds', lower_bounds), ('upper_bounds', upper_bounds),
+                            ('range_class', range_class), ('monitor_class', monitor_class)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("A DissolvedElementsSchema is immutable.")
+
+    def __repr__(self):
+        return f"DissolvedElementsSchema({', '.join(self.elements)})"
+
+    @classmethod
+    def compile(cls, dissolved_elements: dict) -> 'DissolvedElementsSchema':
+        """
+        Gets the schema of a set of dissolved elements, compiling it on the first request of its signature.
+
+        Args:
+            dissolved_elements (dict): The dissolved elements, see `WaterDissolvedElementsMonitor`.
+
+        Returns:
+            DissolvedElementsSchema: The schema of the elements.
+
+        Raises:
+            ValueError: If the dictionary is empty, if an element name is invalid or clashes with a monitor
+                        attribute, or if 'min' is greater than 'max' for any element.
+            TypeError: If dissolved_elements is not a dictionary or any range value is not numeric.
+        """
+        if not isinstance(dissolved_elements, dict):
+            raise TypeError("The dissolved_elements parameter must be a dictionary.")
+
+        if not dissolved_elements:
+            raise ValueError("The dissolved_elements dictionary cannot be empty.")
+
+        signature = []
+        for element, element_dict in dissolved_elements.items():
+            min_value = element_dict.get("min", 0)
+            max_value = element_dict.get("max", 0)
+
+            if not isinstance(min_value, (int, float)) or not isinstance(max_value, (int, float)):
+                raise TypeError(f"Element '{element}' must have numeric 'min' and 'max' values.")
+
+            if min_value > max_value:
+                raise ValueError(f"Element '{element}' has 'min' greater than 'max'.")
+
+            signature.append((element, min_value, max_value))
+        return _compile_schema(tuple(signature))
+
+
+@lru_cache(maxsize=1024)
+def _compile_schema(signature: tuple) -> DissolvedElementsSchema:
+    return DissolvedElementsSchema(signature)
+
+
+def _element_properties(element: str, index: int, default_range) -> tuple[property, property]:
+    """
+    Builds the concentration and range properties of the element at `index` of the concentration vector.
+    `default_range` builds the range of the element the first time it is needed by a monitor.
+    """
+    def value_getter(class_instance):
+        return float(class_instance._concentrations[index])
+
+    def value_setter(class_instance, value):
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"{element} concentration must be a numeric value.")
+        elif value < 0:
+            raise ValueError(f"{element} concentration must be non-negative.")
+        if not class_instance._lower_bounds[index] <= value <= class_instance._upper_bounds[index]:
+            range_getter(class_instance).check_property_value(value)
+        class_instance._concentrations[index] = value
+
+    def range_getter(class_instance):
+        value_range = class_instance._element_ranges.get(element)
+        if value_range is None:
+            value_range = class_instance._element_ranges[element] = default_range()
+        return value_range
+
+    def range_setter(class_instance, range_value):
+        if not isinstance(range_value, WaterPropertyRange):
+            raise TypeError(f"{element} range must be a WaterPropertyRange object.")
+        if range_value.property_name != element:
+            raise ValueError(f"{element} range must match the corresponding element.")
+        class_instance._element_ranges[element] = range_value
+        class_instance._lower_bounds[index] = range_value.lower_bound
+        class_instance._upper_bounds[index] = range_value.upper_bound
+
+    return property(fget=value_getter, fset=value_setter), property(fget=range_getter, fset=range_setter)
+
+
+def _reduce_element_range(element_range: WaterPropertyRange):
+    # Schema classes are built at runtime, so their instances are pickled by signature
+    return _restore_element_range, (type(element_range)._signature, element_range.property_name,
+                                    element_range.lower_bound, element_range.upper_bound)
+
+
+def _restore_element_range(signature: tuple, property_name: str, lower_bound, upper_bound) -> WaterPropertyRange:
+    return _compile_schema(signature).range_class(property_name, lower_bound, upper_bound)
+
+
+def _restore_monitor(signature: tuple) -> 'WaterDissolvedElementsMonitor':
+    monitor_class = _compile_schema(signature).monitor_class
+    return monitor_class.__new__(monitor_class)
 
 
 class WaterDissolvedElementsMonitor:
+    # The schema of the monitored elements, set on the schema subclasses instantiated for every element set
+    _schema = None
+
+    def __new__(cls, water_tank: WaterTank = None, dissolved_elements: dict = None):
+        if cls._schema is not None:
+            return super().__new__(cls)
+        return super().__new__(DissolvedElementsSchema.compile(dissolved_elements).monitor_class)
+
     def __init__(self, water_tank: WaterTank, dissolved_elements: dict):
         if not isinstance(water_tank, WaterTank):
             raise TypeError("The `water_tank` parameter must be a `WaterTank` instance.")
@@ -13,233 +177,154 @@ class WaterDissolvedElementsMonitor:
         # Track the initial volume of the water to handle proportional updates
         self._last_known_volume = self.water_tank.current_volume
 
-        # Decorate the Water instance's `evaporate` method
-        self._decorate_evaporate_method()
+        # Observe the water tank operations that change its volume. Bound methods, unlike closures wrapping the
+        # tank methods, keep the tank and the monitor picklable
+        self.water_tank.add_observer('evaporate', self._on_evaporate)
+        self.water_tank.add_observer('precipitation', self._on_dilution)
+        self.water_tank.add_observer('add_water', self._on_dilution)
 
-        # Decorate the Water instance's `manage_precipitation` method
-        self._decorate_manage_precipitation()
+    def __reduce__(self):
+        """
+        Pickles the monitor by the signature of its schema, which is compiled again when unpickling.
+        """
+        return _restore_monitor, (self._schema.signature,), self.__dict__
 
-        # Decorate the Water instance's `add_water` method
-        self._decorate_add_water()
+    @property
+    def schema(self) -> DissolvedElementsSchema:
+        """
+        Get the compiled schema of the monitored elements.
+        """
+        return self._schema
 
     def _get_dissolved_element_properties(self):
         """
-        Retrieves all properties of the WaterDissolvedElementsMonitor instance that represent
-        dissolved element concentrations. These are attributes that do not contain "_range".
-        """
-        if not hasattr(self, "_cached_dissolved_properties"):
-            self._cached_dissolved_properties = [
-                attr.removeprefix('_').removesuffix('_dissolved_element')
-                for attr in self.__dict__.keys()
-                if not attr.endswith("_range") and attr.endswith("_dissolved_element")
-            ]
-        return self._cached_dissolved_properties
-
-    def _decorate_evaporate_method(self):
-        """
-        Decorates the evaporate method of the Water instance within the WaterTank
-        to automatically adjust dissolved element concentrations after evaporation.
-        """
-        if not hasattr(self.water_tank, 'evaporate'):
-            raise AttributeError(f"The method 'evaporate' does not exist in WaterTank.")
-
-        original_evaporate = self.water_tank.evaporate  # Store the original evaporate method
-
-        @wraps(original_evaporate)  # Preserve metadata of the original method
-        def evaporate_with_concentration_update(*args, **kwargs):
-            # Call the original evaporate method and get the amount evaporated
-            evaporated_water = original_evaporate(*args, **kwargs)
-
-            # Adjust the dissolved element concentrations
-            new_volume = self.water_tank.current_volume
-
-            # Handle edge cases (no volume left or no evaporation occurred)
-            if new_volume <= 0:
-                # Set all element concentrations to 0 if no water remains
-                for element in self._get_dissolved_element_properties():
-                    setattr(self, element, 0)
-            else:
-                # Update concentrations based on volume reduction
-                for element in self._get_dissolved_element_properties():
-                    # Calculate updated concentration
-                    current_concentration = getattr(self, element)
-                    concentration_increment = current_concentration * (1 - (new_volume / self._last_known_volume))
-                    new_concentration = current_concentration + concentration_increment
-                    setattr(self, element, new_concentration)
-
-            # Update the tracked volume
-            self._last_known_volume = new_volume
-
-            return evaporated_water  # Return the result from the original method
-
-        # Replace the original evaporate method with the decorated one
-        self.water_tank.evaporate = evaporate_with_concentration_update
-
-    def _decorate_manage_precipitation(self):
-        """
-        Decorates the manage_precipitation method of the WaterTank instance 
-        to update dissolved element concentrations automatically whenever 
-        precipitation occurs, incorporating water volume changes.
-    
-        This ensures that the concentrations of dissolved elements in the water 
-        are recalculated in proportion to the updated water volume after precipitation.
-    
-        Inputs:
-            - *args, **kwargs: Any arguments passed to the original manage_precipitation method.
-        Outputs:
-            - The decorated method does not modify the return value of the original method.
-        """
-        if not hasattr(self.water_tank, 'manage_precipitation'):
-            raise AttributeError(f"The method 'manage_precipitation' does not exist in WaterTank.")
-
-        # Store the original manage_precipitation method
-        original_manage_precipitation = self.water_tank.manage_precipitation
-    
-        # Preserve metadata of the original method
-        wraps(original_manage_precipitation)
-    
-        # Define the wrapped method
-        def manage_precipitation_with_dissolved_elements_concentration_update(*args, **kwargs):
-            # Call the original manage_precipitation method
-            original_manage_precipitation(*args, **kwargs)
-    
-            # Loop through each dissolved element to update its concentration
-            for element in self._get_dissolved_element_properties():
-                # Get the current concentration level
-                current_concentration = getattr(self, element)
-    
-                # Calculate the change in concentration due to precipitation
-                concentration_decrement = current_concentration * (1 - (self.water_tank.current_volume / self._last_known_volume))
-    
-                # Apply the calculated changes to update the concentration
-                new_concentration = current_concentration + concentration_decrement
-    
-                # Set the new concentration value
-                setattr(self, element, new_concentration)
-    
-        # Replace the original manage_precipitation method with the decorated version
-        self.water_tank.manage_precipitation = manage_precipitation_with_dissolved_elements_concentration_update
-
-    def _decorate_add_water(self):
-        """
-        Decorates the `add_water` method of the WaterTank instance 
-        to adjust dissolved element concentrations automatically 
-        whenever water is added, maintaining consistency with the 
-        proportional change in water volume.
-        """
-        if not hasattr(self.water_tank, 'add_water'):
-            raise AttributeError(f"The method 'add_water' does not exist in WaterTank.")
-        
-        # Store the original `add_water` method from WaterTank
-        original_add_water = self.water_tank.add_water
-        
-        # Preserve the original method's metadata
-        wraps(original_add_water)
-    
-        # Define the decorated method
-        def add_water_with_dissolved_elements_concentration_update(*args, **kwargs):
-            # Call the original `add_water` method
-            original_add_water(*args, **kwargs)
-            
-            # Adjust each dissolved element's concentration based on the new volume
-            for element in self._get_dissolved_element_properties():
-                current_concentration = getattr(self, element)
-                
-                # Calculate the decrease in concentration proportional to added water volume
-                concentration_decrement = current_concentration * (1 - (self.water_tank.current_volume / self._last_known_volume))
-                
-                # Update the concentration
-                new_concentration = current_concentration + concentration_decrement
-                setattr(self, element, new_concentration)
-    
-        # Replace the original `add_water` method with the new decorated one
-        self.water_tank.add_water = add_water_with_dissolved_elements_concentration_update
+        Retrieves the names of the dissolved elements tracked by the WaterDissolvedElementsMonitor instance, in
+        the order of their concentrations in the concentration vector.
+        """
+        return list(self._schema.elements)
 
-    def _set_dissolved_elements(self, dissolved_elements: dict):
+    @property
+    def concentrations(self) -> np.ndarray:
+        """
+        Get a read-only view of the concentration vector, indexed like `_get_dissolved_element_properties()`.
         """
-        Dynamically sets dissolved element properties and their ranges for the water tank.
+        concentrations = self._concentrations.view()
+        concentrations.flags.writeable = False
+        return concentrations
+
+    def _check_concentrations(self, concentrations: np.ndarray):
+        """
+        Checks a whole concentration vector against the element ranges with one bounds comparison, the first
+        element out of range raising like its property setter would. The bounds are the ones of the ranges last
+        assigned to the element range properties.
 
         Args:
-            dissolved_elements (dict): A dictionary where each key is the name of an element (str),
-                                       and each value is another dictionary with the following keys:
-                                       - 'initial' (float): The initial concentration of the element.
-                                       - 'min' (float): The minimum acceptable concentration of the element.
-                                       - 'max' (float): The maximum acceptable concentration of the element.
+            concentrations (numpy.ndarray): The concentrations, indexed like the concentration vector.
 
         Raises:
-            ValueError: If 'min' is greater than 'max' for any element.
-            TypeError: If any concentration or range value is not numeric.
+            ValueError: If a concentration is out of the range of its element.
         """
-        if not isinstance(dissolved_elements, dict):
-            raise TypeError("The dissolved_elements parameter must be a dictionary.")
+        out_of_range = (concentrations < self._lower_bounds) | (concentrations > self._upper_bounds)
+        if out_of_range.any():
+            index = int(np.argmax(out_of_range))
+            element = self._schema.elements[index]
+            getattr(self, f"{element}_range").check_property_value(float(concentrations[index]))
 
-        if not dissolved_elements:
-            raise ValueError("The dissolved_elements dictionary cannot be empty.")
+    def _rescale_concentrations(self, factor: float):
+        """
+        Rescales every concentration by `factor` with one multiplication. The concentrations are only updated
+        when all of them stay within their ranges.
 
-        for element, element_dict in dissolved_elements.items():
-            # Update class dictionary WaterPropertyRange.properties_ranges
-            WaterPropertyRange.properties_ranges[element] = {"lower_bound": element_dict['min'],
-                                                             "upper_bound": element_dict['max']}
-            def create_value_getter(e):  # Capture loop variable
-                def value_getter(class_instance):
-                    return class_instance.__dict__.get(f"_{e}_dissolved_element", 0)
-
-                return value_getter
-
-            def create_value_setter(e):
-                def value_setter(class_instance, value):
-                    if not isinstance(value, (int, float)):
-                        raise TypeError(f"{e} concentration must be a numeric value.")
-                    elif value < 0:
-                        raise ValueError(f"{e} concentration must be non-negative.")
-                    value_range = class_instance.__dict__.get(f"_{e}_range", None)
-                    if value_range is not None:
-                        value_range.check_property_value(value)
-                    class_instance.__dict__[f"_{e}_dissolved_element"] = value
-
-                return value_setter
-
-            def create_range_getter(e):
-                def range_getter(class_instance):
-                    return class_instance.__dict__.get(f"_{e}_range", None)
-
-                return range_getter
-
-            def create_range_setter(e):
-                def range_setter(class_instance, range_value):
-                    if not isinstance(range_value, WaterPropertyRange):
-                        raise TypeError(f"{e} range must be a WaterPropertyRange object.")
-                    if range_value.property_name != e:
-                        raise ValueError(f"{e} range must match the corresponding element.")
-                    class_instance.__dict__[f"_{e}_range"] = range_value
-
-                return range_setter
-
-            # Validate and initialize values
-            min_value = element_dict.get("min", 0)
-            max_value = element_dict.get("max", 0)
-            initial_value = element_dict.get("initial", 0)
+        Args:
+            factor (float): The scaling factor of the concentrations.
 
-            if not isinstance(min_value, (int, float)) or not isinstance(max_value, (int, float)):
-                raise TypeError(f"Element '{element}' must have numeric 'min' and 'max' values.")
+        Raises:
+            ValueError: If a rescaled concentration is out of the range of its element.
+        """
+        concentrations = self._concentrations * factor
+        self._check_concentrations(concentrations)
+        self._concentrations = concentrations
 
-            if min_value > max_value:
-                raise ValueError(f"Element '{element}' has 'min' greater than 'max'.")
+    def react(self, reaction_network, time_elapsed_sec: int | float, substeps: int = 1):
+        """
+        Advances the dissolved elements through a reaction network, e.g. the nitrification of ammonia into
+        nitrite and nitrate (see `ReactionNetwork`). The concentrations are only updated when all of them stay
+        within their ranges. Many monitors are advanced faster at once with `ReactionNetwork.advance_monitors`.
+
+        Args:
+            reaction_network (ReactionNetwork): The reaction network, whose elements the monitor must track.
+            time_elapsed_sec (int | float): The time elapsed in seconds.
+            substeps (int): The number of implicit steps splitting the time elapsed. Defaults to 1.
 
-            # Create WaterPropertyRange object
-            element_range = WaterPropertyRange(element, min_value, max_value)
+        Raises:
+            ValueError: If the monitor does not track every element of the network, or if a concentration
+                        leaves its range.
+        """
+        reaction_network.advance_monitors((self,), time_elapsed_sec, substeps)
+
+    def _on_evaporate(self, water_tank: WaterTank, evaporated_water):
+        """
+        Observes the evaporate and evaporate_many methods of the WaterTank instance to adjust dissolved
+        element concentrations after evaporation.
+
+        Args:
+            water_tank (WaterTank): The observed water tank.
+            evaporated_water (float | numpy.ndarray): The evaporated water.
+        """
+        new_volume = water_tank.current_volume
+
+        # Set all element concentrations to 0 if no water remains, otherwise concentrate them in proportion to
+        # the volume reduction
+        if new_volume <= 0:
+            self._rescale_concentrations(0)
+        else:
+            self._rescale_concentrations(2 - new_volume / self._last_known_volume)
+
+        # Update the tracked volume
+        self._last_known_volume = new_volume
+
+    def _on_dilution(self, water_tank: WaterTank, added_water):
+        """
+        Observes the manage_precipitation, melt_snow and add_water methods of the WaterTank instance to
+        recalculate the concentrations of dissolved elements in proportion to the updated water volume.
+
+        Args:
+            water_tank (WaterTank): The observed water tank.
+            added_water (float): The added water (or melted snow).
+        """
+        self._rescale_concentrations(2 - water_tank.current_volume / self._last_known_volume)
 
-            # Assign dynamic properties
-            setattr(self.__class__, element, property(
-                fget=create_value_getter(element),
-                fset=create_value_setter(element)
-            ))
-            setattr(self.__class__, f"{element}_range", property(
-                fget=create_range_getter(element),
-                fset=create_range_setter(element)
-            ))
+    def _set_dissolved_elements(self, dissolved_elements: dict):
+        """
+        Sets the dissolved element concentrations and their ranges for the water tank, as described by the
+        schema of the monitor.
 
-            # Use the dynamically defined property setters to initialize values
-            setattr(self, f"{element}_range", element_range)
-            setattr(self, element, initial_value)
+        Args:
+            dissolved_elements (dict): A dictionary where each key is the name of an element (str),
+                                       and each value is another dictionary with the following keys:
+                                       - 'initial' (float): The initial concentration of the element.
+                                       - 'min' (float): The minimum acceptable concentration of the element.
+                                       - 'max' (float): The maximum acceptable concentration of the element.
 
+        Raises:
+            ValueError: If the dissolved elements do not match the schema of the monitor.
+            TypeError: If any concentration is not numeric.
+        """
+        schema = self._schema
+        if DissolvedElementsSchema.compile(dissolved_elements) is not schema:
+            raise ValueError("The dissolved_elements do not match the schema of the monitor.")
+
+        self._dissolved_elements = dissolved_elements
+        # The concentrations and their bounds are held in vectors indexed by element, the element properties
+        # of the schema are views over them. The range objects are only built when first needed
+        self._element_ranges = {}
+        self._lower_bounds = schema.lower_bounds.copy()
+        self._upper_bounds = schema.upper_bounds.copy()
+        initial_values = [dissolved_elements[element].get("initial", 0) for element in schema.elements]
+        numeric = all(isinstance(value, (int, float)) for value in initial_values)
+        self._concentrations = np.array(initial_values, dtype=float) if numeric else np.zeros(len(initial_values))
+        if not numeric or not np.all((self._lower_bounds <= self._concentrations) &
+                                     (self._concentrations <= self._upper_bounds)):
+            # Use the schema property setters to report the invalid initial values
+            for element, initial_value in zip(schema.elements, initial_values):
+                setattr(self, element, initial_value)
@@ -14,6 +14,8 @@ class WaterPropertyRange:
         upper_bound: Gets or sets the upper bound of the property range.
         __repr__(): Returns a string representation of the PropertyRange object.
     """
+    __slots__ = ('_property_name', '_lower_bound', '_upper_bound')
+
     properties_ranges = {
         "temperature": {"lower_bound": -30, "upper_bound": 100},
         "ph": {"lower_bound": 0, "upper_bound": 14},
@@ -1,5 +1,72 @@
+import numpy as np
+from collections import deque
+from collections.abc import Sequence
 from src.simulation.water.water_property_range import WaterPropertyRange
 
+
+class AlertRecord:
+    """
+    An alert of the water quality monitor, coalescing the consecutive alerts of one water property (or the
+    consecutive identical alert messages) into one record.
+
+    Attributes:
+        parameter (str | None): The water property out of range, None for alerts recorded as plain messages.
+        message (str): The alert message of the first alert.
+        first_value (float | int | None): The value of the first alert.
+        last_value (float | int | None): The value of the last alert.
+        count (int): The number of coalesced alerts.
+        first_time: The timestamp of the first alert.
+        last_time: The timestamp of the last alert.
+    """
+    __slots__ = ('parameter', 'message', 'first_value', 'last_value', 'count', 'first_time', 'last_time')
+
+    def __init__(self, parameter, message: str, value, time):
+        self.parameter = parameter
+        self.message = message
+        self.first_value = self.last_value = value
+        self.count = 1
+        self.first_time = self.last_time = time
+
+    def __repr__(self):
+        return (f"AlertRecord({self.message!r}, count={self.count}, first_time={self.first_time}, "
+                f"last_time={self.last_time})")
+
+
+class AlertMessages(Sequence):
+    """
+    A read-only view of the alert messages of a water quality monitor, one per alert record, oldest first.
+
+    The view follows the alert records without copying them, and compares equal to a list or tuple of the same
+    messages. It cannot be modified: alerts are added with the `alerts` setter of the monitor (or by its
+    analysis) and cleared with `clean_alerts`.
+    """
+    __slots__ = ('_records',)
+
+    def __init__(self, records: deque):
+        self._records = records
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [record.message for record in self._records][index]
+        return self._records[index].message
+
+    def __iter__(self):
+        return (record.message for record in self._records)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, AlertMessages)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"AlertMessages({list(self)!r})"
+
+
 class WaterQualityMonitor:
     """
     A class to monitor water quality by analyzing various water properties such as pH, turbidity, temperature, and TDS (Total Dissolved Solids).
@@ -9,12 +76,14 @@ class WaterQualityMonitor:
         turbidity_range (WaterPropertyRange): The acceptable range for turbidity levels.
         temperature_range (WaterPropertyRange): The acceptable range for temperature levels.
         tds_range (WaterPropertyRange): The acceptable range for Total Dissolved Solids (TDS) levels.
-        alerts (list): A list to store alert messages.
+        alerts (AlertMessages): A read-only view of the alert messages, one per alert record.
+        alert_records (list): The alert records, oldest first, at most `alert_capacity` of them.
         status (dict): A dictionary to store the status of each water property.
 
     Methods:
         validate_data(water_data): Validates the input water data.
         analyze_data(water_data): Analyzes the water data against the specified ranges.
+        analyze_series(water_series, times): Analyzes time series of water data against the specified ranges.
         generate_alert(parameters, value): Generates an alert if a water property is out of range.
         output_status(): Returns the status of each water property.
     """
@@ -22,12 +91,19 @@ class WaterQualityMonitor:
                  ph_range: WaterPropertyRange,
                  turbidity_range: WaterPropertyRange,
                  temperature_range: WaterPropertyRange,
-                 tds_range: WaterPropertyRange):
+                 tds_range: WaterPropertyRange,
+                 alert_capacity: int = 1000):
         self.ph_range = ph_range
         self.turbidity_range = turbidity_range
         self.temperature_range = temperature_range
         self.tds_range = tds_range
-        self._alerts = list()
+        if not isinstance(alert_capacity, int) or alert_capacity < 1:
+            raise ValueError("Alert capacity must be a positive integer.")
+        # A ring buffer of alert records, the oldest ones being dropped once it is full. The open records of the
+        # water properties still out of range coalesce their next alerts
+        self._alerts = deque(maxlen=alert_capacity)
+        self._open_alerts = dict()
+        self._readings = 0
         self._status = dict()
 
     @property
@@ -131,19 +207,24 @@ class WaterQualityMonitor:
         self._tds_range=value
 
     @property
-    def alerts(self)->list:
+    def alerts(self) -> AlertMessages:
         """
-        Get the list of alerts generated during analysis.
+        Get the messages of the alerts generated during analysis, one per alert record.
+
+        The alerts used to be a list that could be modified in place. They are now a read-only view of the
+        alert records, so `alerts.clear()` and `alerts.append(...)` raise AttributeError: use `clean_alerts`
+        and the `alerts` setter instead.
 
         Returns:
-            list: List of alert messages.
+            AlertMessages: A read-only view of the alert messages, oldest first.
         """
-        return self._alerts
+        return AlertMessages(self._alerts)
 
     @alerts.setter
     def alerts(self, value: str):
         """
-        Set the alerts property with a new alert value.
+        Set the alerts property with a new alert value, coalesced with the last alert record if it has the
+        same message.
 
         Args:
             value (str): The alert message to be added.
@@ -153,7 +234,61 @@ class WaterQualityMonitor:
         """
         if not isinstance(value, str):
             raise TypeError("Alert must be a string.")
-        self._alerts.append(value)
+        self._record_alert(None, value, None, None)
+
+    @property
+    def alert_records(self) -> list:
+        """
+        Get the alert records, oldest first.
+
+        Returns:
+            list: List of AlertRecord objects.
+        """
+        return list(self._alerts)
+
+    @property
+    def alert_capacity(self) -> int:
+        """
+        Get the maximum number of alert records kept.
+
+        Returns:
+            int: The capacity of the alert buffer.
+        """
+        return self._alerts.maxlen
+
+    def _record_alert(self, parameter, message, value, time) -> AlertRecord:
+        """
+        Coalesces an alert into the open record of its water property (or, for a plain message, into the last
+        record when it has the same message), or appends a new record to the alert buffer, in O(1).
+
+        The open records are keyed by water property only, so a plain message never coalesces into the record
+        of a water property, whatever its text.
+        """
+        if parameter is not None:
+            record = self._open_alerts.get(parameter)
+        elif self._alerts and self._alerts[-1].parameter is None and self._alerts[-1].message == message:
+            record = self._alerts[-1]
+        else:
+            record = None
+        if record is not None:
+            record.count += 1
+            record.last_value = value
+            record.last_time = time
+            return record
+
+        if message is None:
+            message = f"Alert! {parameter}: {value} out of range"
+        record = AlertRecord(parameter, message, value, time)
+        alerts = self._alerts
+        if len(alerts) == alerts.maxlen:
+            # The oldest record is dropped, it cannot coalesce alerts anymore
+            oldest = alerts[0]
+            if oldest.parameter is not None and self._open_alerts.get(oldest.parameter) is oldest:
+                del self._open_alerts[oldest.parameter]
+        alerts.append(record)
+        if parameter is not None:
+            self._open_alerts[parameter] = record
+        return record
 
     @property
     def status(self) -> dict:
@@ -201,55 +336,140 @@ class WaterQualityMonitor:
                 raise AttributeError(f"No attribute found for {water_property}.")
         return True
 
-    def analyze_data(self, water_data: dict) -> bool:
+    def analyze_data(self, water_data: dict, time=None) -> bool:
         """
         Analyze water data against predefined acceptable ranges for each property.
 
         Args:
             water_data (dict): A dictionary containing water properties and their corresponding values.
+            time (optional): The timestamp of the readings in the alert records. Defaults to the number of
+                             readings analyzed before.
 
         Returns:
             bool: True if all water properties are within acceptable ranges, False otherwise.
 
         Side Effects:
             Updates the `status` attribute with the analysis result for each water property.
-            Calls `generate_alert` method if any property is outside the acceptable range.
+            Calls `generate_alert` method if any property is outside the acceptable range. The alerts of a
+            property staying out of range over consecutive readings are coalesced into one alert record, which
+            is closed by its first reading in range.
         """
+        if time is None:
+            time = self._readings
+        self._readings += 1
         for water_property, value in water_data.items():
             property_range=getattr(self,f"{water_property}_range")
             if not (property_range.lower_bound<=value<=property_range.upper_bound):
                 self.status = {water_property:f"{value} is outside the acceptable range."}
-                self.generate_alert(water_property,value)
+                self.generate_alert(water_property,value,time)
             else:
                 self.status = {water_property: "OK"}
+                self._open_alerts.pop(water_property, None)
 
         if any(status != "OK" for status in self.status.values()):
                 return False
         return True
 
-    def generate_alert(self, parameters: str, value: float|int):
+    def analyze_series(self, water_series: dict, times=None) -> tuple[dict, list]:
+        """
+        Analyze time series of water data against the acceptable ranges, e.g. to audit a year of simulated
+        readings at once.
+
+        Unlike `analyze_data`, the analysis is vectorized over the readings and has no side effects: neither the
+        `status` nor the `alerts` are updated.
+
+        Args:
+            water_series (dict): A dictionary mapping water properties to their readings (array-like), all of the
+                                 same length.
+            times (array-like, optional): The time of every reading, reported as the start and end of the
+                                          violation intervals instead of the reading indices.
+
+        Returns:
+            tuple: The violation masks and the violation intervals:
+                - dict: A boolean numpy.ndarray per water property, True where the reading is out of range.
+                - list: A (water property, start, end, extreme value) tuple per run of consecutive readings out
+                  of range, in start order. Start and end are the indices (or times) of the first and last
+                  readings of the run, and the extreme value is the reading furthest outside the range.
+
+        Raises:
+            TypeError: If any reading is not numeric.
+            AttributeError: If a water property does not have a corresponding range attribute in the class.
+            ValueError: If the readings (and times) do not all have the same length.
+        """
+        masks = dict()
+        starts, ends, extremes, water_properties = [], [], [], []
+        length = None
+        for water_property, values in water_series.items():
+            try:
+                values = np.asarray(values, dtype=float)
+            except (TypeError, ValueError) as e:
+                raise TypeError(f"Values for {water_property} must be numeric.") from e
+            if not hasattr(self, f"{water_property}_range"):
+                raise AttributeError(f"No attribute found for {water_property}.")
+            if values.ndim != 1 or (length is not None and values.size != length):
+                raise ValueError("Readings must be one-dimensional series of the same length.")
+            length = values.size
+
+            property_range = getattr(self, f"{water_property}_range")
+            lower_bound, upper_bound = property_range.lower_bound, property_range.upper_bound
+            mask = ~((lower_bound <= values) & (values <= upper_bound))
+            masks[water_property] = mask
+
+            # Runs of violations start where the padded mask rises and end where it falls
+            edges = np.diff(np.concatenate(([False], mask, [False])).astype(np.int8))
+            run_starts = np.flatnonzero(edges == 1)
+            run_ends = np.flatnonzero(edges == -1)
+            if not run_starts.size:
+                continue
+            # The extreme of a run is its minimum or its maximum, whichever is further outside the range
+            boundaries = np.column_stack((run_starts, run_ends)).ravel()[:-1] if run_ends[-1] == length \
+                else np.column_stack((run_starts, run_ends)).ravel()
+            minimums = np.minimum.reduceat(values, boundaries)[::2]
+            maximums = np.maximum.reduceat(values, boundaries)[::2]
+            extremes.append(np.where(lower_bound - minimums >= maximums - upper_bound, minimums, maximums))
+            starts.append(run_starts)
+            ends.append(run_ends - 1)
+            water_properties.extend([water_property] * run_starts.size)
+
+        if times is not None:
+            times = np.asarray(times)
+            if times.ndim != 1 or (length is not None and times.size != length):
+                raise ValueError("Times must be a one-dimensional series of the length of the readings.")
+        if not starts:
+            return masks, []
+
+        starts, ends, extremes = np.concatenate(starts), np.concatenate(ends), np.concatenate(extremes)
+        order = np.argsort(starts, kind='stable')
+        if times is not None:
+            starts, ends = times[starts], times[ends]
+        intervals = list(zip([water_properties[index] for index in order], starts[order].tolist(),
+                             ends[order].tolist(), extremes[order].tolist()))
+        return masks, intervals
+
+    def generate_alert(self, parameters: str, value: float|int, time=None):
         """
         Generate and log an alert message when a parameter value is out of range.
 
         Args:
             parameters (str): The name of the parameter that is out of range.
             value (float|int): The value of the parameter that is out of range.
+            time (optional): The timestamp of the alert. Defaults to None.
 
         Returns:
-            str: The generated alert message.
+            str: The alert message of the alert record.
 
         Side Effects:
-            Appends the alert message to the `alerts` list and prints it to the console.
+            Coalesces the alert into the open alert record of the parameter, or appends a new alert record to
+            the alerts, dropping the oldest one if the alerts are full.
         """
-        msg_alert = f"Alert! {parameters}: {value} out of range"
-        self.alerts = msg_alert
-        return msg_alert
+        return self._record_alert(parameters, None, value, time).message
 
     def clean_alerts(self):
         """
         Clears the alerts list.
         """
-        self.alerts.clear()
+        self._alerts.clear()
+        self._open_alerts.clear()
 
     def output_status(self):
         """
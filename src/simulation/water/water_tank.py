@@ -1,5 +1,7 @@
+import numpy as np
 from src.simulation.water.water import Water
-from functools import wraps
+from src.simulation.common import BinnedStatistics
+from types import MappingProxyType
 
 class WaterTank(Water):
     """
@@ -16,8 +18,14 @@ class WaterTank(Water):
         tank_type (str): The type of the tank (e.g., "fish tank", "liquid composter").
         water_surface_area (float): The calculated surface area of the water in the tank.
         total_water_evaporated (float): The total amount of water evaporated from the tank.
-        evaporation_rates (dict): A dictionary tracking evaporation rates by air temperature.
+        evaporation_rates (BinnedStatistics): The count, mean, minimum and maximum evaporation rates by air
+            temperature, in bins of `EVAPORATION_RATE_BIN_WIDTH` degrees over the valid evaporation temperatures.
     """
+    __slots__ = ('_tank_length', '_tank_width', '_tank_depth', '_tank_type', '_water_surface_area',
+                 'total_water_evaporated', 'evaporation_rates', '_tank_status', '_tank_status_source')
+
+    # Air temperature resolution of the evaporation rate statistics, in degrees Celsius
+    EVAPORATION_RATE_BIN_WIDTH = 0.5
 
     def __init__(self,
                  tank_length: int | float,
@@ -39,35 +47,122 @@ class WaterTank(Water):
         """
         tank_capacity = (tank_length / 100) * (tank_width / 100) * (tank_depth / 100) * 1000
         super().__init__(0, tank_capacity)
+        self._tank_status = None
+        self._tank_status_source = None  # The water status snapshot the tank status was built from
         self.tank_length = tank_length
         self.tank_width = tank_width
         self.tank_depth = tank_depth
         self.tank_type = tank_type.lower()
         self.water_surface_area = self._define_water_surface_area()
         self.total_water_evaporated = 0
-        self.evaporation_rates = {}
-        self._decorate_evaporate()
-        self._tank_status = {}
+        # Binned instead of keyed by the exact (noisy) air temperature, so memory stays bounded over long runs
+        self.evaporation_rates = BinnedStatistics(Water._evaporation_air_temp_range.lower_bound,
+                                                  Water._evaporation_air_temp_range.upper_bound,
+                                                  self.EVAPORATION_RATE_BIN_WIDTH)
 
     @property
     def status(self):
         """
         Retrieve the current status of the tank.
 
-        The status includes tank dimensions, type, water properties, and evaporation metrics.
+        The status includes tank dimensions, type, water properties, and evaporation metrics. Like the water
+        status it is a cached, read-only snapshot, rebuilt only when the water status or a tank field changed.
 
         Returns:
-            dict: A dictionary containing tank and water-related metrics.
-        """
-        self._tank_status = {
-            "tank_length": self.tank_length,
-            "tank_width": self.tank_width,
-            "tank_depth": self.tank_depth,
-            "tank_type": self.tank_type,
-            "water_surface_area": self.water_surface_area}
-        self._tank_status.update(self._water_status)
+            MappingProxyType: A read-only mapping containing tank and water-related metrics.
+        """
+        water_status = super().status
+        if self._tank_status_source is not water_status:
+            self._tank_status = MappingProxyType({
+                "tank_length": self._tank_length,
+                "tank_width": self._tank_width,
+                "tank_depth": self._tank_depth,
+                "tank_type": self._tank_type,
+                "water_surface_area": self._water_surface_area,
+                **water_status})
+            self._tank_status_source = water_status
         return self._tank_status
 
+    @property
+    def tank_length(self) -> int | float:
+        """
+        Get the length of the tank in centimeters.
+        """
+        return self._tank_length
+
+    @tank_length.setter
+    def tank_length(self, value: int | float):
+        """
+        Set the length of the tank in centimeters.
+        """
+        self._tank_length = value
+        self._tank_status_source = None
+
+    @property
+    def tank_width(self) -> int | float:
+        """
+        Get the width of the tank in centimeters.
+        """
+        return self._tank_width
+
+    @tank_width.setter
+    def tank_width(self, value: int | float):
+        """
+        Set the width of the tank in centimeters.
+        """
+        self._tank_width = value
+        self._tank_status_source = None
+
+    @property
+    def tank_depth(self) -> int | float:
+        """
+        Get the depth of the tank in centimeters.
+        """
+        return self._tank_depth
+
+    @tank_depth.setter
+    def tank_depth(self, value: int | float):
+        """
+        Set the depth of the tank in centimeters.
+        """
+        self._tank_depth = value
+        self._tank_status_source = None
+
+    @property
+    def tank_type(self) -> str:
+        """
+        Get the type of the tank.
+        """
+        return self._tank_type
+
+    @tank_type.setter
+    def tank_type(self, value: str):
+        """
+        Set the type of the tank.
+        """
+        self._tank_type = value
+        self._tank_status_source = None
+
+    @property
+    def water_surface_area(self) -> float:
+        """
+        Get the water surface area exposed to ambient air, in square meters.
+        """
+        return self._water_surface_area
+
+    @water_surface_area.setter
+    def water_surface_area(self, value: float):
+        """
+        Set the water surface area exposed to ambient air, in square meters.
+        """
+        self._water_surface_area = value
+        self._tank_status_source = None
+
+    def __getstate__(self):
+        instance_state, slots_state = super().__getstate__()
+        slots_state['_tank_status'] = slots_state['_tank_status_source'] = None
+        return instance_state, slots_state
+
     @property
     def length(self):
         """
@@ -80,7 +175,7 @@ class WaterTank(Water):
             ValueError: If the length is negative.
             TypeError: If the length is not numeric.
         """
-        return self.tank_length
+        return self._tank_length
 
     @property
     def width(self):
@@ -94,7 +189,7 @@ class WaterTank(Water):
             ValueError: If the width is negative.
             TypeError: If the width is not numeric.
         """
-        return self.tank_width
+        return self._tank_width
 
     @property
     def depth(self):
@@ -108,53 +203,56 @@ class WaterTank(Water):
             ValueError: If the depth is negative.
             TypeError: If the depth is not numeric.
         """
-        return self.tank_depth
-
-    def _decorate_evaporate(self):
-        """
-        A method that decorates the `evaporate` method to track and calculate additional metrics
-        such as total evaporated water and evaporation rate. This allows the tank to 
-        monitor evaporation rates under varying conditions like air temperature.
-    
-        The decorated method also maintains a record of evaporation metrics in a dictionary.
-        """
-        # Store the original `evaporate` method for use in decoration
-        original_evaporate = self.evaporate
-    
-        @wraps(original_evaporate)
-        def evaporate_with_evaporation_tracker(*args, **kwargs):
-            """
-            A wrapper function around the `evaporate` method to track evaporated water
-            and compute evaporation metrics such as evaporation rate, updated using
-            the tank's water surface area and input temperature.
-    
-            Args:
-                *args: Positional arguments passed to the original `evaporate` method.
-                **kwargs: Keyword arguments passed to the original `evaporate` method.
-    
-            Returns:
-                float: The amount of water evaporated in liters.
-            """
-            # Invoke the original `evaporate` method and capture the water evaporated
-            water_evaporated = original_evaporate(*args, **kwargs)
-            
-            # Update the tracked total water evaporation
-            self.total_water_evaporated += water_evaporated
-    
-            # Extract relevant parameters (`air_temp` and `time_elapsed_sec`) from arguments
-            air_temp = kwargs.get("air_temp", args[0] if args else 0)
-            time_elapsed_sec = kwargs.get("time_elapsed_sec", args[-1] if args else 1)
-    
-            # Calculate and record the evaporation rate if evaporation occurred
-            if self.water_surface_area > 0 and water_evaporated > 0:  # Ensure valid conditions
-                evaporation_rate = (water_evaporated / self.water_surface_area) / time_elapsed_sec
-                self.evaporation_rates[air_temp] = evaporation_rate  # Store result by temperature
-    
-            # Return the amount of water evaporated for further use
-            return water_evaporated
-    
-        # Replace the `evaporate` method with the decorated version
-        self.evaporate = evaporate_with_evaporation_tracker
+        return self._tank_depth
+
+    def evaporate(self,
+                  air_temp: int | float,
+                  surface_area: int | float,
+                  rel_humidity: int | float,
+                  time_elapsed_sec: int,
+                  *,
+                  trusted: bool = False,
+                  dry_out: bool = False) -> int | float:
+        """
+        Evaporates water (see `Water.evaporate`) and tracks additional metrics such as the total evaporated
+        water and the evaporation rate, so that the tank monitors evaporation rates under varying conditions
+        like air temperature.
+
+        Returns:
+            float: The amount of water evaporated in liters.
+        """
+        water_evaporated = super().evaporate(air_temp, surface_area, rel_humidity, time_elapsed_sec,
+                                             trusted=trusted, dry_out=dry_out)
+
+        # Update the tracked total water evaporation
+        self.total_water_evaporated += water_evaporated
+
+        # Calculate and record the evaporation rate if evaporation occurred
+        if self._water_surface_area > 0 and water_evaporated > 0:  # Ensure valid conditions
+            evaporation_rate = (water_evaporated / self._water_surface_area) / time_elapsed_sec
+            self.evaporation_rates.add(air_temp, evaporation_rate)  # Store result by temperature
+
+        return water_evaporated
+
+    def evaporate_many(self, air_temps, surface_area, rel_humidities, times_elapsed_sec):
+        """
+        Batch counterpart of the tracked `evaporate`: evaporates consecutive time steps in a single pass
+        (see `Water.evaporate_many`) and records the total evaporated water and the evaporation rates.
+
+        Returns:
+            numpy.ndarray: The water evaporated at every step, in liters.
+        """
+        water_evaporated = super().evaporate_many(air_temps, surface_area, rel_humidities, times_elapsed_sec)
+        self.total_water_evaporated += float(water_evaporated.sum())
+
+        if self._water_surface_area > 0:
+            evaporated = water_evaporated > 0
+            # Scalar temperatures or times apply to every step, whichever input gave the batch its length
+            air_temps = np.broadcast_to(np.asarray(air_temps, dtype=float), water_evaporated.shape)
+            times_elapsed_sec = np.broadcast_to(np.asarray(times_elapsed_sec, dtype=float), water_evaporated.shape)
+            evaporation_rates = (water_evaporated / self._water_surface_area) / times_elapsed_sec
+            self.evaporation_rates.add_many(air_temps[evaporated], evaporation_rates[evaporated])
+        return water_evaporated
 
     def _define_water_surface_area(self):
         """
@@ -164,7 +262,7 @@ class WaterTank(Water):
             float: The water surface area in square meters. If the tank type is unsupported,
                    the result is 0 because that means the water tank is sealed from ambient air.
         """
-        if self.tank_type in ("fish_tank", "liquid_composter"):
-            return (self.tank_length / 100) * (self.tank_width / 100)
+        if self._tank_type in ("fish_tank", "liquid_composter"):
+            return (self._tank_length / 100) * (self._tank_width / 100)
         else:
             return 0
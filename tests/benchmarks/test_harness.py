@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+import unittest
+from benchmarks import harness
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """
+    Unit tests for the benchmark registry, runner and JSON results.
+    """
+
+    def setUp(self):
+        self.registered = dict(harness.BENCHMARKS)
+        self.calls = []
+
+        @harness.benchmark('test.append', number=50, repeat=3, steps_per_call=2)
+        def bench_append():
+            return lambda: self.calls.append(None)
+
+    def tearDown(self):
+        harness.BENCHMARKS.clear()
+        harness.BENCHMARKS.update(self.registered)
+
+    def test_run_benchmark_reports_latency_and_throughput(self):
+        """
+        Test that a benchmark is warmed up, called `number` times per repetition and reports its timings.
+        """
+        result = harness.run_benchmark('test.append')
+        self.assertEqual(1 + 50 * 3, len(self.calls))
+        self.assertEqual(('test.append', 50, 3, 2), (result['name'], result['number'], result['repeat'],
+                                                     result['steps_per_call']))
+        timings = result['per_call_seconds']
+        self.assertLessEqual(timings['min'], timings['median'])
+        self.assertAlmostEqual(2 / timings['median'], result['steps_per_second'])
+
+    def test_quick_mode_runs_fewer_calls(self):
+        """
+        Test that quick mode runs a tenth of the calls and at most two repetitions.
+        """
+        result = harness.run_benchmark('test.append', quick=True)
+        self.assertEqual((5, 2), (result['number'], result['repeat']))
+
+    def test_results_round_trip_and_compare(self):
+        """
+        Test that results are written as JSON and that two runs can be compared.
+        """
+        results = harness.run_benchmarks(['test.append'])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results.json')
+            harness.write_results(results, path)
+            with open(path, 'r') as f:
+                loaded = json.load(f)
+        self.assertIn('python', loaded['environment'])
+        self.assertEqual({'test.append': 1.0}, harness.compare_results(loaded, loaded))
+
+    def test_memory_benchmark_reports_bytes_per_instance(self):
+        """
+        Test that a memory benchmark measures the memory kept alive per created instance and compares runs.
+        """
+        @harness.memory_benchmark('test.memory', count=1000)
+        def bench_memory():
+            return lambda: bytearray(1000)
+
+        result = harness.run_benchmark('test.memory')
+        self.assertEqual(('test.memory', 1000), (result['name'], result['count']))
+        self.assertGreaterEqual(result['bytes_per_instance'], 1000)
+        self.assertLess(result['bytes_per_instance'], 1200)
+        baseline = {'results': [dict(result, bytes_per_instance=2 * result['bytes_per_instance'])]}
+        self.assertAlmostEqual(2, harness.compare_results(baseline, {'results': [result]})['test.memory'])
+
+    def test_unknown_and_duplicate_benchmarks_raise(self):
+        """
+        Test that running an unknown benchmark raises KeyError and registering a name twice raises ValueError.
+        """
+        with self.assertRaises(KeyError):
+            harness.run_benchmarks(['test.unknown'])
+        with self.assertRaises(ValueError):
+            harness.benchmark('test.append')(lambda: None)
+
+
+if __name__ == '__main__':
+    unittest.main()
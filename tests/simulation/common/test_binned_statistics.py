@@ -0,0 +1,89 @@
+import pickle
+import unittest
+import numpy as np
+from src.simulation.common.binned_statistics import BinnedStatistics
+
+
+class TestBinnedStatistics(unittest.TestCase):
+    """
+    Unit tests for the fixed-memory BinnedStatistics.
+    """
+
+    def setUp(self):
+        self.statistics = BinnedStatistics(-10, 50, 0.5)
+
+    def test_statistics_per_bin(self):
+        """
+        Test the count, mean, minimum and maximum of every non-empty bin.
+        """
+        for key, value in [(20.1, 1.0), (20.4, 3.0), (20.6, 5.0), (-3, 2.0)]:
+            self.statistics.add(key, value)
+        statistics = self.statistics.statistics()
+        np.testing.assert_array_equal(statistics['center'], [-2.75, 20.25, 20.75])
+        np.testing.assert_array_equal(statistics['count'], [1, 2, 1])
+        np.testing.assert_array_equal(statistics['mean'], [2, 2, 5])
+        np.testing.assert_array_equal(statistics['min'], [2, 1, 5])
+        np.testing.assert_array_equal(statistics['max'], [2, 3, 5])
+        self.assertEqual(self.statistics.count, 4)
+
+    def test_memory_is_bounded(self):
+        """
+        Test that noisy keys fill at most the fixed number of bins, clamping keys outside the range.
+        """
+        rng = np.random.default_rng(0)
+        for key in rng.uniform(-20, 60, 10000).tolist():
+            self.statistics.add(key, 1.0)
+        self.assertEqual(len(self.statistics), self.statistics.bins)
+        self.assertEqual(self.statistics.count, 10000)
+        self.assertIn(-100, self.statistics)
+        self.assertEqual(self.statistics.bin_index(100), self.statistics.bins - 1)
+
+    def test_add_many_matches_add(self):
+        """
+        Test that adding values in a batch gives the same statistics as adding them one by one.
+        """
+        rng = np.random.default_rng(1)
+        keys, values = rng.uniform(-15, 55, 500), rng.normal(size=500)
+        other = BinnedStatistics(-10, 50, 0.5)
+        for key, value in zip(keys.tolist(), values.tolist()):
+            self.statistics.add(key, value)
+        other.add_many(keys, values)
+        for name, expected in self.statistics.statistics().items():
+            np.testing.assert_allclose(other.statistics()[name], expected, rtol=1e-12)
+        with self.assertRaises(ValueError):
+            other.add_many([1, 2], [1])
+
+    def test_mapping_methods(self):
+        """
+        Test that keys are looked up by bin, like dictionary entries keyed by any key of the bin.
+        """
+        self.assertIsNone(self.statistics.get(20))
+        with self.assertRaises(KeyError):
+            self.statistics[20]
+        self.statistics.add(20, 4.0)
+        self.statistics.add(20.3, 2.0)
+        self.assertEqual(self.statistics.get(20.49), 3.0)
+        self.assertEqual(self.statistics[20.25], 3.0)
+        self.assertEqual(self.statistics.keys(), [20.25])
+        self.assertEqual(self.statistics.items(), [(20.25, 3.0)])
+
+    def test_pickling(self):
+        """
+        Test that the statistics survive pickling.
+        """
+        self.statistics.add(5, 1.5)
+        copied = pickle.loads(pickle.dumps(self.statistics))
+        self.assertEqual(copied.items(), self.statistics.items())
+
+    def test_invalid_arguments(self):
+        """
+        Test that invalid bounds and bin widths raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            BinnedStatistics(10, 10, 1)
+        with self.assertRaises(ValueError):
+            BinnedStatistics(0, 10, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from src.simulation.common.helpers import EventLoopYielder, get_event_loop_yielder
+
+
+class TestEventLoopYielder(unittest.TestCase):
+    """
+    Unit tests for the EventLoopYielder used by headless simulations.
+    """
+
+    def test_yields_every_n_steps(self):
+        """
+        Test that control is handed back to the event loop only once every `every_n_steps` ticks.
+        """
+        yielder = EventLoopYielder(every_n_steps=10, time_budget=3600)
+        switches = 0
+
+        async def observer():
+            nonlocal switches
+            while True:
+                switches += 1
+                await asyncio.sleep(0)
+
+        async def run():
+            task = asyncio.create_task(observer())
+            await asyncio.sleep(0)  # Let the observer start
+            start = switches
+            for _ in range(100):
+                await yielder.tick()
+            task.cancel()
+            return switches - start
+
+        self.assertEqual(10, asyncio.run(run()), "The event loop should be yielded to 10 times in 100 steps")
+
+    def test_yields_on_time_budget(self):
+        """
+        Test that an exhausted time budget forces a yield even before `every_n_steps` ticks.
+        """
+        yielder = EventLoopYielder(every_n_steps=1000000, time_budget=1e-9)
+        asyncio.run(yielder.tick())
+        self.assertEqual(0, yielder._steps_since_yield, "The step counter should be reset after a yield")
+
+    def test_invalid_parameters(self):
+        """
+        Test that invalid step counts and time budgets raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            EventLoopYielder(every_n_steps=0)
+        with self.assertRaises(ValueError):
+            EventLoopYielder(time_budget=0)
+
+    def test_get_event_loop_yielder_from_config(self):
+        """
+        Test that the yielder is configured from the optional simulation configuration keys.
+        """
+        yielder = get_event_loop_yielder({'yield_every_n_steps': 50, 'yield_time_budget': 0.5})
+        self.assertEqual(50, yielder.every_n_steps)
+        self.assertEqual(0.5, yielder.time_budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
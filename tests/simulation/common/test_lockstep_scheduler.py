@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from src.simulation.common.lockstep_scheduler import LockstepScheduler
+from src.simulation.common.step_channel import StepChannel
+
+
+class Producer:
+    def __init__(self, channel, log):
+        self.channel = channel
+        self.log = log
+        self.prepared_with = None
+
+    def prepare(self, simulation_config):
+        self.prepared_with = simulation_config
+
+    def step(self, sim_date_time, sampling_rate):
+        self.log.append(('producer', sim_date_time))
+        self.channel.put_nowait(sim_date_time, sim_date_time.hour)
+
+
+class Consumer:
+    def __init__(self, channel, log):
+        self.channel = channel
+        self.log = log
+        self.values = []
+
+    def step(self, sim_date_time, sampling_rate):
+        self.log.append(('consumer', sim_date_time))
+        self.values.append(self.channel.get_nowait(sim_date_time)[1])
+
+
+class TestLockstepScheduler(unittest.TestCase):
+    """
+    Unit tests for the LockstepScheduler stepping co-simulated components.
+    """
+
+    def setUp(self):
+        self.simulation_config = {
+            "duration": 1,
+            "time_unit": "day",
+            "sample_unit": "hour",
+            "start_date_time": "01/01 00:00:00",
+            "start_date_time_format": "%m/%d %H:%M:%S"
+        }
+        self.log = []
+        self.channel = StepChannel(('hour',), capacity=1)
+        self.producer = Producer(self.channel, self.log)
+        self.consumer = Consumer(self.channel, self.log)
+        self.scheduler = LockstepScheduler(self.simulation_config, (self.producer, self.consumer))
+
+    def test_run_steps_components_in_order(self):
+        """
+        Test that every component is stepped once per timestamp, in the given order.
+        """
+        self.scheduler.run()
+        start = datetime(1900, 1, 1)
+        expected = []
+        for hour in range(24):
+            expected += [('producer', start + timedelta(hours=hour)), ('consumer', start + timedelta(hours=hour))]
+        self.assertEqual(expected, self.log)
+        self.assertEqual([float(hour) for hour in range(24)], self.consumer.values)
+        self.assertEqual(self.simulation_config, self.producer.prepared_with)
+        self.assertEqual(86400, self.scheduler.simulated_seconds)
+        self.assertTrue(self.scheduler.done())
+
+    def test_run_async_matches_run(self):
+        """
+        Test that the asynchronous run steps the components exactly like the synchronous one.
+        """
+        asyncio.run(self.scheduler.run_async())
+        self.assertEqual(48, len(self.log))
+        self.assertEqual([float(hour) for hour in range(24)], self.consumer.values)
+
+    def test_component_without_step_raises(self):
+        """
+        Test that a component without a step method is rejected.
+        """
+        with self.assertRaises(ValueError):
+            LockstepScheduler(self.simulation_config, (object(),))
+        with self.assertRaises(ValueError):
+            LockstepScheduler(self.simulation_config, ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from src.simulation.common.random_streams import RandomStreams, BatchedRandom
+
+
+class TestRandomStreams(unittest.TestCase):
+    """
+    Unit tests for the seeded RandomStreams and the BatchedRandom drawer.
+    """
+
+    def test_named_streams_are_reproducible_and_order_independent(self):
+        """
+        Test that a named stream only depends on the master seed and its name.
+        """
+        streams = RandomStreams(42)
+        weather = streams.generator('seasonal_weather').random(5)
+        other = RandomStreams(42)
+        other.generator('sensor')
+        np.testing.assert_array_equal(weather, other.generator('seasonal_weather').random(5))
+
+    def test_named_streams_are_independent(self):
+        """
+        Test that different names and different seeds give different streams.
+        """
+        streams = RandomStreams(42)
+        self.assertFalse(np.array_equal(streams.generator('a').random(5), streams.generator('b').random(5)))
+        self.assertFalse(np.array_equal(RandomStreams(1).generator('a').random(5),
+                                        RandomStreams(2).generator('a').random(5)))
+
+    def test_spawn_children_are_reproducible(self):
+        """
+        Test that spawned children are distinct from each other and reproducible from the master seed.
+        """
+        first = [child.generator('a').random() for child in RandomStreams(3).spawn(4)]
+        second = [child.generator('a').random() for child in RandomStreams(3).spawn(4)]
+        self.assertEqual(first, second)
+        self.assertEqual(4, len(set(first)))
+
+    def test_batched_random_matches_generator_blocks(self):
+        """
+        Test that batched draws replay the generator's uniform stream across block boundaries.
+        """
+        batched = BatchedRandom(np.random.default_rng(5), block_size=3)
+        expected = np.random.default_rng(5).random(7)
+        np.testing.assert_allclose(expected, [batched.random() for _ in range(7)])
+
+    def test_batched_random_ranges(self):
+        """
+        Test that uniform and randrange stay within their bounds and that an empty range raises ValueError.
+        """
+        batched = RandomStreams(0).batched('a', block_size=16)
+        uniforms = [batched.uniform(-1, 1) for _ in range(1000)]
+        integers = {batched.randrange(0, 10) for _ in range(1000)}
+        self.assertTrue(all(-1 <= value < 1 for value in uniforms))
+        self.assertEqual(set(range(10)), integers)
+        self.assertEqual((8,), batched.draw(8).shape)
+        with self.assertRaises(ValueError):
+            batched.randrange(3, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from src.simulation.common.step_channel import StepChannel
+
+
+class TestStepChannel(unittest.TestCase):
+    """
+    Unit tests for the StepChannel ring buffer connecting producer and consumer simulators.
+    """
+
+    def setUp(self):
+        self.channel = StepChannel(('precipitation_volume', 'air_temperature'), capacity=4)
+
+    def test_put_get_in_order(self):
+        """
+        Test that steps are consumed in the order they were published, with their values.
+        """
+        for step in range(3):
+            self.channel.put_nowait(step, step * 10, step * 0.5)
+        for step in range(3):
+            self.assertEqual((step, step * 10, step * 0.5), self.channel.get_nowait(step))
+        self.assertTrue(self.channel.empty())
+
+    def test_ring_buffer_wraps_around(self):
+        """
+        Test that slots are reused once consumed.
+        """
+        for step in range(10):
+            self.channel.put_nowait(step, step, -step)
+            self.assertEqual((step, step, -step), self.channel.get_nowait())
+
+    def test_full_and_empty(self):
+        """
+        Test that the non-blocking calls raise when the channel is full or empty.
+        """
+        with self.assertRaises(asyncio.QueueEmpty):
+            self.channel.get_nowait()
+        for step in range(4):
+            self.channel.put_nowait(step, 0, 0)
+        self.assertTrue(self.channel.full())
+        with self.assertRaises(asyncio.QueueFull):
+            self.channel.put_nowait(4, 0, 0)
+
+    def test_timestamp_mismatch(self):
+        """
+        Test that a consumer expecting another step does not consume the buffered one.
+        """
+        self.channel.put_nowait(1, 0, 0)
+        with self.assertRaises(ValueError):
+            self.channel.get_nowait(2)
+        self.assertEqual(1, len(self.channel), "The mismatched step should remain in the channel")
+
+    def test_out_of_order_publication(self):
+        """
+        Test that timestamps must be published in increasing order and with one value per field.
+        """
+        self.channel.put_nowait(2, 0, 0)
+        with self.assertRaises(ValueError):
+            self.channel.put_nowait(1, 0, 0)
+        with self.assertRaises(ValueError):
+            self.channel.put_nowait(3, 0)
+
+    def test_every_step_consumed_exactly_once(self):
+        """
+        Test that a fast producer and a slow consumer exchange every step exactly once.
+        """
+        steps = 100
+        consumed = []
+
+        async def producer():
+            for step in range(steps):
+                await self.channel.put(step, step, step)
+
+        async def consumer():
+            for step in range(steps):
+                consumed.append(await self.channel.get(step))
+                if step % 7 == 0:
+                    await asyncio.sleep(0)
+
+        async def run():
+            await asyncio.gather(producer(), consumer())
+
+        asyncio.run(run())
+        self.assertEqual([(step, step, step) for step in range(steps)], consumed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+from src.simulation.common.streaming_quantiles import StreamingQuantiles
+
+
+class TestStreamingQuantiles(unittest.TestCase):
+    """
+    Unit tests for the P² StreamingQuantiles estimator.
+    """
+
+    def setUp(self):
+        self.quantiles = (0.05, 0.5, 0.95)
+        self.estimator = StreamingQuantiles(self.quantiles, 3)
+
+    def test_estimates_converge_to_sample_quantiles(self):
+        """
+        Test that the estimates of several distributions are close to the exact sample quantiles.
+        """
+        rng = np.random.default_rng(1)
+        data = np.column_stack((rng.normal(size=2000), rng.exponential(size=2000), rng.uniform(size=2000)))
+        for row in data:
+            self.estimator.add(row)
+        estimates = self.estimator.result()
+        for q in self.quantiles:
+            with self.subTest(q=q):
+                np.testing.assert_allclose(np.quantile(data, q, axis=0), estimates[q], atol=0.05)
+
+    def test_exact_below_five_observations(self):
+        """
+        Test that the estimates are exact quantiles while fewer than five observations were added.
+        """
+        data = np.array([[1.0, 5.0, -1.0], [3.0, 2.0, -2.0], [2.0, 8.0, -3.0]])
+        for row in data:
+            self.estimator.add(row)
+        estimates = self.estimator.result()
+        for q in self.quantiles:
+            with self.subTest(q=q):
+                np.testing.assert_allclose(np.quantile(data, q, axis=0), estimates[q])
+
+    def test_estimates_stay_within_observed_range(self):
+        """
+        Test that the estimates of a constant series stay exactly at the constant.
+        """
+        for _ in range(50):
+            self.estimator.add([4.0, 4.0, 4.0])
+        for band in self.estimator.result().values():
+            np.testing.assert_array_equal([4.0, 4.0, 4.0], band)
+
+    def test_invalid_input_raises(self):
+        """
+        Test that invalid quantiles, sizes and observation shapes raise ValueError.
+        """
+        with self.assertRaises(ValueError):
+            StreamingQuantiles((1.5,), 3)
+        with self.assertRaises(ValueError):
+            StreamingQuantiles((0.5,), 0)
+        with self.assertRaises(ValueError):
+            self.estimator.add([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            self.estimator.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
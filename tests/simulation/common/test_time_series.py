@@ -0,0 +1,76 @@
+import unittest
+from array import array
+from src.simulation.common.time_series import TimeSeries
+
+
+class TestTimeSeries(unittest.TestCase):
+    """
+    Unit tests for the array-backed TimeSeries store.
+    """
+
+    def setUp(self):
+        self.values = [0.5, 1.5, -2.0, 4.0]
+        self.series = TimeSeries(self.values, capacity=2)
+
+    def test_append_and_length(self):
+        """
+        Test that appending beyond the preallocated capacity keeps every sample.
+        """
+        self.assertEqual(len(self.values), len(self.series))
+        self.series.append(10)
+        self.assertEqual(self.values + [10.0], self.series.to_list())
+
+    def test_running_total_and_mean(self):
+        """
+        Test that the running total and mean match the samples.
+        """
+        self.assertEqual(sum(self.values), self.series.total)
+        self.assertEqual(sum(self.values) / len(self.values), self.series.mean())
+        self.assertEqual(0.0, TimeSeries().mean(), "An empty series should have a mean of 0")
+
+    def test_last_value(self):
+        """
+        Test that `last` returns the most recent sample or the default for an empty series.
+        """
+        self.assertEqual(4.0, self.series.last())
+        self.assertIsNone(TimeSeries().last())
+        self.assertEqual(0, TimeSeries().last(0))
+
+    def test_indexing_and_slicing(self):
+        """
+        Test positive and negative indexing and slicing.
+        """
+        self.assertEqual(0.5, self.series[0])
+        self.assertEqual(4.0, self.series[-1])
+        self.assertEqual(array('d', [1.5, -2.0]), self.series[1:3])
+        with self.assertRaises(IndexError):
+            _ = self.series[len(self.values)]
+
+    def test_truthiness_and_iteration(self):
+        """
+        Test that an empty series is falsy and that iteration yields the samples in order.
+        """
+        self.assertFalse(TimeSeries())
+        self.assertTrue(self.series)
+        self.assertEqual(self.values, list(self.series))
+
+    def test_to_numpy(self):
+        """
+        Test the conversion to a NumPy array used by the plotting code.
+        """
+        import numpy as np
+
+        np.testing.assert_array_equal(np.array(self.values), np.asarray(self.series))
+        self.series.append(1.0)  # The exported array is a copy and does not lock the buffer
+        self.assertEqual(len(self.values) + 1, len(self.series.to_numpy()))
+
+    def test_invalid_capacity(self):
+        """
+        Test that a negative capacity raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            TimeSeries(capacity=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
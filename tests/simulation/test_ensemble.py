@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from src.simulation.ensemble import EnsembleAggregator, run_ensemble
+
+
+class TestEnsembleAggregator(unittest.TestCase):
+    """
+    Unit tests for the streaming aggregation of ensemble replicas.
+    """
+
+    def setUp(self):
+        self.aggregator = EnsembleAggregator()
+
+    def test_percentile_bands_per_timestep(self):
+        """
+        Test that every metric gets p5/p50/p95 bands with one value per timestep, ordered p5 <= p50 <= p95.
+        """
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            self.aggregator.add({'tank_water_volume': 100 + rng.normal(size=24),
+                                 'precipitation_volume': rng.exponential(size=24)})
+        bands = self.aggregator.result()
+        self.assertEqual(200, self.aggregator.replicas)
+        for metric in ('tank_water_volume', 'precipitation_volume'):
+            with self.subTest(metric=metric):
+                self.assertEqual({'p5', 'p50', 'p95'}, set(bands[metric]))
+                self.assertEqual((24,), bands[metric]['p50'].shape)
+                self.assertTrue(np.all(bands[metric]['p5'] <= bands[metric]['p50']))
+                self.assertTrue(np.all(bands[metric]['p50'] <= bands[metric]['p95']))
+        np.testing.assert_allclose(100, bands['tank_water_volume']['p50'], atol=0.5)
+
+    def test_missing_metric_raises(self):
+        """
+        Test that a replica without one of the aggregated series raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.aggregator.add({'tank_water_volume': np.zeros(24)})
+
+    def test_invalid_replicas_raises(self):
+        """
+        Test that a non-positive number of replicas raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            run_ensemble(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from src.simulation.fish_tank_simulation import FishTankSimulator
+
+
+class TestFishTankWeatherStep(unittest.TestCase):
+    """
+    Unit tests for the application of one weather step to the fish tank of the simulator.
+    """
+
+    def setUp(self):
+        self.simulator = FishTankSimulator(tank_length=100, tank_width=50, tank_depth=40)
+        self.fish_tank = self.simulator.fish_tank
+
+    def test_precipitation_is_added_to_the_tank(self):
+        self.simulator.apply_weather_step(20, None, None, 60)
+        self.assertEqual(20, self.fish_tank.current_volume)
+        self.assertEqual(0, self.fish_tank.overflow_volume)
+
+    def test_precipitation_on_a_full_tank_spills_over(self):
+        """
+        Test that the rain that does not fit in the tank spills into its overflow volume instead of raising.
+        """
+        self.fish_tank.add_water(self.fish_tank.tank_capacity - 5)
+        self.simulator.apply_weather_step(20, None, None, 60)
+        self.assertEqual(self.fish_tank.tank_capacity, self.fish_tank.current_volume)
+        self.assertEqual(15, self.fish_tank.overflow_volume)
+        self.simulator.apply_weather_step(20, None, None, 60)
+        self.assertEqual(self.fish_tank.tank_capacity, self.fish_tank.current_volume)
+        self.assertEqual(35, self.fish_tank.overflow_volume)
+
+    def test_evaporation_dries_out_the_tank(self):
+        """
+        Test that a step evaporating more than the tank holds empties it instead of failing.
+        """
+        self.fish_tank.add_water(0.001)
+        self.simulator.apply_weather_step(0, 30, 0.2, 3600)
+        self.assertEqual(0, self.fish_tank.current_volume)
+        self.assertEqual(0.001, self.simulator.simulation_data['water_evaporated'][-1])
+        self.simulator.apply_weather_step(0, 30, 0.2, 3600)
+        self.assertEqual(0, self.simulator.simulation_data['water_evaporated'][-1])
+
+
+    def test_evaporation_validates_the_weather(self):
+        """
+        Test that weather outside the evaporation ranges, or NaN, is rejected instead of evaporating unchecked.
+        """
+        self.fish_tank.add_water(20)
+        for air_temp, rel_humidity in [(60, 0.5), (20, 150), (20, float('nan')), (float('nan'), 0.5)]:
+            with self.subTest(air_temp=air_temp, rel_humidity=rel_humidity):
+                with self.assertRaises(ValueError):
+                    self.simulator.simulate_evaporation(air_temp, self.fish_tank.water_surface_area, rel_humidity,
+                                                        3600)
+        self.assertEqual(20, self.fish_tank.current_volume)
+
+if __name__ == '__main__':
+    unittest.main()
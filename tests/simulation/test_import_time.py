@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Cold import budget of the core simulation classes, in seconds
+IMPORT_TIME_BUDGET = 0.5
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Tests that the simulation package imports quickly, without GUI libraries and without file I/O.
+    """
+
+    def test_cold_import_is_headless_and_within_budget(self):
+        """
+        Test that a cold import of the simulators, run from an unrelated working directory, loads neither
+        matplotlib nor tkinter and stays within the import time budget.
+        """
+        code = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "from src.simulation.simulation import ArtificialEcosystemSimulator\n"
+            "from src.simulation.fish_tank_simulation import FishTankSimulator\n"
+            "from src.simulation.seasonal_weather_simulation import SeasonalWeatherSimulator\n"
+            "elapsed = time.perf_counter() - start\n"
+            "print(elapsed, 'matplotlib' in sys.modules, 'tkinter' in sys.modules)\n"
+        )
+        with tempfile.TemporaryDirectory() as working_directory:
+            result = subprocess.run([sys.executable, '-c', code],
+                                    cwd=working_directory,
+                                    env={**os.environ, 'PYTHONPATH': REPOSITORY_PATH},
+                                    capture_output=True,
+                                    text=True,
+                                    check=True)
+        elapsed, matplotlib_loaded, tkinter_loaded = result.stdout.split()
+        self.assertEqual('False', matplotlib_loaded)
+        self.assertEqual('False', tkinter_loaded)
+        self.assertLess(float(elapsed), IMPORT_TIME_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
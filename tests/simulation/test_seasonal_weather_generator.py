@@ -0,0 +1,111 @@
+import json
+import math
+import os
+import unittest
+import numpy as np
+from src.simulation.seasonal_weather_generator import SeasonalWeatherGenerator
+
+CONFIGURATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'simulation', 'configurations')
+
+
+class TestSeasonalWeatherGenerator(unittest.TestCase):
+    """
+    Unit tests for the vectorized SeasonalWeatherGenerator.
+    """
+
+    def setUp(self):
+        with open(os.path.join(CONFIGURATIONS_PATH, 'austria_seasonal_weather_data.json'), 'r') as f:
+            self.seasonal_weather_data = json.load(f)
+        self.simulation_config = {
+            "duration": 12,
+            "time_unit": "month",
+            "sample_unit": "hour",
+            "start_date_time": "01/01 00:00:00",
+            "start_date_time_format": "%m/%d %H:%M:%S",
+            "roof_surface": 100
+        }
+        self.generator = SeasonalWeatherGenerator(self.seasonal_weather_data,
+                                                  self.simulation_config['roof_surface'],
+                                                  np.random.default_rng(42))
+
+    def test_generate_shapes(self):
+        """
+        Test that every generated series has one value per simulation step.
+        """
+        weather = self.generator.generate(self.simulation_config)
+        for key, series in weather.items():
+            with self.subTest(key=key):
+                self.assertEqual(12 * 30 * 24, series.shape[0], f"{key} should have one value per hour")
+
+    def test_air_temperature_follows_monthly_profile(self):
+        """
+        Test that the air temperature stays within one degree of the hourly monthly temperature.
+        """
+        weather = self.generator.generate(self.simulation_config)
+        january_first_day = weather['air_temperature'][:24]
+        expected = np.array(self.seasonal_weather_data['January']['temperature'])
+        self.assertTrue(np.all(np.abs(january_first_day - expected) <= 1))
+        self.assertTrue(np.all((weather['relative_humidity'] >= 0) & (weather['relative_humidity'] <= 1)))
+
+    def test_precipitation_type_depends_on_air_temperature(self):
+        """
+        Test that rain only falls above 3°C, snow at or below it, and only on precipitation steps.
+        """
+        weather = self.generator.generate(self.simulation_config)
+        self.assertTrue(np.all(weather['rain'][weather['air_temperature'] <= 3] == 0))
+        self.assertTrue(np.all(weather['snow'][weather['air_temperature'] > 3] == 0))
+        self.assertTrue(np.all(weather['precipitation_volume'][~weather['precipitation_event']] == 0))
+
+    def test_reproducible_with_seeded_generator(self):
+        """
+        Test that two generators seeded identically produce the same weather.
+        """
+        other = SeasonalWeatherGenerator(self.seasonal_weather_data, 100, np.random.default_rng(42))
+        weather = self.generator.generate(self.simulation_config)
+        other_weather = other.generate(self.simulation_config)
+        for key in weather:
+            with self.subTest(key=key):
+                np.testing.assert_array_equal(weather[key], other_weather[key])
+
+    def test_distribute_precipitation_matches_stepwise_model(self):
+        """
+        Test that the vectorized distribution matches the step-by-step running-total model.
+        """
+        rng = np.random.default_rng(7)
+        steps = 500
+        sampling_rate = 3600
+        mask = rng.integers(0, 10, steps) <= 3
+        month_index = np.zeros(steps, dtype=np.int64)
+        budget = np.full(steps, 5000.0)
+        average_days = np.full(steps, 10.0)
+        random_weight = rng.uniform(0.5, 1.5, steps)
+        pattern_weight = rng.uniform(0.7, 1.3, steps)
+
+        amounts = SeasonalWeatherGenerator._distribute_precipitation(mask, month_index, budget, average_days,
+                                                                     random_weight, pattern_weight, sampling_rate)
+
+        total, count = 0, 0
+        for step in np.flatnonzero(mask):
+            seconds_remaining = max(10 * 24 * 60 * 60 - count * sampling_rate, 0)
+            remaining = max(5000.0 - total, 0)
+            expected = 0
+            if round(remaining) > 0 and round(seconds_remaining) > 0:
+                cyclic_variation = max(0.5, math.sin(2 * math.pi * (1 - seconds_remaining / (30 * 24 * 60 * 60))) + 1)
+                expected = (remaining / seconds_remaining * random_weight[step] * sampling_rate *
+                            cyclic_variation * pattern_weight[step])
+            with self.subTest(step=step):
+                self.assertAlmostEqual(expected, amounts[step], places=6)
+            total += expected
+            count += 1
+
+    def test_missing_month_raises(self):
+        """
+        Test that a horizon covering a month without seasonal data raises ValueError.
+        """
+        generator = SeasonalWeatherGenerator({'January': self.seasonal_weather_data['January']}, 100)
+        with self.assertRaises(ValueError):
+            generator.generate(self.simulation_config)
+
+
+if __name__ == '__main__':
+    unittest.main()
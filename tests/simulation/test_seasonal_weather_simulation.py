@@ -0,0 +1,59 @@
+import json
+import math
+import os
+import unittest
+from datetime import datetime, timedelta
+from src.simulation.common import RandomStreams
+from src.simulation.seasonal_weather_simulation import SeasonalWeatherSimulator, MONTH_MAPPING
+
+CONFIGURATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   '..', '..', 'src', 'simulation', 'configurations')
+
+
+class TestSeasonalWeatherPrecipitationTotals(unittest.TestCase):
+    """
+    Unit tests for the running per-month precipitation totals of the seasonal weather simulator.
+    """
+
+    def setUp(self):
+        with open(os.path.join(CONFIGURATIONS_PATH, 'austria_seasonal_weather_data.json'), 'r') as f:
+            self.simulator = SeasonalWeatherSimulator(**json.load(f))
+        self.simulator.roof_surface = 100
+        self.simulator.use_random_streams(RandomStreams(0))
+
+    def test_running_totals_match_recomputed_sums(self):
+        """
+        Test that the running total, count and mean of every (precipitation type, month) series match the
+        sums recomputed from the recorded samples, at every step across a month boundary with rain and snow.
+        """
+        samples = {}
+        record_precipitation = self.simulator.record_precipitation
+
+        def record(precipitation_type, month, amount):
+            samples.setdefault((precipitation_type, month), []).append(amount)
+            record_precipitation(precipitation_type, month, amount)
+
+        self.simulator.record_precipitation = record
+        start = datetime(1900, 2, 22)
+        for hour in range(14 * 24):
+            sim_date_time = start + timedelta(hours=hour)
+            self.simulator.apply_seasonal_weather_data_to_sim(sim_date_time, 3600)
+            month = MONTH_MAPPING[sim_date_time.month]
+            for precipitation_type in ('rain', 'snow'):
+                series = self.simulator.simulation_data[precipitation_type][month]
+                recorded = samples.get((precipitation_type, month), [])
+                self.assertEqual(len(recorded), len(series))
+                self.assertTrue(math.isclose(sum(recorded), series.total, rel_tol=1e-12, abs_tol=1e-12))
+                self.assertTrue(math.isclose(sum(recorded) / len(recorded) if recorded else 0.0, series.mean(),
+                                             rel_tol=1e-12, abs_tol=1e-12))
+
+        # Both precipitation types fell in both months, every month keeping its own totals
+        self.assertEqual({(precipitation_type, month) for precipitation_type in ('rain', 'snow')
+                          for month in ('February', 'March')}, set(samples))
+        for (precipitation_type, month), recorded in samples.items():
+            with self.subTest(precipitation_type=precipitation_type, month=month):
+                self.assertEqual(recorded, self.simulator.simulation_data[precipitation_type][month].to_list())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from src.simulation.sensors import Sensor, TemperatureSensor
+from src.simulation.common import RandomStreams
 
 class TestBaseSensor(unittest.TestCase):
     def setUp(self):
@@ -42,6 +43,18 @@ class TestTemperatureSensor(unittest.TestCase):
         # Assuming read_temperature sets a random temperature for demonstration
         self.assertTrue(20.0 <= self.temp_sensor.temperature <= 30.0)
 
+    def test_read_temperature_reproducible_with_seeded_stream(self):
+        # Test that sensors reading from identically seeded streams read the same temperatures
+        sensors = [TemperatureSensor("temp1", (0, 0), 1, rng=RandomStreams(7).batched('temp1')) for _ in range(2)]
+        readings = []
+        for sensor in sensors:
+            sensor_readings = []
+            for _ in range(5):
+                sensor.read_temperature()
+                sensor_readings.append(sensor.temperature)
+            readings.append(sensor_readings)
+        self.assertEqual(readings[0], readings[1])
+
     def test_get_temperature(self):
         # Test if get_temperature returns the last set temperature
         temp = 22.5  # Set a known temperature
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from src.simulation.water.physics_cache import (PhysicsKernel, antoine_saturation_vapor_pressure,
+                                                andrade_viscosity)
+
+
+class TestPhysicsKernel(unittest.TestCase):
+
+    def test_exact_values_are_memoized(self):
+        kernel = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100)
+        self.assertEqual(kernel(25), antoine_saturation_vapor_pressure(25))
+        self.assertEqual(kernel(25), antoine_saturation_vapor_pressure(25))
+        info = kernel.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_lru_cache_is_bounded(self):
+        kernel = PhysicsKernel(andrade_viscosity, 0, 100, maxsize=8)
+        for temperature in range(20):
+            kernel(temperature)
+        self.assertEqual(kernel.cache_info().currsize, 8)
+
+    def test_table_meets_tolerance(self):
+        for func in (antoine_saturation_vapor_pressure, andrade_viscosity):
+            for tolerance in (1e-3, 1e-6):
+                with self.subTest(func=func.__name__, tolerance=tolerance):
+                    kernel = PhysicsKernel(func, 0, 100, tolerance=tolerance)
+                    for temperature in np.linspace(0, 100, 1001).tolist() + [0.0137, 37.77, 99.999]:
+                        exact = func(temperature)
+                        self.assertLessEqual(abs(kernel(temperature) - exact), tolerance * exact)
+
+    def test_table_falls_back_to_exact_values_out_of_range(self):
+        kernel = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100, tolerance=1e-3)
+        self.assertEqual(kernel(-5), antoine_saturation_vapor_pressure(-5))
+        self.assertEqual(kernel(120), antoine_saturation_vapor_pressure(120))
+
+    def test_configure_disables_table(self):
+        kernel = PhysicsKernel(andrade_viscosity, 0, 100, tolerance=1e-3)
+        kernel.configure(None)
+        self.assertIsNone(kernel.tolerance)
+        self.assertEqual(kernel(33.3), andrade_viscosity(33.3))
+
+    def test_many_matches_scalar_calls(self):
+        temperatures = [-5, 0, 12.5, 25, 99.5, 120]
+        for tolerance in (None, 1e-6):
+            with self.subTest(tolerance=tolerance):
+                kernel = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100, tolerance=tolerance)
+                expected = [kernel(temperature) for temperature in temperatures]
+                np.testing.assert_allclose(kernel.many(temperatures), expected, rtol=1e-12)
+
+    def test_many_only_evaluates_out_of_range_temperatures_exactly(self):
+        kernel = PhysicsKernel(antoine_saturation_vapor_pressure, 0, 100, tolerance=1e-6)
+        info = kernel.cache_info()
+        kernel.many(np.linspace(0, 100, 500))
+        self.assertEqual(info, kernel.cache_info(), "In-range temperatures should not reach the exact kernel")
+        kernel.many([-5, 50, 120, -5])
+        after = kernel.cache_info()
+        self.assertEqual((after.hits - info.hits, after.misses - info.misses), (1, 2))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PhysicsKernel(andrade_viscosity, 100, 0)
+        with self.assertRaises(ValueError):
+            PhysicsKernel(andrade_viscosity, 0, 100, tolerance=0)
+        with self.assertRaises(ValueError):
+            PhysicsKernel(andrade_viscosity, 0, 100, tolerance=1e-30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+import numpy as np
+from src.simulation.water.reaction_network import ReactionNetwork
+from src.simulation.water.water_dissolved_elements_monitor import WaterDissolvedElementsMonitor
+from src.simulation.water.water_tank import WaterTank
+
+
+class TestReactionNetwork(unittest.TestCase):
+
+    def setUp(self):
+        self.network = ReactionNetwork.nitrification()
+        self.molar_masses = np.array([ReactionNetwork.MOLAR_MASSES[element] for element in self.network.elements])
+
+    def _monitor(self, ammonia: float = 2, nitrite: float = 0.5, nitrate: float = 10, **elements):
+        water_tank = WaterTank(tank_length=400, tank_width=150, tank_depth=100, tank_type='fish tank')
+        water_tank.add_water(4000)
+        dissolved_elements = {'ammonia': {'min': 0, 'max': 10, 'initial': ammonia},
+                              'oxygen': {'min': 0.1, 'max': 100, 'initial': 50},
+                              'nitrite': {'min': 0, 'max': 10, 'initial': nitrite},
+                              'nitrate': {'min': 0, 'max': 100, 'initial': nitrate}}
+        dissolved_elements.update(elements)
+        return WaterDissolvedElementsMonitor(water_tank, dissolved_elements)
+
+    def test_nitrogen_is_conserved(self):
+        concentrations = np.array([2, 0.5, 10])
+        advanced = self.network.advance(concentrations, 3600)
+        self.assertLess(advanced[0], concentrations[0])
+        self.assertGreater(advanced[2], concentrations[2])
+        self.assertAlmostEqual((advanced / self.molar_masses).sum(), (concentrations / self.molar_masses).sum())
+
+    def test_large_steps_stay_stable(self):
+        network = ReactionNetwork.nitrification(ammonia_rate=1, nitrite_rate=5)
+        concentrations = np.array([2, 0.5, 10])
+        advanced = network.advance(concentrations, 24 * 3600)
+        self.assertTrue(np.all(advanced >= 0))
+        self.assertLess(advanced[0], 1e-4)
+        self.assertAlmostEqual((advanced / self.molar_masses).sum(), (concentrations / self.molar_masses).sum())
+
+    def test_substeps_converge_to_exact_solution(self):
+        network = ReactionNetwork([{'reactant': 'ammonia', 'rate': 1e-4}])
+        exact = 2 * np.exp(-1e-4 * 3 * 3600)
+        coarse = network.advance([2], 3 * 3600)[0]
+        fine = network.advance([2], 3 * 3600, substeps=1000)[0]
+        self.assertLess(abs(fine - exact), abs(coarse - exact))
+        self.assertAlmostEqual(fine, exact, places=3)
+
+    def test_batched_advance_matches_rows(self):
+        concentrations = np.random.default_rng(0).uniform(0, 5, (50, 3))
+        advanced = self.network.advance(concentrations, 600)
+        for row, advanced_row in zip(concentrations, advanced):
+            np.testing.assert_allclose(self.network.advance(row, 600), advanced_row)
+
+    def test_monitor_reacts(self):
+        monitor = self._monitor()
+        oxygen = monitor.oxygen
+        expected = self.network.advance([monitor.ammonia, monitor.nitrite, monitor.nitrate], 3600)
+        monitor.react(self.network, 3600)
+        np.testing.assert_allclose([monitor.ammonia, monitor.nitrite, monitor.nitrate], expected)
+        self.assertEqual(oxygen, monitor.oxygen)
+
+    def test_advance_monitors_across_schemas(self):
+        monitors = [self._monitor(ammonia=ammonia) for ammonia in (1, 2, 3)]
+        monitors.append(self._monitor(phosphate={'min': 0, 'max': 2, 'initial': 0.5}))
+        expected = [self.network.advance([monitor.ammonia, monitor.nitrite, monitor.nitrate], 3600)
+                    for monitor in monitors]
+        self.network.advance_monitors(monitors, 3600)
+        for monitor, expected_concentrations in zip(monitors, expected):
+            np.testing.assert_allclose([monitor.ammonia, monitor.nitrite, monitor.nitrate], expected_concentrations)
+        self.assertEqual(0.5, monitors[-1].phosphate)
+
+    def test_out_of_range_reaction_leaves_monitors_unchanged(self):
+        monitors = [self._monitor(), self._monitor(nitrate=99.9)]
+        concentrations = [monitor.concentrations.copy() for monitor in monitors]
+        with self.assertRaises(ValueError):
+            self.network.advance_monitors(monitors, 24 * 3600)
+        for monitor, monitor_concentrations in zip(monitors, concentrations):
+            np.testing.assert_array_equal(monitor.concentrations, monitor_concentrations)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(TypeError):
+            ReactionNetwork({'reactant': 'ammonia', 'rate': 1})
+        with self.assertRaises(ValueError):
+            ReactionNetwork([])
+        with self.assertRaises(TypeError):
+            ReactionNetwork([{'reactant': 'ammonia'}])
+        with self.assertRaises(ValueError):
+            ReactionNetwork([{'reactant': 'ammonia', 'rate': -1}])
+        with self.assertRaises(ValueError):
+            self.network.advance([1, 2], 60)
+        with self.assertRaises(ValueError):
+            self.network.advance([1, 2, 3], -60)
+        with self.assertRaises(ValueError):
+            self.network.advance([1, 2, 3], 60, substeps=0)
+        monitor = WaterDissolvedElementsMonitor(self._monitor().water_tank, {'oxygen': {'min': 0, 'max': 100}})
+        with self.assertRaises(ValueError):
+            monitor.react(self.network, 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
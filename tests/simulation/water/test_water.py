@@ -1,5 +1,6 @@
 # tests/tests_water.py
 
+import pickle
 import unittest
 from src.simulation.water.water import Water
 from src.simulation.water.water_property_range import WaterPropertyRange
@@ -23,6 +24,81 @@ class TestWater(unittest.TestCase):
         self.assertEqual(water.viscosity, 0.00089)
         self.assertEqual(water.tds, 0)
 
+    def test_state_is_stored_in_slots(self):
+        water = Water(50, 200)
+        water.add_water(100)
+        self.assertFalse(hasattr(water, '__dict__'), "Water state should be stored in slots, without an instance dict")
+
+
+class WaterEventRecorder:
+    """A picklable observer recording the events of a water."""
+
+    def __init__(self):
+        self.events = []
+
+    def record_evaporation(self, water, result):
+        self.events.append(('evaporate', result, water.current_volume))
+
+    def record_addition(self, water, result):
+        self.events.append(('add_water', result, water.current_volume))
+
+
+class TestWaterObservers(unittest.TestCase):
+
+    def setUp(self):
+        self.water = Water(initial_nutrients=50, tank_capacity=200)
+        self.water.add_water(100)
+        self.recorder = WaterEventRecorder()
+
+    def test_observers_are_notified_after_operations(self):
+        results = []
+        for event in Water.OBSERVER_EVENTS:
+            self.water.add_observer(event, lambda water, result, event=event: results.append((event, result)))
+        self.water.add_water(20)
+        self.water.extract_water(10)
+        evaporated = self.water.evaporate(25, 2, 50, 3600)
+        self.water.manage_precipitation('snow', 10, -2)
+        melted = self.water.melt_snow(5, 100)
+        self.assertEqual([('add_water', 20), ('extract_water', 10), ('evaporate', evaporated),
+                          ('precipitation', 0.0), ('precipitation', melted)], results)
+
+    def test_observers_see_the_updated_water(self):
+        self.water.add_observer('add_water', self.recorder.record_addition)
+        self.water.add_observer('evaporate', self.recorder.record_evaporation)
+        self.water.add_water(30)
+        self.assertEqual([('add_water', 30, 130)], self.recorder.events)
+
+    def test_failed_operations_do_not_notify(self):
+        self.water.add_observer('add_water', self.recorder.record_addition)
+        with self.assertRaises(ValueError):
+            self.water.add_water(500)
+        self.assertEqual([], self.recorder.events)
+
+    def test_remove_observer(self):
+        self.water.add_observer('add_water', self.recorder.record_addition)
+        self.water.add_observer('add_water', self.recorder.record_addition)
+        self.water.remove_observer('add_water', self.recorder.record_addition)
+        self.water.add_water(10)
+        self.assertEqual(1, len(self.recorder.events))
+        self.water.remove_observer('add_water', self.recorder.record_addition)
+        self.assertIsNone(self.water._observers)
+        with self.assertRaises(ValueError):
+            self.water.remove_observer('add_water', self.recorder.record_addition)
+
+    def test_invalid_observers(self):
+        with self.assertRaises(ValueError):
+            self.water.add_observer('boil', self.recorder.record_addition)
+        with self.assertRaises(TypeError):
+            self.water.add_observer('add_water', 'not callable')
+
+    def test_observed_water_survives_pickling(self):
+        self.water.add_observer('add_water', self.recorder.record_addition)
+        copied_water = pickle.loads(pickle.dumps(self.water))
+        copied_water.add_water(10)
+        copied_recorder = copied_water._observers['add_water'][0].__self__
+        self.assertEqual([('add_water', 10, 110)], copied_recorder.events)
+        self.assertEqual([], self.recorder.events)
+
 class TestWaterTemperature(unittest.TestCase):
 
     def setUp(self):
@@ -360,6 +436,31 @@ class TestWaterStatus(unittest.TestCase):
         self.assertEqual(200, water_tank_status.get('tank_capacity'), f"Water tank capacity should be 200")
         self.assertEqual(0, water_tank_status.get('overflow_volume'), f"Water overflow volume should be 0")
 
+    def test_status_is_cached_until_state_changes(self):
+        status = self.water.status
+        self.assertIs(status, self.water.status, "Status should not be rebuilt without a state change")
+        with self.assertRaises(TypeError):
+            status['ph'] = 8
+        self.water.ph = 8
+        self.assertIsNot(status, self.water.status, "Status should be rebuilt after a setter changed the state")
+        self.assertEqual(7, status['ph'], "Previous snapshots should not change")
+        self.assertEqual(8, self.water.status['ph'])
+        self.water.add_water(50)
+        self.assertEqual(50, self.water.status['current_volume'])
+        self.water.temperature = 50
+        self.assertEqual(self.water.viscosity, self.water.status['viscosity'])
+        for name, value in [('overflow_volume', 12.5), ('tank_capacity', 300), ('is_empty', True),
+                            ('is_full', True)]:
+            status = self.water.status
+            setattr(self.water, name, value)
+            self.assertIsNot(status, self.water.status, f"Status should be rebuilt after {name} changed")
+            self.assertEqual(value, self.water.status[name])
+
+    def test_status_survives_pickling(self):
+        self.water.status
+        copied_water = pickle.loads(pickle.dumps(self.water))
+        self.assertEqual(dict(self.water.status), dict(copied_water.status))
+
 class TestWaterPrecipitationManagement(unittest.TestCase):
 
     def setUp(self):
@@ -412,6 +513,133 @@ class TestWaterPrecipitationManagement(unittest.TestCase):
         with self.assertRaises(ValueError, msg="Current volume cannot exceed the capacity."):
             self.water.manage_precipitation(precipitation_type, amount, air_temp, pattern)
 
+    def test_melt_snow_matches_repeated_precipitation_steps(self):
+        """Test that melting k steps in closed form matches k calls of manage_precipitation."""
+        stepped = Water(initial_nutrients=50, tank_capacity=200)
+        for water in (self.water, stepped):
+            water.manage_precipitation('snow', 100, -3)
+        for air_temp, steps in [(0.5, 1), (4, 500), (12.5, 3000)]:
+            melted = self.water.melt_snow(air_temp, steps)
+            initial_volume = stepped.current_volume
+            for _ in range(steps):
+                stepped.manage_precipitation('snow', 0, air_temp)
+            self.assertAlmostEqual(melted, stepped.current_volume - initial_volume, places=9)
+            self.assertAlmostEqual(self.water.current_volume, stepped.current_volume, places=9)
+            self.assertAlmostEqual(self.water.snow_accumulation, stepped.snow_accumulation, places=9)
+
+    def test_melt_snow_without_melting(self):
+        """Test that no snow melts at or below 0°C or over 0 steps."""
+        self.water.manage_precipitation('snow', 10, -1)
+        self.assertEqual(self.water.melt_snow(0, 1000), 0)
+        self.assertEqual(self.water.melt_snow(10, 0), 0)
+        self.assertEqual(self.water.snow_accumulation, 10)
+
+    def test_melt_snow_exceeds_capacity(self):
+        """Test that a melt overflowing the tank caps the volume and leaves the snow unchanged."""
+        self.water.current_volume = 190
+        self.water.manage_precipitation('snow', 50, -1)
+        with self.assertRaises(ValueError):
+            self.water.melt_snow(20, 10000)
+        self.assertEqual(self.water.current_volume, 200)
+        self.assertEqual(self.water.snow_accumulation, 50)
+
+    def test_melt_snow_invalid_arguments(self):
+        """Test the validation of the melting arguments."""
+        with self.assertRaises(TypeError):
+            self.water.melt_snow('warm', 10)
+        with self.assertRaises(TypeError):
+            self.water.melt_snow(10, 2.5)
+        with self.assertRaises(ValueError):
+            self.water.melt_snow(10, -1)
+
+class TestWaterFlows(unittest.TestCase):
+
+    def setUp(self):
+        self.water = Water(initial_nutrients=50, tank_capacity=200)
+        self.water.add_water(100)
+
+    def test_flows_within_bounds_match_add_and_extract(self):
+        flows = [20, -30, 50.5, -10, 0]
+        other_water = Water(initial_nutrients=50, tank_capacity=200)
+        other_water.add_water(100)
+        for flow in flows:
+            if flow > 0:
+                other_water.add_water(flow)
+            elif flow < 0:
+                other_water.extract_water(-flow)
+        accepted, overflow = self.water.apply_flows(flows)
+        self.assertEqual(flows, accepted.tolist())
+        self.assertEqual(0, overflow)
+        self.assertEqual(other_water.current_volume, self.water.current_volume)
+
+    def test_clamp_policy(self):
+        accepted, overflow = self.water.apply_flows([150, -500, 30, -10])
+        # 100 liters fit, 50 overflow; the extraction stops at the underflow threshold of 40 liters
+        self.assertEqual([100, -160, 30, -10], accepted.tolist())
+        self.assertEqual(50, overflow)
+        self.assertEqual(60, self.water.current_volume)
+        self.assertEqual(50, self.water.overflow_volume)
+
+    def test_overflow_accumulates_on_every_path(self):
+        """
+        Test that the same overflows add up to the same `overflow_volume`, whether they come from the
+        `current_volume` setter or from `apply_flows`.
+        """
+        other_water = Water(initial_nutrients=50, tank_capacity=200)
+        other_water.add_water(100)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.water.manage_precipitation('rain', 130, 15)
+            other_water.apply_flows([130])
+        self.assertEqual(160, self.water.overflow_volume)
+        self.assertEqual(self.water.overflow_volume, other_water.overflow_volume)
+        self.assertEqual(self.water.current_volume, other_water.current_volume)
+
+    def test_overflow_only_ledger_refreshes_status(self):
+        self.water.add_water(100)
+        status = self.water.status
+        self.assertEqual(0, status['overflow_volume'])
+        accepted, overflow = self.water.apply_flows([10.0])
+        self.assertEqual([0], accepted.tolist())
+        self.assertEqual(10, overflow)
+        self.assertEqual(10, self.water.status['overflow_volume'])
+        self.assertEqual(200, self.water.status['current_volume'])
+
+    def test_reject_policy(self):
+        accepted, overflow = self.water.apply_flows([150, -70, 80, -10], policy='reject')
+        self.assertEqual([0, 0, 80, -10], accepted.tolist())
+        self.assertEqual(0, overflow)
+        self.assertEqual(170, self.water.current_volume)
+
+    def test_strict_policy_is_atomic(self):
+        with self.assertRaises(ValueError):
+            self.water.apply_flows([50, 60], policy='strict')
+        self.assertEqual(100, self.water.current_volume)
+        self.water.apply_flows([50, -20], policy='strict')
+        self.assertEqual(130, self.water.current_volume)
+
+    def test_forced_extraction_empties_the_tank(self):
+        accepted, _ = self.water.apply_flows([-150], force_underflow_capacity_threshold=True)
+        self.assertEqual([-100], accepted.tolist())
+        self.assertEqual(0, self.water.current_volume)
+        self.assertTrue(self.water.is_empty)
+
+    def test_observers_are_notified_with_totals(self):
+        results = []
+        self.water.add_observer('add_water', lambda water, result: results.append(('add_water', result)))
+        self.water.add_observer('extract_water', lambda water, result: results.append(('extract_water', result)))
+        self.water.apply_flows([10, -5, 20, -15])
+        self.assertEqual([('add_water', 30), ('extract_water', 20)], results)
+
+    def test_invalid_flows(self):
+        with self.assertRaises(ValueError):
+            self.water.apply_flows([10], policy='spill')
+        with self.assertRaises(TypeError):
+            self.water.apply_flows(['a lot'])
+        with self.assertRaises(ValueError):
+            self.water.apply_flows([float('nan')])
+
+
 class TestWaterEvaporationManagement(unittest.TestCase):
     """
     Test cases for the Water evaporation management system.
@@ -548,6 +776,17 @@ class TestWaterEvaporationManagement(unittest.TestCase):
             for test_case in test_cases:
                 self.water.evaporate(**test_case)
 
+    def test_water_evaporation_params_nan(self):
+        """
+        Test that NaN evaporation inputs are rejected as out of range.
+        """
+        self.water.current_volume = 100
+        for arguments in [(float('nan'), 6, 0.5, 600), (10, float('nan'), 0.5, 600), (10, 6, float('nan'), 600)]:
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(ValueError):
+                    self.water.evaporate(*arguments)
+        self.assertEqual(100, self.water.current_volume)
+
     def test_water_evaporation_params_invalid_type(self):
         """
         Test parameter validation for incorrect data types.
@@ -624,6 +863,59 @@ class TestWaterEvaporationManagement(unittest.TestCase):
 
         self.assertEqual(0, water_evaporated, f"Water evaporation should be 0")
 
+    def test_water_evaporation_trusted_matches_validated(self):
+        """
+        Test that the trusted fast path evaporates exactly as the validated call, and skips the validation.
+        """
+        self.water.current_volume = 100
+        validated = self.water.evaporate(20, 6, 0.5, 600)
+        trusted = self.water.evaporate(20, 6, 0.5, 600, trusted=True)
+        self.assertEqual(validated, trusted)
+        self.assertAlmostEqual(100 - 2 * validated, self.water.current_volume)
+        # Out-of-range inputs are not checked on the trusted path
+        self.water.evaporate(60, 6, 0.5, 600, trusted=True)
+
+    def test_water_evaporate_many(self):
+        """
+        Test that the batch evaporation matches consecutive `evaporate` calls and updates the volume once.
+        """
+        air_temps = [5, 12.5, 20, 31]
+        rel_humidities = [0.9, 0.7, 0.5, 0.3]
+        times_elapsed = [600, 1200, 3600, 60]
+        self.water.current_volume = 100
+        other_water = Water(initial_nutrients=50, tank_capacity=200)
+        other_water.current_volume = 100
+        expected = [other_water.evaporate(air_temp, 6, rel_humidity, time_elapsed)
+                    for air_temp, rel_humidity, time_elapsed in zip(air_temps, rel_humidities, times_elapsed)]
+
+        water_evaporated = self.water.evaporate_many(air_temps, 6, rel_humidities, times_elapsed)
+
+        for step, (expected_step, evaporated_step) in enumerate(zip(expected, water_evaporated)):
+            with self.subTest(step=step):
+                self.assertAlmostEqual(expected_step, evaporated_step, 12)
+        self.assertAlmostEqual(100 - sum(expected), self.water.current_volume, 12)
+
+    def test_water_evaporate_many_invalid_inputs(self):
+        """
+        Test that the batch evaporation rejects out-of-range, non-numeric and mismatched inputs
+        without changing the volume.
+        """
+        self.water.current_volume = 100
+        invalid_inputs = [
+            (ValueError, ([20, 60], 6, [0.5, 0.5], 600)),
+            (ValueError, ([20, 20], 6, [0.5, 101], 600)),
+            (ValueError, ([20, 20], 101, [0.5, 0.5], 600)),
+            (ValueError, ([20, 20, 20], 6, [0.5, 0.5], 600)),
+            (TypeError, (['warm', 20], 6, [0.5, 0.5], 600)),
+            (ValueError, ([20, float('nan')], 6, [0.5, 0.5], 600)),
+            (ValueError, ([20, 20], 6, [float('nan'), 0.5], 600)),
+        ]
+        for error, arguments in invalid_inputs:
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(error):
+                    self.water.evaporate_many(*arguments)
+        self.assertEqual(100, self.water.current_volume)
+
 class TestWaterStorageManagement(unittest.TestCase):
     def setUp(self):
         initial_nutrients = 50
@@ -769,6 +1061,17 @@ class TestWaterStorageManagement(unittest.TestCase):
 
         # Ensure the exception message matches when current volume is 0
         self.assertEqual(str(context.exception), "Current volume must be non-negative.")
+
+    def test_evaporation_dry_out(self):
+        """
+        Test that an evaporation exceeding the volume empties the tank when `dry_out` is set.
+        """
+        self.water_tank.current_volume = 0.01
+        water_evaporated = self.water_tank.evaporate(30, 10, 0.5, 10000, dry_out=True)
+        self.assertEqual(0.01, water_evaporated)
+        self.assertEqual(0, self.water_tank.current_volume)
+        self.assertTrue(self.water_tank.is_empty)
+        self.assertEqual(0, self.water_tank.evaporate(30, 10, 0.5, 10000, dry_out=True))
     
     def test_water_underflow_management(self):
         """
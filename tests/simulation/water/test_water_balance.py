@@ -0,0 +1,128 @@
+import unittest
+import numpy as np
+from src.simulation.water.water import Water
+from src.simulation.water.water_balance import WaterBalance
+
+
+class TestWaterBalance(unittest.TestCase):
+
+    def setUp(self):
+        self.water = Water(0, 6000)
+        self.water.add_water(3000)
+        self.samples = 30 * 24
+        self.air_temperature = np.full(self.samples, 22.5)
+        self.relative_humidity = np.full(self.samples, 0.6)
+        self.no_precipitation = np.zeros(self.samples)
+
+    def _balance(self, rain=None, snow=None, air_temperature=None, **kwargs) -> WaterBalance:
+        return WaterBalance(self.water, 6, 3600,
+                            self.no_precipitation if rain is None else rain,
+                            self.no_precipitation if snow is None else snow,
+                            self.air_temperature if air_temperature is None else air_temperature,
+                            self.relative_humidity, **kwargs)
+
+    def _evaporation(self, air_temperature) -> np.ndarray:
+        air_temperature = np.asarray(air_temperature, dtype=float)
+        return np.where(air_temperature > 0, Water(0, 1)._evaporation_liters(air_temperature, 6,
+                                                                              self.relative_humidity, 3600), 0)
+
+    def test_quiet_month_is_crossed_in_few_steps(self):
+        result = self._balance().integrate()
+        expected = 3000 - self._evaporation(self.air_temperature).sum()
+        self.assertLess(result['steps'], 10)
+        self.assertAlmostEqual(self.water.current_volume, expected, places=6)
+        self.assertEqual(result['events'], [])
+
+    def test_varying_weather_matches_stepwise_balance(self):
+        rng = np.random.default_rng(0)
+        hours = np.arange(self.samples)
+        air_temperature = 20 + 8 * np.sin(hours * 2 * np.pi / 24) + rng.uniform(-1, 1, self.samples)
+        rain = np.where(hours % 50 == 0, 20.0, 0.0)
+        result = self._balance(rain, air_temperature=air_temperature).integrate()
+        expected = 3000 + rain.sum() - self._evaporation(air_temperature).sum()
+        self.assertLess(result['steps'], self.samples / 4)
+        self.assertAlmostEqual(self.water.current_volume, expected, delta=0.5)
+        water = self.water
+        self.water = Water(0, 6000)
+        self.water.add_water(3000)
+        self._balance(rain, air_temperature=air_temperature, rtol=1e-12, atol=1e-9).integrate()
+        self.assertAlmostEqual(self.water.current_volume, expected, places=5)
+        self.assertLess(abs(self.water.current_volume - expected), abs(water.current_volume - expected))
+
+    def test_capacity_overflows(self):
+        rain = np.zeros(self.samples)
+        rain[10:20] = 400.0
+        result = self._balance(rain, rtol=1e-10, atol=1e-8).integrate()
+        self.assertEqual([name for _, name in result['events']], ['full'])
+        full_time = result['events'][0][0]
+        evaporation_rate = self._evaporation(self.air_temperature)[0] / 3600
+        # The volume left after 10 hours of evaporation fills at 400 liters per hour minus evaporation
+        hours_to_fill = (3000 + 10 * 3600 * evaporation_rate) / (400 - 3600 * evaporation_rate)
+        self.assertAlmostEqual(full_time / 3600, 10 + hours_to_fill, places=6)
+        self.assertLessEqual(result['volume'].max(), 6000)
+        expected = 3000 + rain.sum() - self._evaporation(self.air_temperature).sum()
+        self.assertAlmostEqual(self.water.current_volume + self.water.overflow_volume, expected, places=4)
+        self.assertAlmostEqual(self.water.overflow_volume, result['overflow_volume'][-1])
+
+    def test_underflow_and_empty_events(self):
+        air_temperature = np.full(self.samples, 45.0)
+        balance = WaterBalance(self.water, 1000, 3600, self.no_precipitation, self.no_precipitation,
+                               air_temperature, np.zeros(self.samples), rtol=1e-10, atol=1e-8)
+        result = balance.integrate()
+        self.assertEqual([name for _, name in result['events']], ['underflow', 'empty'])
+        rate = balance._evaporation_rate[0]
+        underflow_volume = self.water.underflow_capacity_threshold
+        self.assertAlmostEqual(result['events'][0][0], (3000 - underflow_volume) / rate, places=3)
+        self.assertAlmostEqual(result['events'][1][0], 3000 / rate, places=3)
+        self.assertEqual(self.water.current_volume, 0)
+
+    def test_level_step_keeps_the_state_of_its_step_without_convergence(self):
+        hours = 24
+        balance = WaterBalance(self.water, 6, 3600, np.full(hours, 300.0), np.full(hours, 2.0),
+                               np.full(hours, 5.0), np.full(hours, 0.6))
+        # Melting snow makes the volume nonlinear in the step size, regula falsi needs several iterations
+        y = (5000.0, 3000.0, 0.0)
+        k1 = balance._derivatives(0, y[0], y[1], hours - 1)
+        converged_h, _ = balance._step_to_level(0, y, k1, 8 * 3600, hours - 1, 6000.0)
+        for iterations in range(1, 6):
+            with self.subTest(iterations=iterations):
+                balance.LEVEL_ITERATIONS = iterations
+                h, y_level = balance._step_to_level(0, y, k1, 8 * 3600, hours - 1, 6000.0)
+                y_step = balance._step(0, y, k1, h, hours - 1)[0]
+                self.assertTrue(0 < h < 8 * 3600)
+                self.assertEqual(6000.0, y_level[0])
+                self.assertEqual(y_step[1:], y_level[1:])
+                full_step_gap = abs(balance._step(0, y, k1, 8 * 3600, hours - 1)[0][0] - 6000)
+                self.assertLess(abs(y_step[0] - 6000), full_step_gap)
+        self.assertAlmostEqual(converged_h, h, delta=1)
+
+    def test_snow_accumulates_and_melts(self):
+        snow = np.zeros(self.samples)
+        snow[:24] = 5.0
+        air_temperature = np.where(np.arange(self.samples) < 24, -5.0, 5.0)
+        result = self._balance(snow=snow, air_temperature=air_temperature).integrate(apply=False)
+        self.assertAlmostEqual(result['snow_accumulation'][np.searchsorted(result['times'], 24 * 3600)], 120)
+        self.assertLess(result['snow_accumulation'][-1], 120)
+        # The melted snow fills the tank, the water itself keeps its state
+        self.assertEqual(self.water.current_volume, 3000)
+        self.assertEqual(self.water.snow_accumulation, 0)
+
+    def test_sample_volume_interpolates_steps(self):
+        result = self._balance().integrate(apply=False)
+        rate = self._evaporation(self.air_temperature)[0] / 3600
+        times = np.linspace(0, self.samples * 3600, 97)
+        np.testing.assert_allclose(WaterBalance.sample_volume(result, times), 3000 - rate * times, rtol=1e-9)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            self._balance(rain=np.zeros(3))
+        with self.assertRaises(ValueError):
+            self._balance(rain=-np.ones(self.samples))
+        with self.assertRaises(ValueError):
+            self._balance(rtol=0)
+        with self.assertRaises(ValueError):
+            WaterBalance(self.water, 6, 0, [], [], [], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import numpy as np
+from src.simulation.water.water import Water
+from src.simulation.water.water_batch import WaterBatch
+
+
+class TestWaterBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.waters = []
+        for capacity, volume, temperature in zip([200, 500, 1000, 6000], [100, 400, 250, 3000], [5, 18, 25, 31.5]):
+            water = Water(0, capacity)
+            water.add_water(volume)
+            water.temperature = temperature
+            self.waters.append(water)
+        self.batch = WaterBatch.from_waters(self.waters)
+
+    def assertMatchesWaters(self, flags: bool = True):
+        np.testing.assert_allclose(self.batch.current_volume, [water.current_volume for water in self.waters],
+                                   rtol=1e-12)
+        np.testing.assert_allclose(self.batch.snow_accumulation,
+                                   [water.snow_accumulation for water in self.waters], rtol=1e-12)
+        np.testing.assert_allclose(self.batch.overflow_volume, [water.overflow_volume for water in self.waters],
+                                   rtol=1e-12)
+        if flags:
+            np.testing.assert_array_equal(self.batch.is_empty, [water.is_empty for water in self.waters])
+            np.testing.assert_array_equal(self.batch.is_full, [water.is_full for water in self.waters])
+
+    def test_from_waters(self):
+        self.assertEqual(len(self.batch), 4)
+        np.testing.assert_array_equal(self.batch.tank_capacity, [200, 500, 1000, 6000])
+        np.testing.assert_array_equal(self.batch.temperature, [5, 18, 25, 31.5])
+        self.assertMatchesWaters()
+
+    def test_evaporate_matches_water(self):
+        for _ in range(50):
+            air_temps = self.rng.uniform(-10, 50, 4)
+            surface_areas = [0, 1.5, 6, 20]
+            rel_humidities = self.rng.uniform(0, 1, 4)
+            evaporated = self.batch.evaporate(air_temps, surface_areas, rel_humidities, 3600)
+            expected = [water.evaporate(float(air_temp), surface_area, float(rel_humidity), 3600)
+                        for water, air_temp, surface_area, rel_humidity
+                        in zip(self.waters, air_temps, surface_areas, rel_humidities)]
+            np.testing.assert_allclose(evaporated, expected, rtol=1e-12)
+        self.assertMatchesWaters()
+
+    def test_manage_precipitation_matches_water(self):
+        for precipitation_type, pattern in [('snow', 'steady'), ('rain', 'intermittent'), ('rain', 'steady'),
+                                            ('snow', 'intermittent')]:
+            for _ in range(20):
+                amounts = self.rng.uniform(0, 3, 4)
+                air_temperatures = self.rng.uniform(-5, 15, 4)
+                self.batch.manage_precipitation(precipitation_type, amounts, air_temperatures, pattern)
+                for water, amount, air_temperature in zip(self.waters, amounts, air_temperatures):
+                    water.manage_precipitation(precipitation_type, float(amount), float(air_temperature), pattern)
+                self.assertMatchesWaters()
+
+    def test_manage_precipitation_caps_overflow_like_water(self):
+        self.batch.manage_precipitation('snow', 50, -1)
+        self.batch.manage_precipitation('rain', 150, 10)
+        for water in self.waters:
+            water.manage_precipitation('snow', 50, -1)
+            try:
+                water.manage_precipitation('rain', 150, 10)
+            except ValueError:
+                pass
+        self.assertEqual(self.batch.current_volume[0], 200)
+        self.assertEqual(self.batch.overflow_volume[0], 50)
+        # `Water` raises before refreshing `is_full` on overflow, the batch derives it from the capped volume
+        self.assertMatchesWaters(flags=False)
+        np.testing.assert_array_equal(self.batch.is_full, [True, True, False, False])
+
+    def test_melt_snow_matches_water(self):
+        self.batch.manage_precipitation('snow', [150, 20, 400, 30], -2)
+        for water, amount in zip(self.waters, [150, 20, 400, 30]):
+            water.manage_precipitation('snow', amount, -2)
+        melted = self.batch.melt_snow([5, -1, 8, 15], 2000)
+        expected = []
+        for water, air_temperature in zip(self.waters, [5, -1, 8, 15]):
+            try:
+                expected.append(water.melt_snow(air_temperature, 2000))
+            except ValueError:
+                expected.append(0)
+        np.testing.assert_allclose(melted, expected, rtol=1e-12)
+        # The first tank overflows: its snow is left unchanged and `Water` raises before refreshing `is_full`
+        self.assertEqual(self.batch.snow_accumulation[0], 150)
+        self.assertMatchesWaters(flags=False)
+
+    def test_add_and_extract_water_match_water(self):
+        added = self.batch.add_water([50, 0, 700, 1000])
+        # `Water.add_water` rejects an amount of 0, the batch leaves that tank unchanged
+        for water, amount in zip(self.waters, [50, 0, 700, 1000]):
+            if amount:
+                water.add_water(amount)
+        np.testing.assert_array_equal(added, [50, 0, 700, 1000])
+        extracted = self.batch.extract_water([10, 20, 30, 40])
+        for water, amount in zip(self.waters, [10, 20, 30, 40]):
+            water.extract_water(amount)
+        np.testing.assert_array_equal(extracted, [10, 20, 30, 40])
+        self.assertMatchesWaters()
+
+    def test_rejected_operations_leave_every_tank_unchanged(self):
+        volumes = self.batch.current_volume.copy()
+        with self.assertRaises(ValueError):
+            self.batch.add_water([0, 0, 0, 3001])
+        with self.assertRaises(ValueError):
+            self.batch.extract_water([0, 0, 0, 2000], force_underflow_capacity_threshold=False)
+        with self.assertRaises(ValueError):
+            self.batch.extract_water([101, 0, 0, 0], force_underflow_capacity_threshold=True)
+        with self.assertRaises(ValueError):
+            self.batch.evaporate(60, 6, 0.5, 3600)
+        with self.assertRaises(ValueError):
+            self.batch.evaporate([20, 20, float('nan'), 20], 6, 0.5, 3600)
+        np.testing.assert_array_equal(self.batch.current_volume, volumes)
+        self.batch.extract_water([0, 0, 0, 2000], force_underflow_capacity_threshold=True)
+        self.assertEqual(self.batch.current_volume[3], 1000)
+
+    def test_overflow_accumulates_like_water(self):
+        for _ in range(2):
+            self.batch.manage_precipitation('rain', 150, 10)
+            for water in self.waters:
+                try:
+                    water.manage_precipitation('rain', 150, 10)
+                except ValueError:
+                    pass
+        self.assertEqual(self.batch.overflow_volume[0], 200)
+        self.assertMatchesWaters(flags=False)
+
+    def test_invalid_inputs(self):
+        with self.assertRaises(ValueError):
+            self.batch.add_water([1, 2])
+        with self.assertRaises(TypeError):
+            self.batch.add_water('a')
+        with self.assertRaises(ValueError):
+            self.batch.manage_precipitation('hail', 1, 1)
+        with self.assertRaises(ValueError):
+            self.batch.manage_precipitation('rain', -1, 1)
+        with self.assertRaises(ValueError):
+            self.batch.temperature = [25, 25, 25, 101]
+        with self.assertRaises(ValueError):
+            WaterBatch([100, 200], current_volumes=[50, 300])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import pickle
 import unittest
-from src.simulation.water.water_dissolved_elements_monitor import WaterDissolvedElementsMonitor
+import numpy as np
+from src.simulation.water.water_dissolved_elements_monitor import (DissolvedElementsSchema,
+                                                                    WaterDissolvedElementsMonitor)
 from src.simulation.water.water_property_range import WaterPropertyRange
 from src.simulation.water.water_tank import WaterTank
 
@@ -212,4 +215,113 @@ class TestWaterDissolvedElementsTracker(unittest.TestCase):
         for element in new_dissolved_elements:
             with self.subTest(element=element):
                 self.assertLess(new_dissolved_elements[element], dissolved_elements[element],
-                                f"Dissolved element {element} should decrease in concentration.")
\ No newline at end of file
+                                f"Dissolved element {element} should decrease in concentration.")
+
+
+    def test_monitored_water_tank_survives_pickling(self):
+        """
+        Test that a monitored water tank can be pickled (e.g. for a worker process) and that the copied
+        monitor keeps observing the copied tank.
+        """
+        copied_water_tank = pickle.loads(pickle.dumps(self.water_tank))
+        copied_monitor = copied_water_tank._observers['add_water'][0].__self__
+        self.assertIsNot(copied_monitor, self.dissolved_elements_monitor)
+        self.assertIs(copied_monitor.water_tank, copied_water_tank)
+        nitrate = self.dissolved_elements_monitor.nitrate
+        copied_water_tank.add_water(1000)
+        self.assertLess(copied_monitor.nitrate, nitrate)
+        self.assertEqual(self.dissolved_elements_monitor.nitrate, nitrate)
+
+    def test_concentrations_vector_backs_element_properties(self):
+        """
+        Test that the element properties read and write the concentration vector, which is read-only from
+        the outside.
+        """
+        elements = self.dissolved_elements_monitor._get_dissolved_element_properties()
+        self.assertEqual(list(self.water_dissolved_elements), elements)
+        np.testing.assert_array_equal(self.dissolved_elements_monitor.concentrations,
+                                      [self.water_dissolved_elements[element]['initial'] for element in elements])
+        self.dissolved_elements_monitor.nitrate = 25
+        self.assertEqual(25, self.dissolved_elements_monitor.concentrations[elements.index('nitrate')])
+        with self.assertRaises(ValueError):
+            self.dissolved_elements_monitor.concentrations[0] = 1
+
+    def test_dilution_rescales_all_concentrations(self):
+        """
+        Test that adding water rescales every concentration by the same factor.
+        """
+        concentrations = self.dissolved_elements_monitor.concentrations.copy()
+        self.water_tank.add_water(1000)
+        np.testing.assert_allclose(self.dissolved_elements_monitor.concentrations, concentrations * (2 - 5000 / 4000))
+
+    def test_out_of_range_rescaling_leaves_concentrations_unchanged(self):
+        """
+        Test that a volume change driving any concentration out of its range raises and leaves every
+        concentration unchanged.
+        """
+        self.dissolved_elements_monitor.ammonia = 0.12
+        concentrations = self.dissolved_elements_monitor.concentrations.copy()
+        with self.assertRaises(ValueError) as context:
+            self.water_tank.add_water(1000)
+        self.assertEqual(str(context.exception), "0.09 must be greater than or equal to 0.1 for ammonia.")
+        np.testing.assert_array_equal(self.dissolved_elements_monitor.concentrations, concentrations)
+
+    def test_rescaling_follows_assigned_ranges(self):
+        """
+        Test that the bounds checked when rescaling are the ones of the ranges assigned to the elements.
+        """
+        range_class = self.dissolved_elements_monitor.schema.range_class
+        self.dissolved_elements_monitor.calcium_range = range_class('calcium', 35, 150)
+        with self.assertRaises(ValueError) as context:
+            self.water_tank.add_water(1000)
+        self.assertEqual(str(context.exception), "30.0 must be greater than or equal to 35 for calcium.")
+
+    def test_monitors_share_a_compiled_schema(self):
+        """
+        Test that monitors of the same element set share one schema, which leaves the monitor class and the
+        global property ranges untouched.
+        """
+        water_tank = WaterTank(tank_length=400, tank_width=150, tank_depth=100, tank_type='fish tank')
+        water_tank.add_water(4000)
+        other_monitor = WaterDissolvedElementsMonitor(water_tank, dict(self.water_dissolved_elements))
+        self.assertIs(other_monitor.schema, self.dissolved_elements_monitor.schema)
+        self.assertIs(type(other_monitor), type(self.dissolved_elements_monitor))
+        self.assertIsInstance(other_monitor, WaterDissolvedElementsMonitor)
+        self.assertFalse(hasattr(WaterDissolvedElementsMonitor, 'nitrate'))
+        self.assertNotIn('nitrate', WaterPropertyRange.properties_ranges)
+        with self.assertRaises(AttributeError):
+            other_monitor.schema.elements = ()
+
+    def test_monitors_with_different_element_sets_coexist(self):
+        """
+        Test that monitors of different element sets or ranges get their own schemas and properties.
+        """
+        water_tank = WaterTank(tank_length=400, tank_width=150, tank_depth=100, tank_type='fish tank')
+        water_tank.add_water(4000)
+        nitrate_monitor = WaterDissolvedElementsMonitor(water_tank, {'nitrate': {'min': 0, 'max': 80,
+                                                                                 'initial': 60}})
+        self.assertEqual(('nitrate',), nitrate_monitor.schema.elements)
+        self.assertEqual(60, nitrate_monitor.nitrate)
+        self.assertFalse(hasattr(nitrate_monitor, 'ammonia'))
+        with self.assertRaises(ValueError):
+            self.dissolved_elements_monitor.nitrate = 60
+        self.assertIs(nitrate_monitor.schema,
+                      DissolvedElementsSchema.compile({'nitrate': {'min': 0, 'max': 80, 'initial': 1}}))
+
+    def test_invalid_element_names(self):
+        """
+        Test that element names which are not identifiers or clash with the monitor attributes are rejected.
+        """
+        for element in ['not an identifier', '_concentrations', 'water_tank', 'concentrations', 'schema']:
+            with self.subTest(element=element):
+                with self.assertRaises(ValueError):
+                    DissolvedElementsSchema.compile({element: {'min': 0, 'max': 1, 'initial': 0.5}})
+
+    def test_ranges_survive_pickling(self):
+        """
+        Test that the schema ranges of a monitor are pickled with it.
+        """
+        copied_monitor = pickle.loads(pickle.dumps(self.dissolved_elements_monitor))
+        self.assertIs(copied_monitor.schema, self.dissolved_elements_monitor.schema)
+        self.assertEqual(repr(copied_monitor.nitrate_range), repr(self.dissolved_elements_monitor.nitrate_range))
+        self.assertIsInstance(copied_monitor.nitrate_range, copied_monitor.schema.range_class)
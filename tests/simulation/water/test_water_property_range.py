@@ -88,3 +88,12 @@ class TestWaterPropertyRange(unittest.TestCase):
         """
         with self.assertRaises(TypeError):
             WaterPropertyRange(None, 10, 100)
+
+    def test_property_range_has_no_instance_dict(self):
+        """
+        Test that WaterPropertyRange stores its state in slots, without a per-instance dictionary.
+        """
+        property_range = WaterPropertyRange('ph', 6.5, 8.5)
+        self.assertFalse(hasattr(property_range, '__dict__'))
+        with self.assertRaises(AttributeError):
+            property_range.unknown = 1
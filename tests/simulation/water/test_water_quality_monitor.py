@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from src.simulation.water.water_quality_monitor import WaterQualityMonitor
 from src.simulation.water.water_property_range import WaterPropertyRange
 
@@ -30,6 +31,16 @@ class TestWaterQualityMonitor(unittest.TestCase):
             Tests the output status of the monitor when data is within range.
         test_water_quality_monitor_output_status_out_of_range():
             Tests the output status of the monitor when data is out of range.
+        test_water_quality_monitor_analyze_series():
+            Tests the analysis of time series of data.
+        test_water_quality_monitor_analyze_series_matches_analyze_data():
+            Tests that the analysis of time series of data agrees with the analysis of every reading.
+        test_water_quality_monitor_analyze_series_invalid_data():
+            Tests the analysis of time series of invalid data.
+        test_water_quality_monitor_alerts_coalesce_excursions():
+            Tests that the alerts of consecutive out-of-range readings are coalesced into one record.
+        test_water_quality_monitor_alerts_are_bounded():
+            Tests that the alert buffer drops its oldest records once full.
         """
     def test_water_quality_monitor_init(self):
         """
@@ -274,3 +285,136 @@ class TestWaterQualityMonitor(unittest.TestCase):
         self.assertTrue(monitor.output_status() != {}, 'Output status should return a not empty dictionary')
         self.assertFalse(all(['OK' in item for item in monitor.output_status().values()]),
                         'Output status value should not contain OK for all values')
+
+    def _monitor(self) -> WaterQualityMonitor:
+        return WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5), WaterPropertyRange("turbidity", 0, 10),
+                                   WaterPropertyRange("temperature", 10, 30), WaterPropertyRange("tds", 50, 200))
+
+    def test_water_quality_monitor_analyze_series(self):
+        """
+        Test that the series analysis reports the violation masks and intervals, with the extreme value of
+        every interval, without touching the status or the alerts.
+        """
+        monitor = self._monitor()
+        series = {'ph': [7, 9, 9.5, 7, 6, 7, 8, 8.6],
+                  'temperature': [5, 20, 20, 20, 20, 31, 35, 32],
+                  'tds': [100] * 8}
+        masks, intervals = monitor.analyze_series(series)
+        np.testing.assert_array_equal(masks['ph'], [False, True, True, False, True, False, False, True])
+        np.testing.assert_array_equal(masks['temperature'], [True, False, False, False, False, True, True, True])
+        self.assertFalse(masks['tds'].any())
+        self.assertEqual([('temperature', 0, 0, 5.0), ('ph', 1, 2, 9.5), ('ph', 4, 4, 6.0),
+                          ('temperature', 5, 7, 35.0), ('ph', 7, 7, 8.6)], intervals)
+        self.assertEqual([], monitor.alerts)
+        self.assertEqual({}, monitor.output_status())
+
+    def test_water_quality_monitor_analyze_series_matches_analyze_data(self):
+        """
+        Test that the series analysis flags the readings `analyze_data` finds out of range, and reports times.
+        """
+        rng = np.random.default_rng(0)
+        series = {'ph': rng.uniform(6, 9, 200), 'turbidity': rng.uniform(-1, 12, 200),
+                  'temperature': rng.uniform(5, 35, 200), 'tds': rng.uniform(40, 210, 200)}
+        monitor = self._monitor()
+        masks, intervals = monitor.analyze_series(series, times=np.arange(200) * 3600)
+        for index in range(200):
+            reading = {water_property: float(values[index]) for water_property, values in series.items()}
+            monitor.analyze_data(reading)
+            for water_property in series:
+                self.assertEqual(monitor.status[water_property] != "OK", masks[water_property][index])
+        # Every violation interval is one alert record coalescing its readings
+        self.assertEqual(len(intervals), len(monitor.alerts))
+        self.assertEqual(sum(mask.sum() for mask in masks.values()),
+                         sum(record.count for record in monitor.alert_records))
+        for water_property, start, end, extreme in intervals:
+            self.assertTrue(masks[water_property][start // 3600:end // 3600 + 1].all())
+            self.assertIn(extreme, series[water_property][start // 3600:end // 3600 + 1])
+
+    def test_water_quality_monitor_analyze_series_invalid_data(self):
+        """
+        Test that the series analysis rejects unknown properties, non-numeric and misaligned readings.
+        """
+        monitor = self._monitor()
+        with self.assertRaises(AttributeError):
+            monitor.analyze_series({'salinity': [1, 2]})
+        with self.assertRaises(TypeError):
+            monitor.analyze_series({'ph': ['neutral', 7]})
+        with self.assertRaises(ValueError):
+            monitor.analyze_series({'ph': [7, 7], 'tds': [100]})
+        with self.assertRaises(ValueError):
+            monitor.analyze_series({'ph': [7, 7]}, times=[0])
+
+    def test_water_quality_monitor_alerts_coalesce_excursions(self):
+        """
+        Test that the alerts of a property out of range over consecutive readings are coalesced into one record
+        with their count, first and last values and timestamps, until a reading in range closes the record.
+        """
+        monitor = self._monitor()
+        for hour, temperature in enumerate([20, 31, 35, 33, 20, 40]):
+            monitor.analyze_data({'ph': 9 if hour < 4 else 7, 'temperature': temperature}, time=hour * 3600)
+        self.assertEqual(["Alert! ph: 9 out of range", "Alert! temperature: 31 out of range",
+                          "Alert! temperature: 40 out of range"], monitor.alerts)
+        ph_record, temperature_record, last_record = monitor.alert_records
+        self.assertEqual((4, 0, 3 * 3600), (ph_record.count, ph_record.first_time, ph_record.last_time))
+        self.assertEqual((3, 31, 33), (temperature_record.count, temperature_record.first_value,
+                                       temperature_record.last_value))
+        self.assertEqual((3600, 3 * 3600), (temperature_record.first_time, temperature_record.last_time))
+        self.assertEqual(1, last_record.count)
+        monitor.alerts = "Alert! manual check"
+        monitor.alerts = "Alert! manual check"
+        self.assertEqual(2, monitor.alert_records[-1].count)
+        monitor.clean_alerts()
+        monitor.analyze_data({'temperature': 40})
+        self.assertEqual(1, monitor.alert_records[0].count)
+
+    def test_water_quality_monitor_plain_alerts_stay_apart(self):
+        """
+        Test that a plain alert message never coalesces into the open record of a water property, even when the
+        message is the property name or the property alert message.
+        """
+        monitor = WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5), WaterPropertyRange("turbidity", 0, 10),
+                                      WaterPropertyRange("temperature", 10, 30), WaterPropertyRange("tds", 50, 200))
+        monitor.analyze_data({'ph': 9})
+        monitor.alerts = "ph"
+        monitor.alerts = "Alert! ph: 9 out of range"
+        monitor.analyze_data({'ph': 9})
+        self.assertEqual(["Alert! ph: 9 out of range", "ph", "Alert! ph: 9 out of range"], monitor.alerts)
+        self.assertEqual([2, 1, 1], [record.count for record in monitor.alert_records])
+        self.assertEqual(['ph', None, None], [record.parameter for record in monitor.alert_records])
+
+    def test_water_quality_monitor_alerts_view_is_read_only(self):
+        """
+        Test that the alerts are a read-only view following the alert records, instead of a copy whose
+        modifications would be silently lost.
+        """
+        monitor = WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5), WaterPropertyRange("turbidity", 0, 10),
+                                      WaterPropertyRange("temperature", 10, 30), WaterPropertyRange("tds", 50, 200))
+        alerts = monitor.alerts
+        monitor.analyze_data({'ph': 9})
+        self.assertEqual(("Alert! ph: 9 out of range",), alerts)
+        self.assertEqual("Alert! ph: 9 out of range", alerts[-1])
+        for modification in (lambda: alerts.clear(), lambda: alerts.append("Alert!")):
+            with self.assertRaises(AttributeError):
+                modification()
+        monitor.clean_alerts()
+        self.assertEqual([], alerts)
+
+    def test_water_quality_monitor_alerts_are_bounded(self):
+        """
+        Test that the alert buffer keeps at most its capacity of records, dropping the oldest ones.
+        """
+        monitor = WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5), WaterPropertyRange("turbidity", 0, 10),
+                                      WaterPropertyRange("temperature", 10, 30), WaterPropertyRange("tds", 50, 200),
+                                      alert_capacity=3)
+        for reading in range(1000):
+            monitor.analyze_data({'ph': 9 if reading % 2 else 7})
+        self.assertEqual(3, len(monitor.alerts))
+        self.assertEqual([995, 997, 999], [record.first_time for record in monitor.alert_records])
+        for _ in range(1000):
+            monitor.analyze_data({'ph': 9})
+        # The excursion of the last reading goes on
+        self.assertEqual(1001, monitor.alert_records[-1].count)
+        with self.assertRaises(ValueError):
+            WaterQualityMonitor(WaterPropertyRange("ph", 6.5, 8.5), WaterPropertyRange("turbidity", 0, 10),
+                                WaterPropertyRange("temperature", 10, 30), WaterPropertyRange("tds", 50, 200),
+                                alert_capacity=0)
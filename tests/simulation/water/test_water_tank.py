@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from random import randint
 from src.simulation.water.water_tank import WaterTank
 
@@ -38,6 +39,29 @@ class TestWaterFishTank(unittest.TestCase):
         self.assertEqual(self.tank_length, status.get('tank_length'), f'Length should be {self.tank_length}')
         self.assertEqual('fish tank', status.get('tank_type'), f'Tank type should be fish tank')
 
+    def test_fish_status_follows_water_status(self):
+        """
+        Test that the cached tank status is rebuilt whenever the water status changes, without reading the
+        water status first.
+        """
+        status = self.fish_tank.status
+        self.assertIs(status, self.fish_tank.status, 'Status should not be rebuilt without a state change')
+        self.fish_tank.add_water(1000)
+        self.assertEqual(1000, self.fish_tank.status.get('current_volume'), 'Current volume should be 1000')
+        self.assertEqual(self.tank_depth, self.fish_tank.status.get('tank_depth'), f'Depth should be {self.tank_depth}')
+
+    def test_fish_status_follows_tank_fields(self):
+        """
+        Test that the cached tank status is rebuilt whenever a tank field it snapshots changes.
+        """
+        for name, value in [('tank_length', 500), ('tank_width', 200), ('tank_depth', 80), ('tank_type', 'pond'),
+                            ('water_surface_area', 5)]:
+            with self.subTest(name=name):
+                status = self.fish_tank.status
+                setattr(self.fish_tank, name, value)
+                self.assertIsNot(status, self.fish_tank.status, f'Status should be rebuilt after {name} changed')
+                self.assertEqual(value, self.fish_tank.status[name])
+
     def test_evaporation_manager_total_water_evaporated(self):
         """
         Test the total water evaporation calculation over multiple evaporation sessions.
@@ -77,4 +101,61 @@ class TestWaterFishTank(unittest.TestCase):
                 self.fish_tank.evaporate(air_temp, surface_area, rel_humidity, time_elapsed_sec)
                 evaporation_rate = self.fish_tank.evaporation_rates.get(air_temp)
                 self.assertAlmostEqual(expected_evaporation_rate, evaporation_rate, 10,
-                                       f"Evaporation rate should be {expected_evaporation_rate} but is {evaporation_rate}")
\ No newline at end of file
+                                       f"Evaporation rate should be {expected_evaporation_rate} but is {evaporation_rate}")
+
+    def test_evaporate_many_tracks_evaporation(self):
+        """
+        Test that the batch evaporation records the same totals and rates as consecutive `evaporate` calls.
+        """
+        tank, other_tank = (WaterTank(self.tank_length, self.tank_width, self.tank_depth, 'fish_tank')
+                            for _ in range(2))
+        air_temps = [10, 30, 10, 20]
+        rel_humidities = [0.5, 0.6, 0.7, 0.8]
+        for water_tank in (tank, other_tank):
+            water_tank.add_water(1000)
+        surface_area = tank.water_surface_area
+        for air_temp, rel_humidity in zip(air_temps, rel_humidities):
+            tank.evaporate(air_temp, surface_area, rel_humidity, 3600)
+
+        other_tank.evaporate_many(air_temps, surface_area, rel_humidities, 3600)
+
+        self.assertGreater(tank.total_water_evaporated, 0)
+        self.assertAlmostEqual(tank.total_water_evaporated, other_tank.total_water_evaporated, 12)
+        self.assertEqual(tank.evaporation_rates.keys(), other_tank.evaporation_rates.keys())
+        for air_temp, evaporation_rate in tank.evaporation_rates.items():
+            self.assertAlmostEqual(evaporation_rate, other_tank.evaporation_rates[air_temp], 12)
+
+    def test_evaporate_many_scalar_air_temperature(self):
+        """
+        Test that a scalar air temperature applies to every step of a batch of relative humidities.
+        """
+        tank, other_tank = (WaterTank(self.tank_length, self.tank_width, self.tank_depth, 'fish_tank')
+                            for _ in range(2))
+        rel_humidities = [0.5, 0.6, 0.7]
+        for water_tank in (tank, other_tank):
+            water_tank.add_water(100)
+        surface_area = tank.water_surface_area
+        for rel_humidity in rel_humidities:
+            tank.evaporate(20, surface_area, rel_humidity, 60)
+
+        water_evaporated = other_tank.evaporate_many(20, surface_area, rel_humidities, 60)
+
+        self.assertEqual((3,), water_evaporated.shape)
+        self.assertAlmostEqual(tank.current_volume, other_tank.current_volume, 12)
+        self.assertAlmostEqual(tank.total_water_evaporated, other_tank.total_water_evaporated, 12)
+        self.assertEqual(tank.evaporation_rates.statistics()['count'].sum(),
+                         other_tank.evaporation_rates.statistics()['count'].sum())
+
+    def test_evaporation_rates_memory_is_bounded(self):
+        """
+        Test that noisy air temperatures are binned instead of growing the evaporation rates without bound.
+        """
+        tank = WaterTank(self.tank_length, self.tank_width, self.tank_depth, 'fish_tank')
+        tank.add_water(5000)
+        for air_temp in (20 + np.random.default_rng(0).uniform(-1, 1, 2000)).tolist():
+            tank.evaporate(air_temp, tank.water_surface_area, 0.5, 60)
+        statistics = tank.evaporation_rates.statistics()
+        self.assertLessEqual(len(tank.evaporation_rates), 4)
+        self.assertEqual(statistics['count'].sum(), 2000)
+        self.assertTrue(np.all(statistics['min'] <= statistics['mean']))
+        self.assertTrue(np.all(statistics['mean'] <= statistics['max']))